@@ -13,6 +13,8 @@ from src.models import (
     items,
     lockers,
     stock,
+    stock_movement,  # noqa: F401
+    stock_threshold,  # noqa: F401
     locker_permission,
     pending_card,
 )
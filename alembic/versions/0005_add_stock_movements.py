@@ -0,0 +1,49 @@
+"""Add stock_movements ledger
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_movements",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("stock_id", sa.Integer(), nullable=True),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("locker_id", sa.Integer(), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+        sa.Column("quantity_after", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(255), nullable=True),
+        sa.Column("actor", sa.String(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["stock_id"], ["stock.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_stock_movements_id", "stock_movements", ["id"], unique=False)
+    op.create_index(
+        "ix_stock_movements_stock_id", "stock_movements", ["stock_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stock_movements_stock_id", table_name="stock_movements")
+    op.drop_index("ix_stock_movements_id", table_name="stock_movements")
+    op.drop_table("stock_movements")
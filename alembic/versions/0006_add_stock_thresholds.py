@@ -0,0 +1,106 @@
+"""Add stock_thresholds and the stock_alerts materialized set
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels = None
+depends_on = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now()
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()
+        ),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_thresholds",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("locker_id", sa.Integer(), nullable=False),
+        sa.Column("min_quantity", sa.Integer(), nullable=False),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["item_id"], ["items.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["locker_id"], ["lockers.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "item_id", "locker_id", name="unique_threshold_item_locker"
+        ),
+    )
+    op.create_index("ix_stock_thresholds_id", "stock_thresholds", ["id"], unique=False)
+
+    op.create_table(
+        "stock_alerts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("locker_id", sa.Integer(), nullable=False),
+        sa.Column("stock_id", sa.Integer(), nullable=True),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("min_quantity", sa.Integer(), nullable=False),
+        sa.Column(
+            "triggered_at", sa.DateTime(timezone=True), server_default=sa.func.now()
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()
+        ),
+        sa.ForeignKeyConstraint(["item_id"], ["items.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["locker_id"], ["lockers.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("item_id", "locker_id", name="unique_alert_item_locker"),
+    )
+    op.create_index("ix_stock_alerts_id", "stock_alerts", ["id"], unique=False)
+
+    # Give the capacity to the system admin role (system roles are not
+    # editable through the API, so it would otherwise be unreachable)
+    conn = op.get_bind()
+    roles = sa.table(
+        "roles", sa.column("name", sa.String), sa.column("capacities", sa.JSON)
+    )
+    row = conn.execute(
+        sa.select(roles.c.capacities).where(roles.c.name == "admin")
+    ).first()
+    if row is not None and "manage_stock_thresholds" not in row.capacities:
+        conn.execute(
+            roles.update()
+            .where(roles.c.name == "admin")
+            .values(capacities=[*row.capacities, "manage_stock_thresholds"])
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    roles = sa.table(
+        "roles", sa.column("name", sa.String), sa.column("capacities", sa.JSON)
+    )
+    row = conn.execute(
+        sa.select(roles.c.capacities).where(roles.c.name == "admin")
+    ).first()
+    if row is not None:
+        conn.execute(
+            roles.update()
+            .where(roles.c.name == "admin")
+            .values(
+                capacities=[c for c in row.capacities if c != "manage_stock_thresholds"]
+            )
+        )
+
+    op.drop_index("ix_stock_alerts_id", table_name="stock_alerts")
+    op.drop_table("stock_alerts")
+    op.drop_index("ix_stock_thresholds_id", table_name="stock_thresholds")
+    op.drop_table("stock_thresholds")
@@ -0,0 +1,58 @@
+"""Add items.search_document with trigram and full-text indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels = None
+depends_on = None
+
+SEARCH_DOCUMENT = (
+    "coalesce(name, '') || ' ' || coalesce(reference, '')"
+    " || ' ' || coalesce(description, '')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "items",
+        sa.Column(
+            "search_document", sa.Text(), sa.Computed(SEARCH_DOCUMENT, persisted=True)
+        ),
+    )
+    op.create_index("ix_items_category_id", "items", ["category_id"], unique=False)
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_items_search_trgm ON items"
+        " USING gin (search_document gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_items_search_tsv ON items"
+        " USING gin (to_tsvector('simple', search_document))"
+    )
+    op.execute(
+        "CREATE INDEX ix_categories_name_trgm ON categories"
+        " USING gin (name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_categories_name_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_items_search_tsv")
+        op.execute("DROP INDEX IF EXISTS ix_items_search_trgm")
+    op.drop_index("ix_items_category_id", table_name="items")
+    op.drop_column("items", "search_document")
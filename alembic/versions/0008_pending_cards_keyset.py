@@ -0,0 +1,39 @@
+"""Add pending_cards.assigned_at and the (status, scanned_at) keyset index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pending_cards",
+        sa.Column("assigned_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Cards assigned before this migration enter the retention window now
+    op.execute(
+        "UPDATE pending_cards SET assigned_at = CURRENT_TIMESTAMP"
+        " WHERE status = 'assigned'"
+    )
+    op.create_index(
+        "ix_pending_cards_status_scanned_at",
+        "pending_cards",
+        ["status", "scanned_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pending_cards_status_scanned_at", table_name="pending_cards")
+    op.drop_column("pending_cards", "assigned_at")
@@ -3,7 +3,8 @@
 HOST="0.0.0.0"
 PORT="8000"
 TIMEOUT=5
-URL="http://${HOST}:${PORT}/health"
+# Ready only once the startup warm-up is done, so traffic is not routed before
+URL="http://${HOST}:${PORT}/health/ready"
 
 echo "Performing health check on ${URL}..."
 
@@ -0,0 +1,263 @@
+"""
+Locker check benchmark — latency and throughput of POST /auth/locker/{id}/check.
+
+Runs the real application in-process against a fake Keycloak
+(scripts/fake_keycloak.py) and a seeded database, and drives the badge route
+through the full middleware stack with `--concurrency` concurrent clients.
+The locker token is a real RS256 JWT, so validate_jwt() and the Keycloak
+admin calls are all exercised. Without --database-url, a throwaway SQLite
+file is created and seeded; a PostgreSQL URL is used as is (schema from
+Alembic, rows from scripts/seed.py).
+
+    python scripts/bench_locker_check.py [--requests 2000] [--concurrency 16]
+        [--latency-ms 5] [--output bench_locker_check.json]
+
+Results (p50/p95/p99, throughput, outcomes, Keycloak calls) are printed and
+written as JSON, tagged with the current commit, to compare across commits.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+ROLES = ["membre", "3d", "electronique", "textile", "materialiste"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=50, help="unmeasured requests")
+    parser.add_argument(
+        "--latency-ms", type=float, default=5.0, help="per Keycloak call"
+    )
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--lockers", type=int, default=20)
+    parser.add_argument(
+        "--unknown-ratio", type=float, default=0.1, help="share of unregistered cards"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="seeded database (default: SQLite file)")
+    parser.add_argument("--output", default="bench_locker_check.json")
+    return parser.parse_args()
+
+
+def configure_environment(database_url: str) -> None:
+    # Must precede the src imports: settings are read once
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("KEYCLOAK_URL", "http://keycloak.bench")
+    os.environ.setdefault("KEYCLOAK_REALM", "smartlock")
+    os.environ["PG_NOTIFY_ENABLED"] = "false"
+    os.environ["PENDING_CARD_RETENTION_DAYS"] = "0"
+    os.environ["HEALTH_PROBE_INTERVAL_SECONDS"] = "0"
+
+
+def seed_sqlite(engine, lockers: int, rng: random.Random) -> list[int]:
+    from sqlalchemy.orm import Session
+
+    from src.database.base import Base
+    from src.models.locker_permission import Locker_Permission
+    from src.models.lockers import Lockers
+
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        rows = [Lockers(locker_type=f"bench-{i}") for i in range(lockers)]
+        db.add_all(rows)
+        db.flush()
+        for locker in rows:
+            for role in rng.sample(ROLES, 2):
+                level = rng.choice(["can_view", "can_open", "can_edit"])
+                db.add(
+                    Locker_Permission(
+                        locker_id=locker.id, role_name=role, permission_level=level
+                    )
+                )
+        db.commit()
+        return [locker.id for locker in rows]
+
+
+def existing_lockers(engine) -> list[int]:
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        return [row[0] for row in conn.execute(text("SELECT id FROM lockers"))]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def drive(app, token: str, plan: list[tuple[int, str]], concurrency: int):
+    """Send the planned (locker_id, card) checks; return latencies and outcomes."""
+    import httpx
+
+    from scripts.fake_keycloak import RealAsyncClient
+
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+    queue = iter(plan)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with RealAsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def worker():
+            for locker_id, card in queue:
+                started = time.perf_counter()
+                resp = await client.post(
+                    f"/auth/locker/{locker_id}/check",
+                    json={"card_id": card},
+                    headers=headers,
+                )
+                latencies.append((time.perf_counter() - started) * 1000)
+                if resp.status_code != 200:
+                    outcomes[f"http_{resp.status_code}"] += 1
+                else:
+                    body = resp.json()
+                    outcomes["allowed" if body["allowed"] else body["reason"]] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, outcomes, elapsed
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from loguru import logger
+
+    from scripts.fake_keycloak import FakeKeycloak
+    from src.core.config import settings
+    from src.core.keycloak import LOCKER_CLIENT_ID
+    from src.core.warmup import warmup_state
+    from src.database.session import get_engine
+    from src.main import create_app
+    from src.utils.card_hash import hash_card_id
+
+    # One log line per request (unknown cards warn) would skew the measurement
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    rng = random.Random(args.seed)
+    app = create_app()
+    engine = get_engine()
+    if args.database_url:
+        locker_ids = existing_lockers(engine)
+    else:
+        locker_ids = seed_sqlite(engine, args.lockers, rng)
+    if not locker_ids:
+        sys.exit("The database has no locker to check")
+
+    keycloak = FakeKeycloak(realm=settings.KEYCLOAK_REALM, latency_ms=args.latency_ms)
+    cards = [f"BENCH{i:06d}" for i in range(args.users)]
+    for i, card in enumerate(cards):
+        roles = rng.sample(ROLES, rng.randint(1, 3))
+        keycloak.add_user(f"user-{i}", f"user{i}", hash_card_id(card), roles)
+    token = keycloak.issue_token(LOCKER_CLIENT_ID)
+
+    def plan(count: int) -> list[tuple[int, str]]:
+        return [
+            (
+                rng.choice(locker_ids),
+                f"UNKNOWN{rng.randrange(10**6):06d}"
+                if rng.random() < args.unknown_ratio
+                else rng.choice(cards),
+            )
+            for _ in range(count)
+        ]
+
+    with keycloak.patch():
+        async with app.router.lifespan_context(app):
+            while not warmup_state.ready:
+                await asyncio.sleep(0.05)
+            await drive(app, token, plan(args.warmup), args.concurrency)
+            keycloak.calls.clear()
+            latencies, outcomes, elapsed = await drive(
+                app, token, plan(args.requests), args.concurrency
+            )
+
+    latencies.sort()
+    return {
+        "benchmark": "locker_check",
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "keycloak_latency_ms": args.latency_ms,
+            "users": args.users,
+            "lockers": len(locker_ids),
+            "unknown_ratio": args.unknown_ratio,
+            "seed": args.seed,
+            "database": engine.dialect.name,
+        },
+        "results": {
+            "throughput_rps": round(len(latencies) / elapsed, 1),
+            "latency_ms": {
+                "p50": round(percentile(latencies, 50), 2),
+                "p95": round(percentile(latencies, 95), 2),
+                "p99": round(percentile(latencies, 99), 2),
+                "mean": round(statistics.fmean(latencies), 2),
+                "max": round(latencies[-1], 2),
+            },
+            "outcomes": dict(outcomes),
+            "keycloak_calls": dict(keycloak.calls),
+        },
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or (
+            f"sqlite:///{Path(tmp) / 'bench.db'}?check_same_thread=false"
+        )
+        configure_environment(database_url)
+        report = asyncio.run(run(args))
+
+    results = report["results"]
+    latency = results["latency_ms"]
+    print(
+        f"{args.requests} checks, concurrency {args.concurrency}, "
+        f"Keycloak latency {args.latency_ms} ms ({report['config']['database']})"
+    )
+    print(f"  throughput {results['throughput_rps']:8.1f} req/s")
+    print(
+        f"  latency    p50 {latency['p50']:.2f} ms   p95 {latency['p95']:.2f} ms"
+        f"   p99 {latency['p99']:.2f} ms   max {latency['max']:.2f} ms"
+    )
+    print(f"  outcomes   {results['outcomes']}")
+    print(f"  keycloak   {results['keycloak_calls']}")
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Serialization benchmark — default FastAPI response path vs fast_json_response().
+
+Serves 10 000 in-memory rows through pairs of routes of a throwaway app: the
+default path and one opting in to src/utils/fast_json.py. Two cases are
+measured, ORM-like item rows with `response_model` (/items/, /stock/, /logs/)
+and raw Keycloak user dicts without it (/users). No database or Keycloak is
+needed:
+
+    python scripts/bench_serialization.py [--rows 10000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from src.schemas.items import ItemResponse
+from src.utils.fast_json import fast_json_response
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    now = datetime.now(timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            name=f"Article {i}",
+            reference=f"REF-{i:06d}",
+            description="Lorem ipsum dolor sit amet, consectetur adipiscing elit",
+            category_id=i % 50 + 1,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def make_users(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"00000000-0000-0000-0000-{i:012d}",
+            "username": f"user{i}",
+            "firstName": "Prénom",
+            "lastName": f"Nom {i}",
+            "email": f"user{i}@example.org",
+            "emailVerified": True,
+            "enabled": i % 10 != 0,
+            "createdTimestamp": 1_700_000_000_000 + i,
+            "attributes": {"card_id": [f"{i:08x}"]},
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def build_app(rows: list[SimpleNamespace], users: list[dict]) -> FastAPI:
+    app = FastAPI()
+    adapter = TypeAdapter(list[ItemResponse])
+
+    @app.get("/items/default", response_model=list[ItemResponse])
+    def items_default():
+        return rows
+
+    @app.get("/items/fast", response_model=list[ItemResponse])
+    def items_fast():
+        return fast_json_response(rows, adapter)
+
+    @app.get("/users/default")
+    def users_default():
+        return users
+
+    @app.get("/users/fast")
+    def users_fast():
+        return fast_json_response(users)
+
+    return app
+
+
+def measure(client: TestClient, path: str, repeat: int) -> list[float]:
+    client.get(path)  # warm-up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resp = client.get(path)
+        timings.append((time.perf_counter() - start) * 1000)
+        resp.raise_for_status()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    client = TestClient(build_app(make_rows(args.rows), make_users(args.rows)))
+
+    print(f"{args.rows} rows, {args.repeat} requests per path")
+    for case in ("items", "users"):
+        default, fast = f"/{case}/default", f"/{case}/fast"
+        assert client.get(default).json() == client.get(fast).json()
+        medians = {}
+        for path in (default, fast):
+            timings = measure(client, path, args.repeat)
+            medians[path] = statistics.median(timings)
+            print(
+                f"  {path:<15} median {medians[path]:8.1f} ms"
+                f"   min {min(timings):8.1f} ms   max {max(timings):8.1f} ms"
+            )
+        print(f"  {case} speed-up x{medians[default] / medians[fast]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
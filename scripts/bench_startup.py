@@ -0,0 +1,98 @@
+"""
+Startup benchmark — import time of src.main and time to the first response.
+
+Each run starts a fresh interpreter so that nothing is already imported, then
+measures three phases: `import src.main`, create_app(), and the lifespan up
+to the first GET /health answered through a TestClient. The warm-up is
+disabled and the database is SQLite in memory, so no service is needed:
+
+    python scripts/bench_startup.py [--repeat 5] [--max-import-ms 900]
+
+With --max-import-ms or --max-startup-ms, the script exits with status 1 when
+the median exceeds the budget, so it can guard against regressions in CI.
+For a per-module breakdown, use `python -X importtime -c "import src.main"`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Runs in the child interpreter; prints the timings of one cold start as JSON
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import src.main
+t1 = time.perf_counter()
+app = src.main.create_app()
+t2 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    client.get("/health").raise_for_status()
+t3 = time.perf_counter()
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "create_app_ms": (t2 - t1) * 1000,
+    "first_response_ms": (t3 - t2) * 1000,
+    "startup_ms": (t3 - t0) * 1000,
+}))
+"""
+
+
+def cold_start() -> dict[str, float]:
+    env = {
+        **os.environ,
+        "DATABASE_URL": "sqlite:///:memory:",
+        "WARMUP_ENABLED": "false",
+        "PENDING_CARD_RETENTION_DAYS": "0",
+        "HEALTH_PROBE_INTERVAL_SECONDS": "0",
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-startup-ms", type=float)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    runs = [cold_start() for _ in range(args.repeat)]
+    medians = {key: statistics.median(r[key] for r in runs) for key in runs[0]}
+
+    if args.json:
+        print(json.dumps({"repeat": args.repeat, "median": medians}, indent=2))
+    else:
+        print(f"{args.repeat} cold starts, median")
+        for key, value in medians.items():
+            print(f"  {key:<18} {value:8.1f} ms")
+
+    failed = False
+    for key, budget in (
+        ("import_ms", args.max_import_ms),
+        ("startup_ms", args.max_startup_ms),
+    ):
+        if budget is not None and medians[key] > budget:
+            print(
+                f"{key} {medians[key]:.1f} ms exceeds {budget:.1f} ms", file=sys.stderr
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Fake Keycloak — in-process stand-in for the benchmark and load scripts.
+
+Serves, through an httpx.MockTransport, the Keycloak endpoints the badge path
+calls, plus the role assignments of the admin routes: the token endpoint,
+the realm JWKS, the user search by card_id, the composite realm role
+mappings, realm role assignment and revocation, and the realm roles.
+Tokens are signed with a throwaway RSA key published in the JWKS, so
+validate_jwt() runs for real. Every call waits `latency_ms` to stand in for the network.
+
+    keycloak = FakeKeycloak(realm="smartlock", latency_ms=5)
+    keycloak.add_user("u1", "alice", card_hash, ["membre"])
+    with keycloak.patch():
+        ...  # src.core.keycloak / keycloak_admin now talk to the fake
+"""
+
+import asyncio
+import base64
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+# Kept before patch() replaces httpx.AsyncClient, for callers driving the app
+RealAsyncClient = httpx.AsyncClient
+
+KEY_ID = "fake-keycloak"
+
+
+def _b64_uint(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+class FakeKeycloak:
+    def __init__(self, realm: str, latency_ms: float = 0.0):
+        self.realm = realm
+        self.latency_ms = latency_ms
+        self.calls: Counter[str] = Counter()
+        self._key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self._pem = self._key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        numbers = self._key.public_key().public_numbers()
+        self.jwks = {
+            "keys": [
+                {
+                    "kid": KEY_ID,
+                    "kty": "RSA",
+                    "alg": "RS256",
+                    "use": "sig",
+                    "n": _b64_uint(numbers.n),
+                    "e": _b64_uint(numbers.e),
+                }
+            ]
+        }
+        self._users_by_card: dict[str, dict] = {}
+        self._roles: dict[str, list[str]] = {}
+        self._realm_roles: set[str] = set()
+
+    def add_user(
+        self,
+        user_id: str,
+        username: str,
+        card_hash: str,
+        roles: list[str],
+        enabled: bool = True,
+    ) -> None:
+        self._users_by_card[card_hash] = {
+            "id": user_id,
+            "username": username,
+            "firstName": username.capitalize(),
+            "lastName": "Bench",
+            "enabled": enabled,
+            "attributes": {"card_id": [card_hash]},
+        }
+        self._roles[user_id] = roles
+        self._realm_roles.update(roles)
+
+    def add_role(self, name: str) -> None:
+        self._realm_roles.add(name)
+
+    def issue_token(self, azp: str, roles: list[str] = (), ttl: int = 3600) -> str:
+        now = int(time.time())
+        claims = {
+            "sub": f"service-account-{azp}",
+            "azp": azp,
+            "iat": now,
+            "exp": now + ttl,
+            "realm_access": {"roles": list(roles)},
+        }
+        return jwt.encode(claims, self._pem, algorithm="RS256", headers={"kid": KEY_ID})
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        path = request.url.path
+        realm_path = f"/realms/{self.realm}/protocol/openid-connect"
+        admin_path = f"/admin/realms/{self.realm}"
+
+        if path == f"{realm_path}/token":
+            self.calls["token"] += 1
+            token = self.issue_token("smartlock-api", ttl=300)
+            return httpx.Response(200, json={"access_token": token, "expires_in": 300})
+        if path == f"{realm_path}/certs":
+            self.calls["jwks"] += 1
+            return httpx.Response(200, json=self.jwks)
+        if path == f"{admin_path}/users":
+            self.calls["user_search"] += 1
+            query = request.url.params.get("q", "")
+            user = self._users_by_card.get(query.removeprefix("card_id:"))
+            return httpx.Response(200, json=[user] if user else [])
+        if path.startswith(f"{admin_path}/users/") and path.endswith(
+            "/role-mappings/realm/composite"
+        ):
+            self.calls["role_mappings"] += 1
+            user_id = path.split("/")[-4]
+            roles = self._roles.get(user_id)
+            if roles is None:
+                return httpx.Response(404, json={"error": "User not found"})
+            return httpx.Response(200, json=[{"name": r} for r in roles])
+        if path.startswith(f"{admin_path}/users/") and path.endswith(
+            "/role-mappings/realm"
+        ):
+            self.calls[f"role_mappings_{request.method.lower()}"] += 1
+            roles = self._roles.get(path.split("/")[-3])
+            if roles is None:
+                return httpx.Response(404, json={"error": "User not found"})
+            names = {r["name"] for r in json.loads(request.content)}
+            if request.method == "POST":
+                roles.extend(names.difference(roles))
+            else:
+                roles[:] = [r for r in roles if r not in names]
+            return httpx.Response(204)
+        if path == f"{admin_path}/roles":
+            self.calls["roles"] += 1
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": f"role-{n}", "name": n} for n in sorted(self._realm_roles)
+                ],
+            )
+        if path.startswith(f"{admin_path}/roles/"):
+            self.calls["role"] += 1
+            name = path.rsplit("/", 1)[-1]
+            if name not in self._realm_roles:
+                return httpx.Response(404, json={"error": "Could not find role"})
+            return httpx.Response(200, json={"id": f"role-{name}", "name": name})
+        self.calls["unhandled"] += 1
+        return httpx.Response(404, json={"error": f"Not served by the fake: {path}"})
+
+    @contextmanager
+    def patch(self):
+        """Route every httpx.AsyncClient created by src to this fake."""
+        transport = httpx.MockTransport(self.handle)
+        with patch.object(
+            httpx,
+            "AsyncClient",
+            lambda *args, **kwargs: RealAsyncClient(transport=transport),
+        ):
+            yield self
@@ -0,0 +1,432 @@
+"""
+Load test — mixed API workload with per-route latency SLOs.
+
+Runs the real application in-process against the fake Keycloak
+(scripts/fake_keycloak.py) and replays a weighted mix of routes described by
+a scenario file: lockers checking cards, dashboards polling /stock, /lockers
+and /logs (with If-None-Match, like the dashboard), admins assigning and
+revoking roles. Without --database-url, a throwaway SQLite file is filled by
+`scripts/seed.py generate`; a PostgreSQL URL is used as is.
+
+    python scripts/load_test.py [scripts/scenarios/mixed.json]
+        [--requests 3000] [--concurrency 32] [--output load_test.json]
+
+Each route gets its p50/p95/p99, error rate, status codes and the number of
+SQL statements it ran. The scenario's "slo" blocks (overall and per route)
+set thresholds on p50_ms, p95_ms, p99_ms, max_ms, error_rate and db_queries
+(mean per request); the exit status is 1 when one is breached, so the run
+can gate a deploy.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.bench_locker_check import (
+    ROOT,
+    configure_environment,
+    existing_lockers,
+    git_commit,
+    percentile,
+)
+
+DEFAULT_SCENARIO = ROOT / "scripts" / "scenarios" / "mixed.json"
+SLO_KEYS = ("p50_ms", "p95_ms", "p99_ms", "max_ms", "error_rate", "db_queries")
+# Roles of the roles table needed by the scenario (see alembic 0003)
+ROLES = [
+    ("admin", "Administrateur système", 5, True, True),
+    ("codir", "Comité de direction", 3, True, True),
+    ("bureau", "Bureau", 2, True, False),
+    ("membre", "Membre", 0, False, False),
+]
+ASSIGNED_ROLE = "bureau"
+
+# SQL statements run on behalf of the current request
+_queries: ContextVar[list[int] | None] = ContextVar("queries", default=None)
+
+
+@dataclass
+class Call:
+    route: str
+    method: str
+    url: str
+    token: str
+    body: dict | None = None
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    status: Counter[int] = field(default_factory=Counter)
+
+    @property
+    def errors(self) -> int:
+        return sum(n for code, n in self.status.items() if code >= 400)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("scenario", nargs="?", default=str(DEFAULT_SCENARIO))
+    parser.add_argument("--requests", type=int, help="overrides the scenario")
+    parser.add_argument("--concurrency", type=int, help="overrides the scenario")
+    parser.add_argument("--latency-ms", type=float, help="per Keycloak call")
+    parser.add_argument("--warmup", type=int, default=100, help="unmeasured requests")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--lockers", type=int, default=50)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--access-logs", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="seeded database (default: SQLite file)")
+    parser.add_argument("--output", default="load_test.json")
+    return parser.parse_args()
+
+
+def load_scenario(path: str) -> dict:
+    scenario = json.loads(Path(path).read_text())
+    unknown_routes = set(scenario["routes"]) - set(ROUTES)
+    if unknown_routes:
+        sys.exit(f"Unknown route(s) in {path}: {sorted(unknown_routes)}")
+    for slo in [scenario.get("slo", {})] + [
+        r.get("slo", {}) for r in scenario["routes"].values()
+    ]:
+        if set(slo) - set(SLO_KEYS):
+            sys.exit(
+                f"Unknown SLO key(s) in {path}: {sorted(set(slo) - set(SLO_KEYS))}"
+            )
+    return scenario
+
+
+def seed_sqlite(engine, args: argparse.Namespace) -> None:
+    from sqlalchemy.orm import Session
+
+    from scripts.seed import Volumes, generate
+    from src.database.base import Base
+    from src.models.role import Role
+
+    Base.metadata.create_all(engine)
+    volumes = Volumes(
+        lockers=args.lockers,
+        categories=20,
+        items=args.items,
+        stock=args.items * 5,
+        access_logs=args.access_logs,
+        users=args.users,
+        days=30,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate(engine, volumes, args.seed)
+    with Session(engine) as db:
+        db.add_all(
+            Role(
+                name=name,
+                label=label,
+                tier=tier,
+                is_manager=manager,
+                is_role_admin=role_admin,
+                is_system=True,
+                capacities=[],
+            )
+            for name, label, tier, manager, role_admin in ROLES
+        )
+        db.commit()
+
+
+def count_queries(engine) -> None:
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(*args):
+        counter = _queries.get()
+        if counter is not None:
+            counter[0] += 1
+
+
+# ── Routes of the mix: (context, rng) -> Call ────────────────────────────────
+
+
+def locker_check(ctx: dict, rng: random.Random) -> Call:
+    card = (
+        f"UNKNOWN{rng.randrange(10**6):06d}"
+        if rng.random() < 0.1
+        else rng.choice(ctx["cards"])
+    )
+    return Call(
+        "locker_check",
+        "POST",
+        f"/auth/locker/{rng.choice(ctx['lockers'])}/check",
+        ctx["locker_token"],
+        {"card_id": card},
+    )
+
+
+def stock_list(ctx: dict, rng: random.Random) -> Call:
+    return Call("stock_list", "GET", "/stock/?limit=100", ctx["dashboard_token"])
+
+
+def lockers_list(ctx: dict, rng: random.Random) -> Call:
+    return Call("lockers_list", "GET", "/lockers/?limit=100", ctx["dashboard_token"])
+
+
+def logs_list(ctx: dict, rng: random.Random) -> Call:
+    return Call(
+        "logs_list",
+        "GET",
+        f"/logs/?limit=50&locker_id={rng.choice(ctx['lockers'])}",
+        ctx["codir_token"],
+    )
+
+
+def role_change(ctx: dict, rng: random.Random) -> Call:
+    return Call(
+        "role_change",
+        rng.choice(["POST", "DELETE"]),
+        f"/users/{rng.choice(ctx['user_ids'])}/roles/{ASSIGNED_ROLE}",
+        ctx["admin_token"],
+    )
+
+
+ROUTES = {
+    "locker_check": locker_check,
+    "stock_list": stock_list,
+    "lockers_list": lockers_list,
+    "logs_list": logs_list,
+    "role_change": role_change,
+}
+
+
+async def drive(app, calls: list[Call], concurrency: int):
+    """Send the planned calls; return per-route stats and the elapsed time."""
+    import httpx
+
+    from scripts.fake_keycloak import RealAsyncClient
+
+    stats: dict[str, RouteStats] = defaultdict(RouteStats)
+    etags: dict[str, str] = {}
+    queue = iter(calls)
+
+    async with RealAsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://load"
+    ) as client:
+
+        async def worker():
+            for call in queue:
+                headers = {"Authorization": f"Bearer {call.token}"}
+                if call.method == "GET" and call.url in etags:
+                    headers["If-None-Match"] = etags[call.url]
+                counter = [0]
+                reset = _queries.set(counter)
+                started = time.perf_counter()
+                resp = await client.request(
+                    call.method, call.url, json=call.body, headers=headers
+                )
+                elapsed = (time.perf_counter() - started) * 1000
+                _queries.reset(reset)
+                if "etag" in resp.headers:
+                    etags[call.url] = resp.headers["etag"]
+                route = stats[call.route]
+                route.latencies.append(elapsed)
+                route.queries.append(counter[0])
+                route.status[resp.status_code] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return stats, elapsed
+
+
+def summarize(latencies: list[float], errors: int) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "error_rate": round(errors / len(latencies), 4),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "mean": round(statistics.fmean(latencies), 2),
+            "max": round(latencies[-1], 2),
+        },
+    }
+
+
+def check_slo(name: str, summary: dict, slo: dict) -> list[str]:
+    measured = {
+        "p50_ms": summary["latency_ms"]["p50"],
+        "p95_ms": summary["latency_ms"]["p95"],
+        "p99_ms": summary["latency_ms"]["p99"],
+        "max_ms": summary["latency_ms"]["max"],
+        "error_rate": summary["error_rate"],
+        "db_queries": summary.get("db_queries", {}).get("mean"),
+    }
+    return [
+        f"{name} {key} {measured[key]} > {limit}"
+        for key, limit in slo.items()
+        if measured[key] is not None and measured[key] > limit
+    ]
+
+
+async def run(args: argparse.Namespace, scenario: dict) -> dict:
+    from loguru import logger
+
+    from scripts.fake_keycloak import FakeKeycloak
+    from src.core.config import settings
+    from src.core.keycloak import LOCKER_CLIENT_ID, ROLE_ADMIN, ROLE_CODIR
+    from src.core.warmup import warmup_state
+    from src.database.session import get_engine
+    from src.main import create_app
+    from src.utils.card_hash import hash_card_id
+
+    # One log line per request would skew the measurement
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    rng = random.Random(args.seed)
+    app = create_app()
+    engine = get_engine()
+    if not args.database_url:
+        seed_sqlite(engine, args)
+    count_queries(engine)
+
+    from scripts.seed import GEN_ROLES
+
+    keycloak = FakeKeycloak(
+        realm=settings.KEYCLOAK_REALM, latency_ms=scenario["keycloak_latency_ms"]
+    )
+    keycloak.add_role(ASSIGNED_ROLE)
+    ctx = {
+        "lockers": existing_lockers(engine),
+        "cards": [f"LOAD{i:06d}" for i in range(args.users)],
+        "user_ids": [f"user-{i}" for i in range(args.users)],
+        "locker_token": keycloak.issue_token(LOCKER_CLIENT_ID),
+        "dashboard_token": keycloak.issue_token("smartlock-dashboard", ["membre"]),
+        "codir_token": keycloak.issue_token("smartlock-dashboard", [ROLE_CODIR]),
+        "admin_token": keycloak.issue_token("smartlock-dashboard", [ROLE_ADMIN]),
+    }
+    if not ctx["lockers"]:
+        sys.exit("The database has no locker to check")
+    for user_id, card in zip(ctx["user_ids"], ctx["cards"]):
+        roles = rng.sample(GEN_ROLES, rng.randint(1, 3))
+        keycloak.add_user(user_id, user_id.replace("-", ""), hash_card_id(card), roles)
+
+    names = list(scenario["routes"])
+    weights = [scenario["routes"][n]["weight"] for n in names]
+
+    def plan(count: int) -> list[Call]:
+        return [ROUTES[name](ctx, rng) for name in rng.choices(names, weights, k=count)]
+
+    with keycloak.patch():
+        async with app.router.lifespan_context(app):
+            while not warmup_state.ready:
+                await asyncio.sleep(0.05)
+            await drive(app, plan(args.warmup), scenario["concurrency"])
+            keycloak.calls.clear()
+            stats, elapsed = await drive(
+                app, plan(scenario["requests"]), scenario["concurrency"]
+            )
+
+    routes, breaches = {}, []
+    for name in names:
+        route = stats.get(name)
+        if route is None:
+            continue
+        summary = summarize(route.latencies, route.errors)
+        summary["status"] = {str(code): n for code, n in sorted(route.status.items())}
+        summary["db_queries"] = {
+            "mean": round(statistics.fmean(route.queries), 2),
+            "max": max(route.queries),
+        }
+        routes[name] = summary
+        breaches += check_slo(name, summary, scenario["routes"][name].get("slo", {}))
+    overall = summarize(
+        [ms for route in stats.values() for ms in route.latencies],
+        sum(route.errors for route in stats.values()),
+    )
+    overall["throughput_rps"] = round(overall["requests"] / elapsed, 1)
+    breaches += check_slo("overall", overall, scenario.get("slo", {}))
+
+    return {
+        "benchmark": "load_test",
+        "scenario": scenario["name"],
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "requests": scenario["requests"],
+            "concurrency": scenario["concurrency"],
+            "keycloak_latency_ms": scenario["keycloak_latency_ms"],
+            "users": args.users,
+            "lockers": len(ctx["lockers"]),
+            "seed": args.seed,
+            "database": engine.dialect.name,
+        },
+        "overall": overall,
+        "routes": routes,
+        "keycloak_calls": dict(keycloak.calls),
+        "slo": {"passed": not breaches, "breaches": breaches},
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    scenario = load_scenario(args.scenario)
+    for key, value in (
+        ("requests", args.requests),
+        ("concurrency", args.concurrency),
+        ("keycloak_latency_ms", args.latency_ms),
+    ):
+        if value is not None:
+            scenario[key] = value
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or (
+            f"sqlite:///{Path(tmp) / 'load.db'}?check_same_thread=false"
+        )
+        configure_environment(database_url)
+        report = asyncio.run(run(args, scenario))
+
+    overall = report["overall"]
+    print(
+        f"Scenario '{report['scenario']}': {overall['requests']} requests, "
+        f"concurrency {scenario['concurrency']}, "
+        f"{overall['throughput_rps']:.1f} req/s ({report['config']['database']})"
+    )
+    print(
+        f"  {'route':<14} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} "
+        f"{'errors':>7} {'queries':>8}"
+    )
+    for name, route in [*report["routes"].items(), ("overall", overall)]:
+        latency = route["latency_ms"]
+        queries = route.get("db_queries", {}).get("mean", "")
+        print(
+            f"  {name:<14} {route['requests']:>6} {latency['p50']:>8.2f} "
+            f"{latency['p95']:>8.2f} {latency['p99']:>8.2f} "
+            f"{route['error_rate']:>7.2%} {queries:>8}"
+        )
+    print(f"  keycloak   {report['keycloak_calls']}")
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+    if report["slo"]["breaches"]:
+        print("SLO breached:")
+        for breach in report["slo"]["breaches"]:
+            print(f"  - {breach}")
+        sys.exit(1)
+    print("All SLOs met.")
+
+
+if __name__ == "__main__":
+    main()
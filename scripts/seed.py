@@ -7,10 +7,33 @@ Run from the project root after `docker compose up -d`:
 The script is idempotent: it skips rows that already exist.
 By default it connects to localhost:5432 (the mapped Docker port).
 Override with: DATABASE_URL=... python scripts/seed.py
+
+Generate mode — synthetic production-scale dataset for performance testing:
+
+    python scripts/seed.py generate [--lockers 500] [--items 50000]
+        [--stock 1000000] [--access-logs 50000000] [--users 5000]
+        [--days 365] [--seed 42] [--reset]
+
+Rows are streamed in batches, with COPY on PostgreSQL and executemany
+elsewhere, instead of one SELECT + INSERT + commit per row. The same seed
+always produces the same rows. Access logs follow the opening hours and
+weekdays of the fablab, grow over the period, and favour a few busy lockers
+and active users. Generated rows are prefixed with GEN; --reset empties the
+tables first (all rows, not only generated ones).
 """
 
+import argparse
+import csv
+import hashlib
+import io
+import itertools
 import os
+import random
 import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -253,5 +276,265 @@ def seed():
         db.close()
 
 
+# ── Synthetic dataset (generate mode) ─────────────────────────────────────────
+
+GEN_PREFIX = "GEN"
+GEN_ROLES = ["membre", "3d", "electronique", "textile", "materialiste", "codir"]
+PERMISSION_LEVELS = ["can_view", "can_open", "can_edit"]
+ITEM_NOUNS = [
+    "Arduino", "Résistance", "Condensateur", "Filament", "Vis", "Écrou", "Câble",
+    "Capteur", "Moteur", "Tissu", "Fil", "Foret", "Colle", "LED", "Batterie",
+]
+ITEM_QUALIFIERS = [
+    "10k", "M3", "PLA", "USB-C", "rouge", "1kg", "12V", "inox", "coton", "5mm",
+]
+UNITS = ["units", "pcs", "m", "kg"]
+# Share of the day's scans per hour (the fablab is open 9h-22h)
+HOUR_WEIGHTS = [
+    0.1, 0, 0, 0, 0, 0, 0, 0.2, 0.5, 3, 5, 6,
+    4, 5, 7, 7, 6, 6, 7, 6, 4, 2, 1, 0.4,
+]
+# Monday to Sunday
+WEEKDAY_WEIGHTS = [1.0, 1.0, 1.0, 1.0, 0.9, 0.35, 0.15]
+DENY_REASONS = ["no_permission", "card_not_registered", "account_revoked"]
+DENY_WEIGHTS = [0.7, 0.25, 0.05]
+GENERATED_TABLES = [
+    "access_logs", "stock_movements", "stock_alerts", "stock_thresholds",
+    "stock", "locker_permissions", "items", "categories", "lockers",
+]
+
+
+@dataclass
+class Volumes:
+    lockers: int = 500
+    categories: int = 40
+    items: int = 50_000
+    stock: int = 1_000_000
+    access_logs: int = 50_000_000
+    users: int = 5_000
+    days: int = 365
+
+
+def _batches(rows, size: int):
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+def bulk_insert(engine, table: str, columns: list[str], rows, batch_size: int) -> int:
+    """Insert `rows` (tuples) in batches: COPY on PostgreSQL, executemany elsewhere."""
+    started, total = time.perf_counter(), 0
+    if engine.dialect.name == "postgresql":
+        raw = engine.raw_connection()
+        try:
+            cur = raw.cursor()
+            sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+            for batch in _batches(rows, batch_size):
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(batch)
+                buffer.seek(0)
+                cur.copy_expert(sql, buffer)
+                raw.commit()
+                total += len(batch)
+                print(f"\r  {table:<20} {total:>12,}", end="", flush=True)
+        finally:
+            raw.close()
+    else:
+        placeholders = ", ".join(f":{c}" for c in columns)
+        stmt = text(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        )
+        for batch in _batches(rows, batch_size):
+            with engine.begin() as conn:
+                conn.execute(stmt, [dict(zip(columns, row)) for row in batch])
+            total += len(batch)
+            print(f"\r  {table:<20} {total:>12,}", end="", flush=True)
+    elapsed = time.perf_counter() - started
+    print(f"\r  {table:<20} {total:>12,} rows in {elapsed:7.1f}s"
+          f" ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+    return total
+
+
+def _ids(engine, sql: str) -> list[int]:
+    with engine.connect() as conn:
+        return [row[0] for row in conn.execute(text(sql))]
+
+
+def _skewed(values: list, rng: random.Random, exponent: float = 0.8) -> list[float]:
+    """Cumulative Zipf-like weights over a shuffled copy of `values`."""
+    rng.shuffle(values)
+    weights = (1 / (rank + 1) ** exponent for rank in range(len(values)))
+    return list(itertools.accumulate(weights))
+
+
+def _day_counts(total: int, days: int, start: datetime) -> list[int]:
+    # Weekday pattern and a steady growth over the period
+    weights = [
+        WEEKDAY_WEIGHTS[(start + timedelta(days=d)).weekday()] * (0.6 + 0.4 * d / days)
+        for d in range(days)
+    ]
+    scale = total / sum(weights)
+    counts = [int(w * scale) for w in weights]
+    for d in sorted(range(days), key=lambda d: -weights[d])[: total - sum(counts)]:
+        counts[d] += 1
+    return counts
+
+
+def _access_logs(
+    volumes: Volumes, rng: random.Random, locker_ids: list[int], now: datetime
+):
+    users = [
+        (
+            str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            f"Membre {i:05d}",
+            hashlib.sha256(f"{GEN_PREFIX}CARD{i:08d}".encode()).hexdigest(),
+        )
+        for i in range(volumes.users)
+    ]
+    unknown_cards = [
+        hashlib.sha256(f"{GEN_PREFIX}UNKNOWN{i:06d}".encode()).hexdigest()
+        for i in range(1000)
+    ]
+    lockers = list(locker_ids)
+    locker_weights = _skewed(lockers, rng)
+    user_weights = _skewed(users, rng)
+    hours = range(24)
+    start = (now - timedelta(days=volumes.days)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+    for day, count in enumerate(_day_counts(volumes.access_logs, volumes.days, start)):
+        midnight = start + timedelta(days=day)
+        seconds = sorted(
+            h * 3600 + rng.randrange(3600)
+            for h in rng.choices(hours, weights=HOUR_WEIGHTS, k=count)
+        )
+        scan_lockers = rng.choices(lockers, cum_weights=locker_weights, k=count)
+        scan_users = rng.choices(users, cum_weights=user_weights, k=count)
+        for second, locker_id, (user_id, username, card) in zip(
+            seconds, scan_lockers, scan_users
+        ):
+            timestamp = midnight + timedelta(seconds=second)
+            if rng.random() < 0.8:
+                yield (locker_id, card, user_id, username, "allowed", None,
+                       True, True, timestamp)
+                continue
+            reason = rng.choices(DENY_REASONS, weights=DENY_WEIGHTS)[0]
+            if reason == "card_not_registered":
+                yield (locker_id, rng.choice(unknown_cards), None, None, "denied",
+                       reason, None, None, timestamp)
+            elif reason == "account_revoked":
+                yield (locker_id, card, user_id, username, "denied", reason,
+                       None, None, timestamp)
+            else:
+                yield (locker_id, card, user_id, username, "denied", reason,
+                       False, rng.random() < 0.5, timestamp)
+
+
+def reset_tables(engine) -> None:
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text(
+                f"TRUNCATE {', '.join(GENERATED_TABLES)} RESTART IDENTITY CASCADE"
+            ))
+        else:
+            for table in GENERATED_TABLES:
+                conn.execute(text(f"DELETE FROM {table}"))
+
+
+def generate(engine, volumes: Volumes, seed_value: int = 42, batch_size: int = 50_000,
+             now: datetime | None = None) -> None:
+    """Fill the database with a synthetic dataset of the given volumes."""
+    rng = random.Random(seed_value)
+    now = now or datetime.now(timezone.utc).replace(microsecond=0)
+    created = now - timedelta(days=volumes.days)
+
+    bulk_insert(engine, "lockers", [
+        "locker_type", "is_active", "created_at", "updated_at",
+    ], (
+        (f"{GEN_PREFIX.lower()}-{i:05d}", rng.random() < 0.95, created, created)
+        for i in range(volumes.lockers)
+    ), batch_size)
+    locker_ids = _ids(engine, "SELECT id FROM lockers WHERE locker_type LIKE "
+                              f"'{GEN_PREFIX.lower()}-%' ORDER BY id")
+
+    bulk_insert(engine, "categories", ["name", "created_at", "updated_at"], (
+        (f"{GEN_PREFIX} Catégorie {i:03d}", created, created)
+        for i in range(volumes.categories)
+    ), batch_size)
+    category_ids = _ids(engine, "SELECT id FROM categories WHERE name LIKE "
+                                f"'{GEN_PREFIX} %' ORDER BY id")
+
+    def items():
+        for i in range(volumes.items):
+            noun, qualifier = rng.choice(ITEM_NOUNS), rng.choice(ITEM_QUALIFIERS)
+            yield (f"{noun} {qualifier} #{i}", f"{GEN_PREFIX}-{i:07d}",
+                   f"{noun} {qualifier}, lot {i % 100}", rng.choice(category_ids),
+                   created, created)
+
+    bulk_insert(engine, "items", ["name", "reference", "description", "category_id",
+                                  "created_at", "updated_at"], items(), batch_size)
+    item_ids = _ids(engine, "SELECT id FROM items WHERE reference LIKE "
+                            f"'{GEN_PREFIX}-%' ORDER BY id")
+
+    def stock():
+        # Spread evenly over the items, each in distinct lockers
+        per_item, extra = divmod(volumes.stock, len(item_ids))
+        for index, item_id in enumerate(item_ids):
+            count = min(per_item + (index < extra), len(locker_ids))
+            for locker_id in rng.sample(locker_ids, count):
+                yield (item_id, locker_id, rng.randint(0, 200), rng.choice(UNITS),
+                       created, created)
+
+    bulk_insert(engine, "stock", ["item_id", "locker_id", "quantity", "unit_measure",
+                                  "created_at", "updated_at"], stock(), batch_size)
+
+    bulk_insert(engine, "locker_permissions", [
+        "locker_id", "role_name", "permission_level",
+    ], (
+        (locker_id, role, rng.choice(PERMISSION_LEVELS))
+        for locker_id in locker_ids
+        for role in rng.sample(GEN_ROLES, 3)
+    ), batch_size)
+
+    bulk_insert(engine, "access_logs", [
+        "locker_id", "card_id", "user_id", "username", "result", "reason",
+        "can_open", "can_view", "timestamp",
+    ], _access_logs(volumes, rng, locker_ids, now), batch_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the SmartLock database.")
+    commands = parser.add_subparsers(dest="command")
+    gen = commands.add_parser("generate", help="synthetic large dataset")
+    defaults = Volumes()
+    for name in Volumes.__dataclass_fields__:
+        gen.add_argument(
+            f"--{name.replace('_', '-')}", type=int, default=getattr(defaults, name)
+        )
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--batch-size", type=int, default=50_000)
+    gen.add_argument("--reset", action="store_true",
+                     help="empty the tables first (ALL rows, not only generated ones)")
+    args = parser.parse_args()
+
+    if args.command != "generate":
+        seed()
+        return
+
+    print(f"\nConnected to: {DATABASE_URL.split('@')[-1]}\n")
+    if args.reset:
+        reset_tables(engine)
+    elif _ids(engine, "SELECT 1 FROM items WHERE reference LIKE "
+                      f"'{GEN_PREFIX}-%' LIMIT 1"):
+        sys.exit("A generated dataset is already present, rerun with --reset")
+    volumes = Volumes(
+        **{name: getattr(args, name) for name in Volumes.__dataclass_fields__}
+    )
+    started = time.perf_counter()
+    generate(engine, volumes, args.seed, args.batch_size)
+    print(f"\n✅ Dataset generated in {time.perf_counter() - started:.1f}s.\n")
+
+
 if __name__ == "__main__":
-    seed()
+    main()
@@ -0,0 +1,50 @@
+"""
+Flux des cartes en attente
+==========================
+- pending_card_hub          : diffusion des nouvelles cartes aux clients SSE
+- announce_pending_cards()  : appelé par les routes de scan après le commit
+
+Sans LISTEN/NOTIFY, les cartes sont diffusées aux clients du worker qui a
+reçu le scan. Quand pg_listener tourne (PG_NOTIFY_ENABLED), elles passent par
+un NOTIFY sur PENDING_CARD_CHANNEL : chaque worker, y compris l'émetteur, les
+reçoit et les diffuse à ses propres clients.
+"""
+
+from sqlalchemy.orm import Session
+
+from src.schemas.pending_card import PendingCardResponse
+from src.utils.event_hub import EventHub
+from src.utils.logger import logger
+from src.utils.pg_notify import pg_listener, pg_notify
+
+PENDING_CARD_CHANNEL = "smartlock_pending_cards"
+
+pending_card_hub = EventHub()
+
+
+def _on_notify(payload: str) -> None:
+    pending_card_hub.publish(PendingCardResponse.model_validate_json(payload))
+
+
+pg_listener.listen(PENDING_CARD_CHANNEL, _on_notify)
+
+
+def announce_pending_cards(db: Session, rows) -> None:
+    """Diffuse les cartes tout juste enregistrées (lignes de register_scans)."""
+    cards = [PendingCardResponse.model_validate(row) for row in rows]
+    if not cards:
+        return
+    if not pg_listener.running:
+        for card in cards:
+            pending_card_hub.publish(card)
+        return
+    try:
+        # Une notification par carte : la charge utile NOTIFY est limitée à 8 ko
+        for card in cards:
+            pg_notify(db, PENDING_CARD_CHANNEL, card.model_dump_json())
+        db.commit()
+    except Exception as e:
+        # Les cartes sont enregistrées : seul le direct est perdu, les clients
+        # les retrouvent via GET /badge/pending ou Last-Event-ID
+        logger.error(f"NOTIFY des cartes en attente impossible : {e}")
+        db.rollback()
@@ -0,0 +1,49 @@
+"""
+Rétention des cartes assignées
+==============================
+- purge_old_assigned_cards()   : une passe de purge
+- pending_card_retention_loop() : tâche de fond lancée par le lifespan
+
+Une carte assignée ne sert plus qu'à l'historique récent : elle est
+supprimée PENDING_CARD_RETENTION_DAYS jours après son assignation, pour que
+pending_cards reste petite. La passe tourne toutes les
+RETENTION_INTERVAL_SECONDS dans chaque worker ; le DELETE est idempotent.
+
+Une carte purgée est oubliée : la scanner à nouveau ne donne plus de 409,
+elle revient dans la liste en attente. PENDING_CARD_RETENTION_DAYS=0 garde
+toutes les cartes assignées.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from starlette.concurrency import run_in_threadpool
+
+from src.core.config import settings
+from src.crud.crud_pending_card import purge_assigned_cards
+from src.database.session import SessionLocal
+from src.utils.logger import logger
+
+RETENTION_INTERVAL_SECONDS = 3600.0
+
+
+def purge_old_assigned_cards() -> int:
+    cutoff = datetime.now(timezone.utc) - timedelta(
+        days=settings.PENDING_CARD_RETENTION_DAYS
+    )
+    db = SessionLocal()
+    try:
+        return purge_assigned_cards(db, assigned_before=cutoff)
+    finally:
+        db.close()
+
+
+async def pending_card_retention_loop() -> None:
+    while True:
+        await asyncio.sleep(RETENTION_INTERVAL_SECONDS)
+        try:
+            deleted = await run_in_threadpool(purge_old_assigned_cards)
+            if deleted:
+                logger.info(f"{deleted} carte(s) assignée(s) purgée(s)")
+        except Exception as e:
+            logger.error(f"Purge des cartes assignées impossible : {e}")
@@ -22,6 +22,23 @@ class Settings(BaseSettings):
 
     CORS_ORIGINS: list[str] = ["*"]
 
+    # Budget of the in-memory list response cache (0 disables it)
+    RESPONSE_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+
+    # LISTEN/NOTIFY between workers (PostgreSQL only), e.g. for the badge feed
+    PG_NOTIFY_ENABLED: bool = False
+
+    # Assigned badges are deleted this many days after assignment (0 keeps them)
+    PENDING_CARD_RETENTION_DAYS: int = 30
+
+    # Startup warm-up (JWKS, admin token, DB pool, caches) before reporting ready
+    WARMUP_ENABLED: bool = True
+    WARMUP_DB_CONNECTIONS: int = 4
+    WARMUP_TIMEOUT_SECONDS: float = 10.0
+
+    # Background dependency probes reported by /health/ready (0 disables them)
+    HEALTH_PROBE_INTERVAL_SECONDS: float = 15.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
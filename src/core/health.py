@@ -0,0 +1,117 @@
+"""
+Health probes
+=============
+- health_probe_loop() : background task refreshing health_report on a timer
+- run_probes()        : one round of probes
+- health_report       : last results, served as is by GET /health/ready
+
+Readiness used to be a static answer. The dependencies are now probed every
+HEALTH_PROBE_INTERVAL_SECONDS by one background task per worker, never by
+the health requests themselves, so an orchestrator polling /health/ready
+does not fan out to the database or Keycloak:
+
+- db             : SELECT 1 latency (through the pool, so a saturated pool
+                   shows up as latency)
+- keycloak_token : latency of the token endpoint; the fresh token replaces
+                   the cached one
+- jwks_age_s     : age of the cached JWKS
+- pool           : checked-out connections against the pool capacity
+
+A worker is not ready while its last database probe failed. Keycloak
+failures are reported but do not take it out of rotation: token validation
+works from the cached JWKS.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from src.core.keycloak import jwks_age
+from src.core.keycloak_admin import get_admin_token
+from src.utils.logger import logger
+
+PROBE_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass
+class HealthReport:
+    db: dict | None = None
+    keycloak_token: dict | None = None
+    jwks_age_s: float | None = None
+    pool: dict | None = None
+    checked_at: datetime | None = None
+
+    @property
+    def db_ok(self) -> bool:
+        # No probe yet (or probes disabled): the warm-up already opened the pool
+        return self.db is None or self.db["ok"]
+
+
+health_report = HealthReport()
+
+
+def _ping_db(engine: Engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+async def _timed(step: Awaitable) -> dict:
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(step, PROBE_TIMEOUT_SECONDS)
+    except Exception as e:
+        error = getattr(e, "detail", None) or str(e) or repr(e)
+        result = {"ok": False, "error": error}
+    else:
+        result = {"ok": True}
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def pool_stats(engine: Engine) -> dict | None:
+    """Checked-out connections of a QueuePool (None for other pools)."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+    checked_out = pool.checkedout()
+    # QueuePool has no public accessor for max_overflow; -1 means unbounded
+    max_overflow = pool._max_overflow
+    capacity = pool.size() + max_overflow if max_overflow >= 0 else None
+    return {
+        "checked_out": checked_out,
+        "size": pool.size(),
+        "overflow": pool.overflow(),
+        "saturation": round(checked_out / capacity, 2) if capacity else None,
+    }
+
+
+async def run_probes(engine: Engine) -> HealthReport:
+    db, token = await asyncio.gather(
+        _timed(asyncio.to_thread(_ping_db, engine)),
+        _timed(get_admin_token(force=True)),
+    )
+    health_report.db = db
+    health_report.keycloak_token = token
+    age = jwks_age()
+    health_report.jwks_age_s = round(age, 1) if age is not None else None
+    health_report.pool = pool_stats(engine)
+    health_report.checked_at = datetime.now(timezone.utc)
+    if not db["ok"]:
+        logger.error(f"Sonde base de données en échec : {db['error']}")
+    return health_report
+
+
+async def health_probe_loop(engine: Engine, interval: float) -> None:
+    """Probe the dependencies every `interval` seconds, starting right away."""
+    while True:
+        try:
+            await run_probes(engine)
+        except Exception:
+            logger.exception("Sondes de santé en échec")
+        await asyncio.sleep(interval)
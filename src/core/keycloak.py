@@ -1,18 +1,22 @@
 """
 Keycloak integration
 ====================
+- get_jwks()                      : clés publiques du realm, gardées en cache
 - validate_jwt()                  : vérifie le Bearer JWT (admins ET service accounts)
 - require_admin()                 : rôle 'admin' requis
 - require_codir_or_admin()        : rôle 'codir' ou 'admin' requis
 - require_materialiste_or_above() : rôle 'materialiste', 'codir' ou 'admin' requis
 - require_codir()                 : rôle 'codir' requis (élévation temporaire)
+- require_capacity(capacity)      : capacité portée par un rôle DB de l'appelant
 - require_nfc_scanner()           : service account nfc-scanner
 - require_locker_client()         : service account smartlock-lockers
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 import httpx
 from fastapi import Depends, HTTPException, Security, status
@@ -20,6 +24,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 
 from src.core.config import settings
+from src.core.role_catalog import get_role_catalog
 from src.database.session import get_db
 from src.utils.logger import logger
 
@@ -56,6 +61,44 @@ def _jwks_uri() -> str:
     )
 
 
+# -------------------------------------------------------------------
+# Cache JWKS : les clés de signature ne changent qu'à leur rotation
+# -------------------------------------------------------------------
+JWKS_CACHE_TTL_SECONDS = 300.0
+# Délai minimal entre deux rechargements forcés (kid inconnu)
+JWKS_MIN_REFRESH_SECONDS = 10.0
+
+_jwks_cache: dict = {"jwks": None, "fetched_at": 0.0}
+
+
+async def get_jwks(refresh: bool = False) -> dict:
+    """
+    Retourne le JWKS du realm, rechargé après JWKS_CACHE_TTL_SECONDS.
+    refresh=True le recharge tout de suite (rotation des clés), au plus une fois
+    toutes les JWKS_MIN_REFRESH_SECONDS pour qu'un kid forgé ne fasse pas
+    interroger Keycloak à chaque requête.
+    """
+    max_age = JWKS_MIN_REFRESH_SECONDS if refresh else JWKS_CACHE_TTL_SECONDS
+    age = time.monotonic() - _jwks_cache["fetched_at"]
+    if _jwks_cache["jwks"] is not None and age < max_age:
+        return _jwks_cache["jwks"]
+
+    async with httpx.AsyncClient() as client:
+        resp = await client.get(_jwks_uri())
+        resp.raise_for_status()
+        jwks = resp.json()
+    _jwks_cache["jwks"] = jwks
+    _jwks_cache["fetched_at"] = time.monotonic()
+    return jwks
+
+
+def jwks_age() -> float | None:
+    """Âge du JWKS en cache, en secondes (None s'il n'a jamais été chargé)."""
+    if _jwks_cache["jwks"] is None:
+        return None
+    return time.monotonic() - _jwks_cache["fetched_at"]
+
+
 # -------------------------------------------------------------------
 # Validation JWT générique (admins + service accounts)
 # -------------------------------------------------------------------
@@ -70,10 +113,11 @@ async def validate_jwt(
     token = credentials.credentials
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(_jwks_uri())
-            resp.raise_for_status()
-            jwks = resp.json()
+        jwks = await get_jwks()
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid and kid not in {k.get("kid") for k in jwks.get("keys", [])}:
+            # Clé inconnue : Keycloak a peut-être fait tourner ses clés
+            jwks = await get_jwks(refresh=True)
 
         payload = jwt.decode(
             token,
@@ -226,10 +270,8 @@ async def require_role_admin(
     db: "Session" = Depends(get_db),
 ) -> dict:
     """Requires caller to have at least one role with is_role_admin=True."""
-    from src.crud.crud_role import get_roles_for_names
     roles_in_token = payload.get("realm_access", {}).get("roles", [])
-    caller_roles = get_roles_for_names(db, roles_in_token)
-    if not any(r.is_role_admin for r in caller_roles):
+    if not get_role_catalog(db).caller(roles_in_token).is_role_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Accès réservé aux administrateurs de rôles",
@@ -237,6 +279,36 @@ async def require_role_admin(
     return payload
 
 
+# -------------------------------------------------------------------
+# Dependency factory : capacité portée par un rôle (Role.capacities en DB)
+# -------------------------------------------------------------------
+@functools.cache
+def require_capacity(capacity: str) -> Callable[..., Awaitable[dict]]:
+    """
+    Retourne une dépendance qui exige qu'un des rôles du token porte `capacity`.
+    Le contrôle se fait sur les bitsets compilés du catalogue de rôles ; la
+    même capacité renvoie toujours la même dépendance (dependency_overrides).
+    """
+
+    async def dependency(
+        payload: dict = Depends(validate_jwt),
+        db: "Session" = Depends(get_db),
+    ) -> dict:
+        roles_in_token = payload.get("realm_access", {}).get("roles", [])
+        if not get_role_catalog(db).allows(roles_in_token, capacity):
+            logger.warning(
+                f"Accès refusé — capacité '{capacity}' absente, roles={roles_in_token}"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Capacité '{capacity}' requise",
+            )
+        return payload
+
+    dependency.__name__ = f"require_capacity_{capacity}"
+    return dependency
+
+
 # -------------------------------------------------------------------
 # Dependency : codir, présidence, admin (lifecycle revoke/restore)
 # -------------------------------------------------------------------
@@ -10,20 +10,45 @@ La création et la modification des utilisateurs, groupes et badges
 se font exclusivement via l'interface Keycloak.
 
 Toutes les fonctions sont async et utilisent httpx.AsyncClient.
+Les utilisateurs lus sont gardés USER_CACHE_TTL_SECONDS pour get_users_by_ids().
 Le token service account est mis en cache jusqu'à 30s avant son expiration.
+Les représentations des rôles realm (id, name) sont mises en cache : chargées
+au démarrage par warm_realm_role_cache(), rafraîchies par create_realm_role()
+et delete_realm_role(). Une attribution ne coûte ainsi qu'une requête.
+Avec PG_NOTIFY_ENABLED, ces deux caches sont aussi invalidés quand un autre
+worker modifie un utilisateur ou un rôle (topics "users" et "realm_roles").
 """
 
+import asyncio
 import time
+from collections import OrderedDict
+from typing import AsyncIterator
 
 import httpx
 from fastapi import HTTPException, status
 
 from src.core.config import settings
+from src.utils.invalidation import on_invalidation, publish_invalidation
 from src.utils.logger import logger
 
 # ── Cache du token service account ────────────────────────────────────────────
 _token_cache: dict = {"access_token": None, "expires_at": 0.0}
 
+# ── Cache des représentations de rôles realm ──────────────────────────────────
+# Les ids Keycloak d'un rôle ne changent pas tant qu'il n'est pas recréé
+_realm_role_cache: dict[str, dict] = {}
+
+# ── Cache des utilisateurs (résolution des noms dans le dashboard) ───────────
+USER_CACHE_TTL_SECONDS = 60.0
+USER_CACHE_MAX_ENTRIES = 5000
+_user_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+# ── Appels en masse ────────────────────────────────────────────────────────────
+ROLE_USERS_PAGE_SIZE = 100
+USERS_PAGE_SIZE = 200
+# Nombre maximal de requêtes Keycloak simultanées pour une opération en masse
+KEYCLOAK_CONCURRENCY = 8
+
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
@@ -70,17 +95,47 @@ def _handle_keycloak_error(e: httpx.HTTPStatusError, context: str) -> None:
     )
 
 
+def _cache_user(user: dict) -> None:
+    _user_cache[user["id"]] = (time.monotonic() + USER_CACHE_TTL_SECONDS, user)
+    _user_cache.move_to_end(user["id"])
+    while len(_user_cache) > USER_CACHE_MAX_ENTRIES:
+        _user_cache.popitem(last=False)
+
+
+def _cached_user(user_id: str) -> dict | None:
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _user_cache[user_id]
+        return None
+    return entry[1]
+
+
+def _evict(cache: dict, keys: tuple[str, ...]) -> None:
+    # Pas de clé : tout a pu changer (reconnexion LISTEN)
+    if not keys:
+        cache.clear()
+    for key in keys:
+        cache.pop(key, None)
+
+
+on_invalidation("users", lambda ids: _evict(_user_cache, ids))
+on_invalidation("realm_roles", lambda names: _evict(_realm_role_cache, names))
+
+
 # ── Token service account ──────────────────────────────────────────────────────
 
 
-async def get_admin_token() -> str:
+async def get_admin_token(force: bool = False) -> str:
     """
     Retourne un token valide pour le service account smartlock-api.
     Le token est mis en cache jusqu'à 30 secondes avant son expiration
-    pour éviter les race conditions.
+    pour éviter les race conditions. force=True en demande un nouveau
+    (sonde de santé du token endpoint).
     """
     now = time.time()
-    if _token_cache["access_token"] and now < _token_cache["expires_at"]:
+    if not force and _token_cache["access_token"] and now < _token_cache["expires_at"]:
         return _token_cache["access_token"]
 
     logger.debug("Renouvellement du token service account Keycloak...")
@@ -211,7 +266,54 @@ async def get_user(user_id: str) -> dict:
     except httpx.HTTPStatusError as e:
         _handle_keycloak_error(e, "get_user")
 
-    return resp.json()
+    user = resp.json()
+    _cache_user(user)
+    return user
+
+
+async def get_users_by_ids(
+    user_ids: list[str], concurrency: int = KEYCLOAK_CONCURRENCY
+) -> dict[str, dict | None]:
+    """
+    Retourne {user_id: utilisateur} pour plusieurs utilisateurs.
+    Les utilisateurs en cache ne sont pas redemandés ; les autres sont lus
+    `concurrency` à la fois sur un client HTTP partagé. Un id inconnu de
+    Keycloak est associé à None.
+    """
+    users: dict[str, dict | None] = {}
+    misses = []
+    for user_id in dict.fromkeys(user_ids):
+        user = _cached_user(user_id)
+        if user is None:
+            misses.append(user_id)
+        users[user_id] = user
+    if not misses:
+        return users
+
+    token = await get_admin_token()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient() as client:
+
+        async def fetch(user_id: str) -> None:
+            async with semaphore:
+                resp = await client.get(
+                    f"{_admin_base()}/users/{user_id}",
+                    headers=_auth_headers(token),
+                )
+            if resp.status_code == 404:
+                return
+            resp.raise_for_status()
+            users[user_id] = resp.json()
+            _cache_user(users[user_id])
+
+        try:
+            await asyncio.gather(*(fetch(u) for u in misses))
+        except httpx.HTTPStatusError as e:
+            _handle_keycloak_error(e, "get_users_by_ids")
+
+    logger.debug(f"{len(users) - len(misses)} utilisateur(s) servis depuis le cache")
+    return users
 
 
 async def list_users(
@@ -242,6 +344,50 @@ async def list_users(
     return resp.json()
 
 
+async def iter_user_pages(
+    search: str | None = None,
+    brief: bool = False,
+    page_size: int = USERS_PAGE_SIZE,
+) -> AsyncIterator[list[dict]]:
+    """
+    Parcourt tous les utilisateurs du realm, page par page.
+    La page suivante est demandée pendant que l'appelant traite la courante :
+    au plus deux pages sont en mémoire. `brief` omet les attributs.
+    """
+    params: dict = {"max": page_size, "briefRepresentation": str(brief).lower()}
+    if search:
+        params["search"] = search
+
+    async with httpx.AsyncClient() as client:
+
+        async def fetch(first: int) -> list[dict]:
+            token = await get_admin_token()
+            resp = await client.get(
+                f"{_admin_base()}/users",
+                params={**params, "first": first},
+                headers=_auth_headers(token),
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+        first = 0
+        pending: asyncio.Task | None = asyncio.create_task(fetch(first))
+        try:
+            while pending is not None:
+                try:
+                    page = await pending
+                except httpx.HTTPStatusError as e:
+                    _handle_keycloak_error(e, "iter_user_pages")
+                pending = None
+                if len(page) == page_size:
+                    first += page_size
+                    pending = asyncio.create_task(fetch(first))
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
 # ── Gestion des rôles ──────────────────────────────────────────────────────────
 
 
@@ -264,22 +410,65 @@ async def get_realm_role(role_name: str) -> dict:
     return resp.json()
 
 
+def _role_mapping(role: dict) -> dict:
+    return {"id": role["id"], "name": role["name"]}
+
+
+async def warm_realm_role_cache() -> None:
+    """Charge en une requête les représentations de tous les rôles realm."""
+    token = await get_admin_token()
+    try:
+        async with httpx.AsyncClient() as client:
+            resp = await client.get(
+                f"{_admin_base()}/roles",
+                params={"briefRepresentation": "true"},
+                headers=_auth_headers(token),
+            )
+            resp.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        _handle_keycloak_error(e, "warm_realm_role_cache")
+
+    _realm_role_cache.clear()
+    _realm_role_cache.update((r["name"], _role_mapping(r)) for r in resp.json())
+    logger.debug(f"{len(_realm_role_cache)} rôle(s) realm mis en cache")
+
+
+async def get_cached_realm_role(role_name: str) -> dict:
+    """
+    Retourne {"id", "name"} d'un rôle realm, depuis le cache si possible.
+    Un rôle absent du cache est récupéré une fois puis conservé.
+    """
+    role = _realm_role_cache.get(role_name)
+    if role is None:
+        role = _realm_role_cache[role_name] = _role_mapping(
+            await get_realm_role(role_name)
+        )
+    return role
+
+
+def _forget_stale_role(e: httpx.HTTPStatusError, role_name: str) -> None:
+    # Rôle supprimé puis recréé via un autre worker : l'id en cache est périmé
+    if e.response.status_code == 404:
+        _realm_role_cache.pop(role_name, None)
+
+
 async def add_role_to_user(user_id: str, role_name: str) -> None:
     """
     Ajoute un rôle realm à un utilisateur.
-    Récupère d'abord la représentation du rôle, puis l'assigne.
+    La représentation du rôle vient du cache : une seule requête Keycloak.
     """
-    role = await get_realm_role(role_name)
+    role = await get_cached_realm_role(role_name)
     token = await get_admin_token()
     try:
         async with httpx.AsyncClient() as client:
             resp = await client.post(
                 f"{_admin_base()}/users/{user_id}/role-mappings/realm",
-                json=[{"id": role["id"], "name": role["name"]}],
+                json=[role],
                 headers=_auth_headers(token),
             )
             resp.raise_for_status()
     except httpx.HTTPStatusError as e:
+        _forget_stale_role(e, role_name)
         _handle_keycloak_error(e, f"add_role_to_user({user_id}, {role_name})")
 
     logger.info(f"Rôle '{role_name}' ajouté à l'utilisateur {user_id}")
@@ -288,20 +477,21 @@ async def add_role_to_user(user_id: str, role_name: str) -> None:
 async def remove_role_from_user(user_id: str, role_name: str) -> None:
     """
     Retire un rôle realm d'un utilisateur.
-    Récupère d'abord la représentation du rôle, puis le retire.
+    La représentation du rôle vient du cache : une seule requête Keycloak.
     """
-    role = await get_realm_role(role_name)
+    role = await get_cached_realm_role(role_name)
     token = await get_admin_token()
     try:
         async with httpx.AsyncClient() as client:
             resp = await client.request(
                 "DELETE",
                 f"{_admin_base()}/users/{user_id}/role-mappings/realm",
-                json=[{"id": role["id"], "name": role["name"]}],
+                json=[role],
                 headers=_auth_headers(token),
             )
             resp.raise_for_status()
     except httpx.HTTPStatusError as e:
+        _forget_stale_role(e, role_name)
         _handle_keycloak_error(e, f"remove_role_from_user({user_id}, {role_name})")
 
     logger.info(f"Rôle '{role_name}' retiré de l'utilisateur {user_id}")
@@ -323,6 +513,8 @@ async def set_user_enabled(user_id: str, enabled: bool) -> None:
             resp.raise_for_status()
     except httpx.HTTPStatusError as e:
         _handle_keycloak_error(e, f"set_user_enabled({user_id}, {enabled})")
+    _user_cache.pop(user_id, None)
+    publish_invalidation("users", [user_id])
     logger.info(f"Utilisateur {user_id} — enabled={enabled}")
 
 
@@ -338,6 +530,8 @@ async def delete_keycloak_user(user_id: str) -> None:
             resp.raise_for_status()
     except httpx.HTTPStatusError as e:
         _handle_keycloak_error(e, f"delete_keycloak_user({user_id})")
+    _user_cache.pop(user_id, None)
+    publish_invalidation("users", [user_id])
     logger.info(f"Utilisateur {user_id} supprimé définitivement de Keycloak")
 
 
@@ -357,6 +551,9 @@ async def create_realm_role(name: str, description: str = "") -> None:
             resp.raise_for_status()
     except httpx.HTTPStatusError as e:
         _handle_keycloak_error(e, f"create_realm_role({name})")
+    # Un rôle recréé sous le même nom a un nouvel id
+    _realm_role_cache.pop(name, None)
+    publish_invalidation("realm_roles", [name])
     logger.info(f"Rôle Keycloak '{name}' créé")
 
 
@@ -387,16 +584,21 @@ async def delete_realm_role(name: str) -> None:
             resp.raise_for_status()
     except httpx.HTTPStatusError as e:
         _handle_keycloak_error(e, f"delete_realm_role({name})")
+    _realm_role_cache.pop(name, None)
+    publish_invalidation("realm_roles", [name])
     logger.info(f"Rôle Keycloak '{name}' supprimé")
 
 
-async def get_users_with_role(role_name: str) -> list[dict]:
-    """Retourne la liste des utilisateurs qui ont le rôle donné."""
+async def get_users_with_role(
+    role_name: str, first: int = 0, max_results: int = ROLE_USERS_PAGE_SIZE
+) -> list[dict]:
+    """Retourne une page des utilisateurs qui ont le rôle donné."""
     token = await get_admin_token()
     try:
         async with httpx.AsyncClient() as client:
             resp = await client.get(
                 f"{_admin_base()}/roles/{role_name}/users",
+                params={"first": first, "max": max_results},
                 headers=_auth_headers(token),
             )
             resp.raise_for_status()
@@ -405,6 +607,156 @@ async def get_users_with_role(role_name: str) -> list[dict]:
         _handle_keycloak_error(e, f"get_users_with_role({role_name})")
 
 
+async def list_all_users_with_role(
+    role_name: str,
+    page_size: int = ROLE_USERS_PAGE_SIZE,
+    concurrency: int = KEYCLOAK_CONCURRENCY,
+) -> list[dict]:
+    """
+    Retourne tous les utilisateurs qui ont le rôle donné.
+    Les pages sont demandées par vagues de `concurrency` requêtes parallèles,
+    jusqu'à la première page incomplète.
+    """
+    token = await get_admin_token()
+    users: dict[str, dict] = {}
+    first = 0
+
+    async with httpx.AsyncClient() as client:
+
+        async def fetch_page(offset: int) -> list[dict]:
+            resp = await client.get(
+                f"{_admin_base()}/roles/{role_name}/users",
+                params={"first": offset, "max": page_size},
+                headers=_auth_headers(token),
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+        while True:
+            offsets = [first + i * page_size for i in range(concurrency)]
+            try:
+                pages = await asyncio.gather(*(fetch_page(o) for o in offsets))
+            except httpx.HTTPStatusError as e:
+                _handle_keycloak_error(e, f"list_all_users_with_role({role_name})")
+            for page in pages:
+                # Dédoublonné : un ajout pendant la pagination décale les pages
+                users.update((u["id"], u) for u in page)
+            if any(len(page) < page_size for page in pages):
+                break
+            first += concurrency * page_size
+
+    logger.debug(f"{len(users)} utilisateur(s) avec le rôle '{role_name}'")
+    return list(users.values())
+
+
+async def remove_role_from_users(
+    role_name: str,
+    user_ids: list[str],
+    concurrency: int = KEYCLOAK_CONCURRENCY,
+) -> list[str]:
+    """
+    Retire un rôle realm de plusieurs utilisateurs, `concurrency` à la fois.
+    La représentation du rôle vient du cache et le client HTTP est partagé.
+    Retourne les ids des utilisateurs en échec ; un utilisateur supprimé
+    entre-temps (404) compte comme traité.
+    """
+    mapping = [await get_cached_realm_role(role_name)]
+    token = await get_admin_token()
+    semaphore = asyncio.Semaphore(concurrency)
+    failed: list[str] = []
+
+    async with httpx.AsyncClient() as client:
+
+        async def remove(user_id: str) -> None:
+            async with semaphore:
+                try:
+                    resp = await client.request(
+                        "DELETE",
+                        f"{_admin_base()}/users/{user_id}/role-mappings/realm",
+                        json=mapping,
+                        headers=_auth_headers(token),
+                    )
+                    if resp.status_code != 404:
+                        resp.raise_for_status()
+                except httpx.HTTPError as e:
+                    logger.error(f"Retrait de '{role_name}' pour {user_id} : {e}")
+                    failed.append(user_id)
+
+        await asyncio.gather(*(remove(u) for u in user_ids))
+
+    return failed
+
+
+async def apply_role_mappings(
+    changes: dict[str, list[str]],
+    assign: bool,
+    concurrency: int = KEYCLOAK_CONCURRENCY,
+) -> dict[tuple[str, str], str]:
+    """
+    Attribue (ou retire) des rôles realm à plusieurs utilisateurs.
+    `changes` associe chaque user_id à ses rôles : une seule requête Keycloak
+    par utilisateur, `concurrency` à la fois, sur un client HTTP partagé.
+    Les représentations des rôles viennent du cache.
+    Retourne {(user_id, role_name): motif} pour les couples en échec.
+    """
+    role_names = sorted({name for names in changes.values() for name in names})
+    fetched = await asyncio.gather(
+        *(get_cached_realm_role(name) for name in role_names),
+        return_exceptions=True,
+    )
+    roles = {}
+    failed: dict[tuple[str, str], str] = {}
+    for name, role in zip(role_names, fetched):
+        if isinstance(role, HTTPException):
+            failed.update(
+                ((user_id, name), role.detail)
+                for user_id, names in changes.items()
+                if name in names
+            )
+        elif isinstance(role, BaseException):
+            raise role
+        else:
+            roles[name] = role
+
+    token = await get_admin_token()
+    semaphore = asyncio.Semaphore(concurrency)
+    method = "POST" if assign else "DELETE"
+
+    async with httpx.AsyncClient() as client:
+
+        async def apply(user_id: str, names: list[str]) -> None:
+            mappings = [roles[name] for name in names if name in roles]
+            if not mappings:
+                return
+            async with semaphore:
+                try:
+                    resp = await client.request(
+                        method,
+                        f"{_admin_base()}/users/{user_id}/role-mappings/realm",
+                        json=mappings,
+                        headers=_auth_headers(token),
+                    )
+                    resp.raise_for_status()
+                    return
+                except httpx.HTTPStatusError as e:
+                    code = e.response.status_code
+                    for m in mappings:
+                        _forget_stale_role(e, m["name"])
+                    detail = (
+                        "Utilisateur introuvable"
+                        if code == 404
+                        else f"Erreur Keycloak inattendue ({code})"
+                    )
+                except httpx.RequestError:
+                    detail = "Keycloak injoignable"
+                logger.error(f"{method} role-mappings de {user_id} : {detail}")
+                failed.update(((user_id, m["name"]), detail) for m in mappings)
+
+        await asyncio.gather(*(apply(u, names) for u, names in changes.items()))
+
+    return failed
+
+
 async def get_user_roles(user_id: str) -> list[str]:
     """Retourne la liste des noms de rôles realm assignés directement à l'utilisateur."""
     token = await get_admin_token()
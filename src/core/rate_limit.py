@@ -0,0 +1,10 @@
+"""
+Rate limiting
+=============
+- limiter : slowapi limiter shared by the routes, attached by create_app()
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+limiter = Limiter(key_func=get_remote_address)
@@ -0,0 +1,164 @@
+"""
+Role catalog
+============
+- get_role_catalog()        : in-memory snapshot of the roles table
+- invalidate_role_catalog() : called by crud_role after every write
+- RoleCatalog.caller()      : per-caller facts (max tier, manageable roles…)
+- RoleCatalog.allows()      : capacity check against the compiled bitsets
+
+The roles table is tiny and rarely changes, yet every role-management check
+used to query it. The snapshot is loaded once per version and answers those
+checks without touching the database; the facts derived from a token are
+computed once per distinct set of roles and memoized in the snapshot.
+
+Capacities are compiled into bitsets when the snapshot is built: each
+capacity gets a bit, each role the OR of its capacities' bits, and a caller
+the OR of its roles' masks. A capacity check is then a single AND.
+
+A write on another worker reaches this one through the "roles" invalidation
+topic when PG_NOTIFY_ENABLED is set; otherwise it is only seen once the local
+snapshot is older than MAX_AGE_SECONDS.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+from typing import Iterable
+
+from sqlalchemy.orm import Session
+
+from src.models.role import Role
+from src.utils.invalidation import on_invalidation
+
+MAX_AGE_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class RoleEntry:
+    name: str
+    label: str
+    tier: int
+    is_system: bool
+    is_manager: bool
+    is_role_admin: bool
+    capacities: frozenset[str]
+
+    @classmethod
+    def from_row(cls, role: Role) -> "RoleEntry":
+        return cls(
+            name=role.name,
+            label=role.label,
+            tier=role.tier,
+            is_system=role.is_system,
+            is_manager=role.is_manager,
+            is_role_admin=role.is_role_admin,
+            capacities=frozenset(role.capacities or []),
+        )
+
+
+@dataclass(frozen=True)
+class CallerProfile:
+    """What a set of token roles is allowed to do, derived from the catalog."""
+
+    max_tier: int
+    role_admin_names: frozenset[str]
+    capacity_mask: int
+    manageable: frozenset[str]
+
+    @property
+    def is_role_admin(self) -> bool:
+        return bool(self.role_admin_names)
+
+
+def _can_manage(caller: RoleEntry, target: RoleEntry) -> bool:
+    # T5 has no tier above it, so a T5 manager can manage another T5
+    return caller.is_manager and (
+        caller.tier > target.tier or (caller.tier == 5 and target.tier == 5)
+    )
+
+
+class RoleCatalog:
+    def __init__(self, roles: Iterable[RoleEntry], version: int):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.roles = {r.name: r for r in roles}
+        self.capacity_bits = {
+            capacity: 1 << bit
+            for bit, capacity in enumerate(
+                sorted(set().union(*(r.capacities for r in self.roles.values())))
+            )
+        }
+        self.role_masks = {
+            r.name: reduce(or_, (self.capacity_bits[c] for c in r.capacities), 0)
+            for r in self.roles.values()
+        }
+        self._profiles: dict[frozenset[str], CallerProfile] = {}
+
+    def get(self, name: str) -> RoleEntry | None:
+        return self.roles.get(name)
+
+    def caller(self, token_roles: Iterable[str]) -> CallerProfile:
+        """Profile of a caller from the realm roles of their token."""
+        key = frozenset(name for name in token_roles if name in self.roles)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self._profiles[key] = self._build_profile(key)
+        return profile
+
+    def allows(self, token_roles: Iterable[str], capacity: str) -> bool:
+        """True if one of the caller's roles carries `capacity`."""
+        bit = self.capacity_bits.get(capacity, 0)
+        return bool(self.caller(token_roles).capacity_mask & bit)
+
+    def _build_profile(self, names: frozenset[str]) -> CallerProfile:
+        own = [self.roles[name] for name in names]
+        return CallerProfile(
+            max_tier=max((r.tier for r in own), default=-1),
+            role_admin_names=frozenset(r.name for r in own if r.is_role_admin),
+            capacity_mask=reduce(or_, (self.role_masks[r.name] for r in own), 0),
+            manageable=frozenset(
+                target.name
+                for target in self.roles.values()
+                if any(_can_manage(r, target) for r in own)
+            ),
+        )
+
+
+_lock = threading.Lock()
+_version = 0
+_snapshot: RoleCatalog | None = None
+
+
+def invalidate_role_catalog() -> None:
+    global _version, _snapshot
+    with _lock:
+        _version += 1
+        _snapshot = None
+
+
+on_invalidation("roles", lambda _names: invalidate_role_catalog())
+
+
+def get_role_catalog(db: Session) -> RoleCatalog:
+    """Return the current snapshot, reloading it if it was invalidated or expired."""
+    global _snapshot
+    snapshot = _snapshot
+    if (
+        snapshot is not None
+        and snapshot.version == _version
+        and time.monotonic() - snapshot.loaded_at < MAX_AGE_SECONDS
+    ):
+        return snapshot
+
+    version = _version
+    snapshot = RoleCatalog(
+        (RoleEntry.from_row(r) for r in db.query(Role).all()), version
+    )
+    with _lock:
+        # A write committed during the load bumped the version: serve this
+        # snapshot to the current request only, the next one reloads.
+        if _version == version:
+            _snapshot = snapshot
+    return snapshot
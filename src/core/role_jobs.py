@@ -0,0 +1,118 @@
+"""
+Role deletion jobs
+==================
+- create_role_deletion_job() : registers a pending cascade deletion
+- run_role_deletion_job()    : background task doing the actual work
+- get_role_deletion_job()    : progress lookup for GET /roles/jobs/{job_id}
+
+A cascade delete used to hold the HTTP request open while Keycloak was called
+for every holder of the role. The route now answers 202 with a job id and the
+job pages through the holders, removes their mappings in batches with bounded
+concurrency and only then deletes the role (Keycloak + DB). If a mapping
+cannot be removed, the role is kept and the job ends as "failed" so the
+deletion can be retried.
+
+Jobs live in memory, in the worker that accepted the request; the most
+recent MAX_JOBS are kept.
+"""
+
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Literal
+
+from sqlalchemy.orm import Session
+
+from src.core.keycloak_admin import (
+    delete_realm_role,
+    list_all_users_with_role,
+    remove_role_from_users,
+)
+from src.crud.crud_role import delete_role, get_role_by_name
+from src.utils.logger import logger
+
+MAX_JOBS = 100
+REMOVAL_BATCH_SIZE = 100
+
+
+@dataclass
+class RoleDeletionJob:
+    role_name: str
+    requested_by: str | None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: Literal["pending", "running", "completed", "failed"] = "pending"
+    total_users: int | None = None
+    processed_users: int = 0
+    failed_users: list[str] = field(default_factory=list)
+    detail: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+
+
+_jobs: OrderedDict[str, RoleDeletionJob] = OrderedDict()
+
+
+def create_role_deletion_job(
+    role_name: str, requested_by: str | None
+) -> RoleDeletionJob:
+    job = RoleDeletionJob(role_name=role_name, requested_by=requested_by)
+    _jobs[job.id] = job
+    while len(_jobs) > MAX_JOBS:
+        _jobs.popitem(last=False)
+    return job
+
+
+def get_role_deletion_job(job_id: str) -> RoleDeletionJob | None:
+    return _jobs.get(job_id)
+
+
+def _finish(job: RoleDeletionJob, status: str, detail: str | None = None) -> None:
+    job.status = status
+    job.detail = detail
+    job.finished_at = datetime.now(timezone.utc)
+
+
+async def run_role_deletion_job(
+    job: RoleDeletionJob, session_factory: Callable[[], Session]
+) -> None:
+    """Remove the role from every holder, then delete it from Keycloak and the DB."""
+    job.status = "running"
+    logger.info(f"Suppression en cascade du rôle '{job.role_name}' (job {job.id})")
+    try:
+        holders = await list_all_users_with_role(job.role_name)
+        job.total_users = len(holders)
+
+        user_ids = [u["id"] for u in holders]
+        for start in range(0, len(user_ids), REMOVAL_BATCH_SIZE):
+            batch = user_ids[start : start + REMOVAL_BATCH_SIZE]
+            job.failed_users += await remove_role_from_users(job.role_name, batch)
+            job.processed_users += len(batch)
+
+        if job.failed_users:
+            _finish(
+                job,
+                "failed",
+                f"{len(job.failed_users)} utilisateur(s) n'ont pas pu être retirés,"
+                " le rôle est conservé",
+            )
+            logger.error(f"Job {job.id} : {job.detail}")
+            return
+
+        await delete_realm_role(job.role_name)
+        db = session_factory()
+        try:
+            role = get_role_by_name(db, job.role_name)
+            if role is not None:
+                delete_role(db, role)
+        finally:
+            db.close()
+
+        _finish(job, "completed")
+        logger.success(
+            f"Rôle '{job.role_name}' supprimé après retrait de"
+            f" {job.processed_users} utilisateur(s) (job {job.id})"
+        )
+    except Exception as e:
+        logger.exception(f"Job {job.id} de suppression de '{job.role_name}' : {e}")
+        _finish(job, "failed", getattr(e, "detail", None) or "Erreur inattendue")
@@ -0,0 +1,102 @@
+"""
+Startup warm-up
+===============
+- run_warmup()   : fills the caches the first requests would otherwise pay for
+- warmup_state   : progress read by GET /health and GET /health/ready
+
+Right after a deploy, the first requests used to download the JWKS, fetch the
+service-account token, open the first database connections and configure the
+SQLAlchemy mappers. The lifespan now runs these steps concurrently in the
+background, each bounded by WARMUP_TIMEOUT_SECONDS:
+
+- jwks         : realm signing keys (get_jwks)
+- admin_token  : service-account token (get_admin_token)
+- realm_roles  : Keycloak role ids used by role assignments
+- db_pool      : WARMUP_DB_CONNECTIONS pooled connections, opened at once
+- mappers      : sqlalchemy.orm.configure_mappers()
+- role_catalog : in-memory snapshot of the roles table
+
+The worker is live as soon as it serves HTTP and ready once the warm-up has
+finished. A failed step does not keep it out of rotation: the cache is then
+filled by the first request that needs it, as before, and the failure is
+reported in warmup_state.steps.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, configure_mappers
+
+from src.core.config import settings
+from src.core.keycloak import get_jwks
+from src.core.keycloak_admin import get_admin_token, warm_realm_role_cache
+from src.core.role_catalog import get_role_catalog
+from src.utils.logger import logger
+
+
+@dataclass
+class WarmupState:
+    ready: bool = False
+    # step name -> "ok" or the error message
+    steps: dict[str, str] = field(default_factory=dict)
+    duration_ms: float | None = None
+
+
+warmup_state = WarmupState()
+
+
+def _open_connections(engine: Engine, count: int) -> None:
+    # Held together so the pool really opens `count` distinct connections
+    connections = []
+    try:
+        for _ in range(count):
+            conn = engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+def _prime_role_catalog(session_factory: Callable[[], Session]) -> None:
+    db = session_factory()
+    try:
+        get_role_catalog(db)
+    finally:
+        db.close()
+
+
+async def _run_step(name: str, step: Awaitable) -> None:
+    try:
+        await asyncio.wait_for(step, settings.WARMUP_TIMEOUT_SECONDS)
+    except Exception as e:
+        warmup_state.steps[name] = getattr(e, "detail", None) or str(e) or repr(e)
+        logger.warning(f"⚠️ Warm-up '{name}' échoué : {warmup_state.steps[name]}")
+    else:
+        warmup_state.steps[name] = "ok"
+
+
+async def run_warmup(
+    engine: Engine, session_factory: Callable[[], Session]
+) -> WarmupState:
+    """Run every warm-up step concurrently, then mark the worker ready."""
+    started = time.perf_counter()
+    steps = {
+        "jwks": get_jwks(),
+        "admin_token": get_admin_token(),
+        "realm_roles": warm_realm_role_cache(),
+        "db_pool": asyncio.to_thread(
+            _open_connections, engine, settings.WARMUP_DB_CONNECTIONS
+        ),
+        "mappers": asyncio.to_thread(configure_mappers),
+        "role_catalog": asyncio.to_thread(_prime_role_catalog, session_factory),
+    }
+    await asyncio.gather(*(_run_step(name, step) for name, step in steps.items()))
+    warmup_state.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+    warmup_state.ready = True
+    logger.success(f"✅ Warm-up terminé en {warmup_state.duration_ms} ms")
+    return warmup_state
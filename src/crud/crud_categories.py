@@ -1,8 +1,13 @@
+from datetime import datetime
+
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.models.categories import Categories
+from src.schemas.bulk import BulkRowResult
 from src.schemas.categories import CategoryCreate, CategoryUpdate
+from src.utils.bulk import bulk_upsert, dedupe_rows
+from src.utils.collection_version import bump_collections
 from src.utils.logger import logger
 
 
@@ -15,6 +20,7 @@ def create_categories(db: Session, categories: CategoryCreate) -> Categories:
         db_category = Categories(**categories.model_dump())
         db.add(db_category)
         db.commit()
+        bump_collections("categories")
         db.refresh(db_category)
 
         logger.success(f"Category created successfully with ID: {db_category.id}")
@@ -31,12 +37,55 @@ def create_categories(db: Session, categories: CategoryCreate) -> Categories:
         raise
 
 
-def get_categories(db: Session, skip: int = 0, limit: int = 100) -> list[Categories]:
-    """Retrieve a list of categories from the database."""
+def bulk_upsert_categories(
+    db: Session, rows: list[tuple[int, CategoryCreate]]
+) -> list[BulkRowResult]:
+    """Create many categories at once; existing names are reported as updated."""
+    logger.info(f"Bulk upserting {len(rows)} categories")
+
+    try:
+        valid, results = dedupe_rows(rows, lambda c: c.name, "name")
+
+        ids, existing = bulk_upsert(
+            db,
+            Categories,
+            [category.model_dump() for _, category in valid],
+            key_columns=["name"],
+            update_columns=[],
+        )
+        db.commit()
+        bump_collections("categories")
+
+        for index, category in valid:
+            key = (category.name,)
+            results.append(
+                BulkRowResult(
+                    index=index,
+                    status="updated" if key in existing else "created",
+                    id=ids[key],
+                )
+            )
+
+        logger.success(f"Bulk upsert of categories done ({len(valid)} rows)")
+        return results
+
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to bulk upsert categories: {e}")
+        db.rollback()
+        raise
+
+
+def get_categories(
+    db: Session, skip: int = 0, limit: int = 100, since: datetime | None = None
+) -> list[Categories]:
+    """Retrieve a list of categories, optionally only those updated after `since`."""
     logger.debug(f"Fetching categories with skip={skip} and limit={limit}")
 
     try:
-        categories = db.query(Categories).offset(skip).limit(limit).all()
+        query = db.query(Categories)
+        if since is not None:
+            query = query.filter(Categories.updated_at > since)
+        categories = query.offset(skip).limit(limit).all()
         logger.info(f"Fetched {len(categories)} categories successfully")
         return categories
 
@@ -78,6 +127,7 @@ def update_category(
             setattr(db_category, key, value)
 
         db.commit()
+        bump_collections("categories")
         db.refresh(db_category)
 
         logger.success(f"Category with ID {category_id} updated successfully")
@@ -109,6 +159,7 @@ def delete_category(db: Session, category_id: int) -> Categories | None:
 
         db.delete(db_category)
         db.commit()
+        bump_collections("categories", "items")
 
         logger.success(f"Category with ID {category_id} deleted successfully")
         return db_category
@@ -1,8 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Float,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from src.models.categories import Categories
 from src.models.items import Items
+from src.schemas.bulk import BulkRowResult
 from src.schemas.items import ItemCreate, ItemUpdate
+from src.utils.bulk import bulk_upsert, dedupe_rows
+from src.utils.collection_version import bump_collections
 from src.utils.logger import logger
 
 
@@ -15,6 +33,7 @@ def create_item(db: Session, item: ItemCreate) -> Items:
         db_item = Items(**item.model_dump())
         db.add(db_item)
         db.commit()
+        bump_collections("items")
         db.refresh(db_item)
 
         logger.success(f"Item created successfully with ID: {db_item.id}")
@@ -31,12 +50,81 @@ def create_item(db: Session, item: ItemCreate) -> Items:
         raise
 
 
-def get_items(db: Session, skip: int = 0, limit: int = 100) -> list[Items]:
-    """Retrieve a list of items from the database."""
+def bulk_upsert_items(
+    db: Session, rows: list[tuple[int, ItemCreate]]
+) -> list[BulkRowResult]:
+    """
+    Create or update many items at once, matched on their unique reference.
+
+    Categories are checked with a single query; rows pointing to an unknown
+    category are reported as errors and skipped.
+    """
+    logger.info(f"Bulk upserting {len(rows)} items")
+
+    try:
+        category_ids = {item.category_id for _, item in rows}
+        known = {
+            cid
+            for (cid,) in db.query(Categories.id).filter(
+                Categories.id.in_(category_ids)
+            )
+        }
+
+        results: list[BulkRowResult] = []
+        valid: list[tuple[int, ItemCreate]] = []
+        for index, item in rows:
+            if item.category_id in known:
+                valid.append((index, item))
+            else:
+                results.append(
+                    BulkRowResult(
+                        index=index, status="error", detail="Category not found"
+                    )
+                )
+
+        valid, duplicates = dedupe_rows(valid, lambda i: i.reference, "reference")
+        results.extend(duplicates)
+
+        ids, existing = bulk_upsert(
+            db,
+            Items,
+            [item.model_dump() for _, item in valid],
+            key_columns=["reference"],
+            update_columns=["name", "description", "category_id"],
+        )
+        db.commit()
+        bump_collections("items")
+
+        for index, item in valid:
+            key = (item.reference,)
+            results.append(
+                BulkRowResult(
+                    index=index,
+                    status="updated" if key in existing else "created",
+                    id=ids[key],
+                )
+            )
+
+        logger.success(f"Bulk upsert of items done ({len(valid)}/{len(rows)} rows)")
+        return results
+
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to bulk upsert items: {e}")
+        db.rollback()
+        raise
+
+
+def get_items(
+    db: Session, skip: int = 0, limit: int = 100, since: datetime | None = None
+) -> list[Items]:
+    """Retrieve a list of items, optionally only those updated after `since`."""
     logger.debug(f"Fetching items with skip={skip} and limit={limit}")
 
     try:
-        items = db.query(Items).offset(skip).limit(limit).all()
+        query = db.query(Items)
+        if since is not None:
+            query = query.filter(Items.updated_at > since)
+        items = query.offset(skip).limit(limit).all()
         logger.info(f"Fetched {len(items)} items successfully")
         return items
 
@@ -45,6 +133,87 @@ def get_items(db: Session, skip: int = 0, limit: int = 100) -> list[Items]:
         raise
 
 
+def _search_rank_postgresql(q: str):
+    """Trigram similarity plus full-text rank, backed by the 0007 GIN indexes."""
+    config = literal_column("'simple'")
+    document = func.to_tsvector(config, Items.search_document)
+    query = func.plainto_tsquery(config, q)
+    rank = func.greatest(
+        func.similarity(Items.search_document, q),
+        func.word_similarity(q, Items.search_document),
+    ) + func.ts_rank(document, query)
+    condition = or_(
+        literal(q).op("<%")(Items.search_document),
+        document.op("@@")(query),
+    )
+    return rank, condition
+
+
+def _search_rank_fallback(q: str):
+    """Substring ranking for databases without pg_trgm (SQLite in tests)."""
+    rank = case(
+        (Items.name.istartswith(q, autoescape=True), 2.0),
+        (Items.name.icontains(q, autoescape=True), 1.5),
+        (Items.search_document.icontains(q, autoescape=True), 1.0),
+        else_=0.5,
+    )
+    return rank, None
+
+
+def search_items(
+    db: Session,
+    q: str,
+    limit: int = 20,
+    after: tuple[float, int] | None = None,
+) -> list[Row]:
+    """
+    Search items by name, reference, description and category name.
+
+    Rows carry the item, its category name and a relevance rank, ordered by
+    rank then id. `after` is the (rank, id) of the last row of the previous
+    page; pagination is keyset-based so deep pages cost the same as the first.
+    """
+    logger.debug(f"Searching items for {q!r} (after={after}, limit={limit})")
+
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            rank, fuzzy_match = _search_rank_postgresql(q)
+        else:
+            rank, fuzzy_match = _search_rank_fallback(q)
+
+        exact_reference = func.lower(Items.reference) == q.lower()
+        rank = cast(rank + case((exact_reference, 4.0), else_=0.0), Float)
+
+        category_ids = select(Categories.id).where(
+            Categories.name.icontains(q, autoescape=True)
+        )
+        matches = [
+            Items.search_document.icontains(q, autoescape=True),
+            Items.category_id.in_(category_ids),
+        ]
+        if fuzzy_match is not None:
+            matches.append(fuzzy_match)
+
+        query = (
+            db.query(Items, Categories.name.label("category_name"), rank.label("rank"))
+            .join(Categories, Categories.id == Items.category_id)
+            .filter(or_(*matches))
+        )
+        if after is not None:
+            after_rank, after_id = after
+            query = query.filter(
+                or_(rank < after_rank, and_(rank == after_rank, Items.id > after_id))
+            )
+
+        rows = query.order_by(rank.desc(), Items.id).limit(limit).all()
+        logger.info(f"Item search for {q!r} returned {len(rows)} rows")
+        return rows
+
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to search items for {q!r}: {e}")
+        raise
+
+
 def get_item(db: Session, item_id: int) -> Items | None:
     """Retrieve a single item by its ID."""
     logger.debug(f"Fetching item with ID: {item_id}")
@@ -76,6 +245,7 @@ def update_item(db: Session, item_id: int, item_update: ItemUpdate) -> Items | N
             setattr(db_item, key, value)
 
         db.commit()
+        bump_collections("items")
         db.refresh(db_item)
         logger.success(f"Item with ID {item_id} updated successfully")
         return db_item
@@ -103,6 +273,7 @@ def delete_item(db: Session, item_id: int) -> Items | None:
 
         db.delete(db_item)
         db.commit()
+        bump_collections("items")
         logger.success(f"Item with ID {item_id} deleted successfully")
         return db_item
 
@@ -1,11 +1,16 @@
-from typing import List
+from datetime import datetime
+from typing import Any, List
 
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from src.models.categories import Categories
+from src.models.items import Items
 from src.models.lockers import Lockers
 from src.models.stock import Stock
 from src.schemas.lockers import LockerCreate, LockerUpdate
+from src.utils.collection_version import bump_collections
 from src.utils.logger import logger
 
 
@@ -16,6 +21,7 @@ def create_locker(db: Session, locker: LockerCreate) -> Lockers:
         db_locker = Lockers(**locker.model_dump())
         db.add(db_locker)
         db.commit()
+        bump_collections("lockers")
         db.refresh(db_locker)
         logger.success(f"Locker created successfully with ID: {db_locker.id}")
         return db_locker
@@ -29,11 +35,16 @@ def create_locker(db: Session, locker: LockerCreate) -> Lockers:
         raise
 
 
-def get_lockers(db: Session, skip: int = 0, limit: int = 100) -> list[Lockers]:
-    """Retrieve a list of lockers from the database."""
+def get_lockers(
+    db: Session, skip: int = 0, limit: int = 100, since: datetime | None = None
+) -> list[Lockers]:
+    """Retrieve a list of lockers, optionally only those updated after `since`."""
     logger.debug(f"Fetching lockers with skip={skip} and limit={limit}")
     try:
-        lockers = db.query(Lockers).offset(skip).limit(limit).all()
+        query = db.query(Lockers)
+        if since is not None:
+            query = query.filter(Lockers.updated_at > since)
+        lockers = query.offset(skip).limit(limit).all()
         logger.info(f"Fetched {len(lockers)} lockers successfully")
         return lockers
     except SQLAlchemyError as e:
@@ -70,13 +81,8 @@ def get_locker_stock(db: Session, locker_id: int) -> List[Stock]:
     logger.debug(f"Fetching stock for locker with ID: {locker_id}")
 
     try:
-        locker = db.query(Lockers).filter(Lockers.id == locker_id).first()
-
-        if not locker:
-            logger.warning(f"Locker with ID {locker_id} not found")
-            return []
-
-        stock = locker.stock  # Access via relationship
+        # Single query on stock: an unknown locker simply yields no rows
+        stock = db.query(Stock).filter(Stock.locker_id == locker_id).all()
         logger.info(f"Retrieved {len(stock)} stock items for locker {locker_id}")
         return stock
 
@@ -85,6 +91,59 @@ def get_locker_stock(db: Session, locker_id: int) -> List[Stock]:
         raise
 
 
+def get_locker_inventory(
+    db: Session, locker_id: int, after: int | None = None, limit: int = 100
+) -> list[Any]:
+    """
+    Retrieve a page of a locker inventory with item and category details.
+
+    Stock, items and categories are fetched in one joined query projecting
+    only the needed columns. Pages are ordered by stock ID; pass the last
+    `stock_id` of a page as `after` to get the next one (keyset pagination).
+
+    Args:
+        db: Database session
+        locker_id: ID of the locker
+        after: Return entries with a stock ID strictly greater than this one
+        limit: Maximum number of entries
+
+    Returns:
+        List of rows with stock, item and category columns
+    """
+    logger.debug(
+        f"Fetching inventory for locker {locker_id} (after={after}, limit={limit})"
+    )
+
+    try:
+        query = (
+            db.query(
+                Stock.id.label("stock_id"),
+                func.coalesce(Stock.quantity, 0).label("quantity"),
+                Stock.unit_measure,
+                Stock.updated_at,
+                Items.id.label("item_id"),
+                Items.name.label("item_name"),
+                Items.reference.label("item_reference"),
+                Items.description.label("item_description"),
+                Categories.id.label("category_id"),
+                Categories.name.label("category_name"),
+            )
+            .join(Items, Stock.item_id == Items.id)
+            .join(Categories, Items.category_id == Categories.id)
+            .filter(Stock.locker_id == locker_id)
+        )
+        if after is not None:
+            query = query.filter(Stock.id > after)
+
+        rows = query.order_by(Stock.id).limit(limit).all()
+        logger.info(f"Retrieved {len(rows)} inventory entries for locker {locker_id}")
+        return rows
+
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to fetch inventory for locker {locker_id}: {e}")
+        raise
+
+
 def update_locker(
     db: Session, locker_id: int, locker_update: LockerUpdate
 ) -> Lockers | None:
@@ -101,6 +160,7 @@ def update_locker(
             setattr(db_locker, key, value)
 
         db.commit()
+        bump_collections("lockers")
         db.refresh(db_locker)
         logger.success(f"Locker with ID {locker_id} updated successfully")
         return db_locker
@@ -125,6 +185,8 @@ def delete_locker(db: Session, locker_id: int) -> Lockers | None:
 
         db.delete(db_locker)
         db.commit()
+        # Its stock rows go with it (delete-orphan)
+        bump_collections("lockers", "stock")
         logger.success(f"Locker with ID {locker_id} deleted successfully")
         return db_locker
     except SQLAlchemyError as e:
@@ -0,0 +1,136 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.models.pending_card import PendingCard
+from src.utils.bulk import dialect_insert
+from src.utils.logger import logger
+
+
+def register_scans(db: Session, card_ids: list[str]) -> list[Row]:
+    """
+    Record scanned cards with a single INSERT … ON CONFLICT DO NOTHING.
+
+    `card_ids` are hashed card ids. Returns the rows actually inserted
+    (id, card_id, scanned_at, status): a card missing from the result was
+    already known. Concurrent scans of the same card are settled by the
+    unique index, so exactly one of them gets the row back.
+    """
+    card_ids = list(dict.fromkeys(card_ids))
+    if not card_ids:
+        return []
+
+    insert = dialect_insert(db)
+    stmt = (
+        insert(PendingCard)
+        .values([{"card_id": card_id} for card_id in card_ids])
+        .on_conflict_do_nothing(index_elements=["card_id"])
+        .returning(
+            PendingCard.id,
+            PendingCard.card_id,
+            PendingCard.scanned_at,
+            PendingCard.status,
+        )
+    )
+    try:
+        rows = db.execute(stmt).all()
+        db.commit()
+        return rows
+    except SQLAlchemyError as e:
+        logger.error(f"Error registering card scans: {e}")
+        db.rollback()
+        raise
+
+
+def get_card_status(db: Session, card_id: str) -> str | None:
+    return db.query(PendingCard.status).filter(PendingCard.card_id == card_id).scalar()
+
+
+def get_pending_cards_after(
+    db: Session, after_id: int, limit: int = 500
+) -> list[PendingCard]:
+    """Pending cards registered after `after_id`, oldest first."""
+    return (
+        db.query(PendingCard)
+        .filter(PendingCard.status == "pending", PendingCard.id > after_id)
+        .order_by(PendingCard.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_pending_cards_page(
+    db: Session, limit: int = 100, before: tuple[datetime, int] | None = None
+) -> list[PendingCard]:
+    """
+    Pending cards, newest first, one keyset page at a time.
+
+    `before` is the (scanned_at, id) of the last card of the previous page.
+    Served by the (status, scanned_at, id) index.
+    """
+    query = db.query(PendingCard).filter(PendingCard.status == "pending")
+    if before is not None:
+        query = query.filter(
+            tuple_(PendingCard.scanned_at, PendingCard.id) < tuple_(*before)
+        )
+    return (
+        query.order_by(PendingCard.scanned_at.desc(), PendingCard.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def assign_cards(db: Session, card_ids: list[str]) -> list[Row]:
+    """
+    Mark cards as assigned with a single UPDATE … RETURNING.
+
+    Returns the updated rows; a card missing from the result does not exist.
+    Cards that were already assigned keep their original assigned_at.
+    """
+    if not card_ids:
+        return []
+    stmt = (
+        update(PendingCard)
+        .where(PendingCard.card_id.in_(card_ids))
+        .values(
+            status="assigned",
+            assigned_at=func.coalesce(PendingCard.assigned_at, func.now()),
+        )
+        .returning(
+            PendingCard.id,
+            PendingCard.card_id,
+            PendingCard.scanned_at,
+            PendingCard.status,
+        )
+    )
+    try:
+        rows = db.execute(stmt, execution_options={"synchronize_session": False}).all()
+        db.commit()
+        return rows
+    except SQLAlchemyError as e:
+        logger.error(f"Error assigning cards: {e}")
+        db.rollback()
+        raise
+
+
+def purge_assigned_cards(db: Session, assigned_before: datetime) -> int:
+    """
+    Delete the cards assigned before `assigned_before`. Returns the count.
+
+    A deleted card is forgotten: scanning it again registers a new pending card.
+    """
+    stmt = delete(PendingCard).where(
+        PendingCard.status == "assigned",
+        PendingCard.assigned_at < assigned_before,
+    )
+    try:
+        deleted = db.execute(stmt).rowcount
+        db.commit()
+        return deleted
+    except SQLAlchemyError as e:
+        logger.error(f"Error purging assigned cards: {e}")
+        db.rollback()
+        raise
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
+from src.core.role_catalog import invalidate_role_catalog
 from src.models.role import Role
 from src.schemas.role import RoleUpdate
+from src.utils.invalidation import publish_invalidation
 
 
 def get_role_by_name(db: Session, name: str) -> Role | None:
@@ -32,6 +34,8 @@ def create_role(
     )
     db.add(role)
     db.commit()
+    invalidate_role_catalog()
+    publish_invalidation("roles", [role.name])
     db.refresh(role)
     return role
 
@@ -40,10 +44,15 @@ def update_role(db: Session, role: Role, data: RoleUpdate) -> Role:
     for key, val in data.model_dump(exclude_unset=True).items():
         setattr(role, key, val)
     db.commit()
+    invalidate_role_catalog()
+    publish_invalidation("roles", [role.name])
     db.refresh(role)
     return role
 
 
 def delete_role(db: Session, role: Role) -> None:
+    name = role.name
     db.delete(role)
     db.commit()
+    invalidate_role_catalog()
+    publish_invalidation("roles", [name])
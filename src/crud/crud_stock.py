@@ -1,8 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import func, insert, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from src.crud.crud_stock_threshold import refresh_stock_alerts
+from src.models.items import Items
+from src.models.lockers import Lockers
 from src.models.stock import Stock
+from src.models.stock_movement import StockMovement
+from src.schemas.bulk import BulkRowResult
 from src.schemas.stock import StockCreate, StockUpdate
+from src.schemas.stock_movement import StockMovementCreate
+from src.utils.bulk import bulk_upsert, dedupe_rows
+from src.utils.collection_version import bump_collections
 from src.utils.logger import logger
 
 
@@ -12,7 +23,9 @@ def create_stock(db: Session, stock: StockCreate) -> Stock:
     try:
         db_stock = Stock(**stock.model_dump())
         db.add(db_stock)
+        refresh_stock_alerts(db, [(stock.item_id, stock.locker_id)])
         db.commit()
+        bump_collections("stock")
         db.refresh(db_stock)
         logger.success(f"Stock created successfully with ID: {db_stock.id}")
         return db_stock
@@ -26,11 +39,88 @@ def create_stock(db: Session, stock: StockCreate) -> Stock:
         raise
 
 
-def get_stocks(db: Session, skip: int = 0, limit: int = 100) -> list[Stock]:
-    """Retrieve a list of stock entries from the database."""
+def bulk_upsert_stock(
+    db: Session, rows: list[tuple[int, StockCreate]]
+) -> list[BulkRowResult]:
+    """
+    Create or update many stock entries at once, matched on (item_id, locker_id).
+
+    Items and lockers are each checked with a single query; rows pointing to
+    an unknown item or locker are reported as errors and skipped.
+    """
+    logger.info(f"Bulk upserting {len(rows)} stock entries")
+
+    try:
+        item_ids = {stock.item_id for _, stock in rows}
+        locker_ids = {stock.locker_id for _, stock in rows}
+        known_items = {
+            iid for (iid,) in db.query(Items.id).filter(Items.id.in_(item_ids))
+        }
+        known_lockers = {
+            lid for (lid,) in db.query(Lockers.id).filter(Lockers.id.in_(locker_ids))
+        }
+
+        results: list[BulkRowResult] = []
+        valid: list[tuple[int, StockCreate]] = []
+        for index, stock in rows:
+            if stock.item_id not in known_items:
+                results.append(
+                    BulkRowResult(index=index, status="error", detail="Item not found")
+                )
+            elif stock.locker_id not in known_lockers:
+                results.append(
+                    BulkRowResult(
+                        index=index, status="error", detail="Locker not found"
+                    )
+                )
+            else:
+                valid.append((index, stock))
+
+        valid, duplicates = dedupe_rows(
+            valid, lambda s: (s.item_id, s.locker_id), "item/locker pair"
+        )
+        results.extend(duplicates)
+
+        ids, existing = bulk_upsert(
+            db,
+            Stock,
+            [stock.model_dump() for _, stock in valid],
+            key_columns=["item_id", "locker_id"],
+            update_columns=["quantity", "unit_measure"],
+        )
+        refresh_stock_alerts(db, ids.keys())
+        db.commit()
+        bump_collections("stock")
+
+        for index, stock in valid:
+            key = (stock.item_id, stock.locker_id)
+            results.append(
+                BulkRowResult(
+                    index=index,
+                    status="updated" if key in existing else "created",
+                    id=ids[key],
+                )
+            )
+
+        logger.success(f"Bulk upsert of stock done ({len(valid)}/{len(rows)} rows)")
+        return results
+
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to bulk upsert stock: {e}")
+        db.rollback()
+        raise
+
+
+def get_stocks(
+    db: Session, skip: int = 0, limit: int = 100, since: datetime | None = None
+) -> list[Stock]:
+    """Retrieve a list of stock entries, optionally only those updated after `since`."""
     logger.debug(f"Fetching stocks with skip={skip} and limit={limit}")
     try:
-        stocks = db.query(Stock).offset(skip).limit(limit).all()
+        query = db.query(Stock)
+        if since is not None:
+            query = query.filter(Stock.updated_at > since)
+        stocks = query.offset(skip).limit(limit).all()
         logger.info(f"Fetched {len(stocks)} stock entries successfully")
         return stocks
     except SQLAlchemyError as e:
@@ -59,11 +149,16 @@ def update_stock(db: Session, stock_id: int, stock_update: StockUpdate) -> Stock
             logger.warning(f"Stock with ID {stock_id} not found. Cannot update.")
             return None
 
+        previous_pair = (db_stock.item_id, db_stock.locker_id)
         update_data = stock_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_stock, key, value)
 
+        refresh_stock_alerts(
+            db, [previous_pair, (db_stock.item_id, db_stock.locker_id)]
+        )
         db.commit()
+        bump_collections("stock")
         db.refresh(db_stock)
         logger.success(f"Stock with ID {stock_id} updated successfully")
         return db_stock
@@ -87,7 +182,9 @@ def delete_stock(db: Session, stock_id: int) -> Stock | None:
             return None
 
         db.delete(db_stock)
+        refresh_stock_alerts(db, [(db_stock.item_id, db_stock.locker_id)])
         db.commit()
+        bump_collections("stock")
         logger.success(f"Stock with ID {stock_id} deleted successfully")
         return db_stock
     except SQLAlchemyError as e:
@@ -98,3 +195,93 @@ def delete_stock(db: Session, stock_id: int) -> Stock | None:
         logger.error(f"Unexpected error while deleting stock with ID {stock_id}: {e}")
         db.rollback()
         raise
+
+
+def apply_stock_movements(
+    db: Session, movements: list[StockMovementCreate], actor: str | None = None
+) -> list[StockMovement]:
+    """
+    Apply relative quantity changes and append them to the stock_movements ledger.
+
+    Each change is a single conditional UPDATE … RETURNING, so concurrent
+    movements on the same entry never overwrite each other and no row lock is
+    held between requests. The whole batch is committed in one transaction
+    together with its ledger rows (one multi-row INSERT).
+
+    Raises:
+        LookupError: If a stock entry does not exist
+        ValueError: If a movement would make a quantity negative
+    """
+    logger.info(f"Applying {len(movements)} stock movement(s)")
+    try:
+        ledger: list[dict] = []
+        for movement in movements:
+            new_quantity = func.coalesce(Stock.quantity, 0) + movement.delta
+            row = db.execute(
+                update(Stock)
+                .where(Stock.id == movement.stock_id, new_quantity >= 0)
+                .values(quantity=new_quantity, updated_at=func.now())
+                .returning(Stock.quantity, Stock.item_id, Stock.locker_id)
+                .execution_options(synchronize_session=False)
+            ).first()
+
+            if row is None:
+                exists = (
+                    db.query(Stock.id).filter(Stock.id == movement.stock_id).first()
+                )
+                db.rollback()
+                if not exists:
+                    logger.warning(f"Stock with ID {movement.stock_id} not found")
+                    raise LookupError(f"Stock entry {movement.stock_id} not found")
+                logger.warning(
+                    f"Insufficient stock for ID {movement.stock_id} "
+                    f"(delta={movement.delta})"
+                )
+                raise ValueError(f"Insufficient stock for entry {movement.stock_id}")
+
+            ledger.append(
+                {
+                    "stock_id": movement.stock_id,
+                    "item_id": row.item_id,
+                    "locker_id": row.locker_id,
+                    "delta": movement.delta,
+                    "quantity_after": row.quantity,
+                    "reason": movement.reason,
+                    "actor": actor,
+                }
+            )
+
+        db_movements = list(
+            db.scalars(insert(StockMovement).returning(StockMovement), ledger)
+        )
+        refresh_stock_alerts(db, {(m["item_id"], m["locker_id"]) for m in ledger})
+        db.commit()
+        bump_collections("stock")
+        logger.success(f"{len(db_movements)} stock movement(s) recorded")
+        return db_movements
+
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to apply stock movements: {e}")
+        db.rollback()
+        raise
+
+
+def get_stock_movements(
+    db: Session, stock_id: int, skip: int = 0, limit: int = 100
+) -> list[StockMovement]:
+    """Retrieve the movement history of a stock entry, newest first."""
+    logger.debug(
+        f"Fetching movements for stock ID {stock_id} (skip={skip}, limit={limit})"
+    )
+    try:
+        return (
+            db.query(StockMovement)
+            .filter(StockMovement.stock_id == stock_id)
+            .order_by(StockMovement.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to fetch movements for stock ID {stock_id}: {e}")
+        raise
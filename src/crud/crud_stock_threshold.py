@@ -0,0 +1,162 @@
+from collections.abc import Iterable
+
+from sqlalchemy import and_, func, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.models.stock import Stock
+from src.models.stock_threshold import StockAlert, StockThreshold
+from src.schemas.stock_threshold import StockThresholdSet
+from src.utils.bulk import bulk_upsert, chunked
+from src.utils.logger import logger
+
+
+def refresh_stock_alerts(db: Session, pairs: Iterable[tuple[int, int]]) -> None:
+    """
+    Re-evaluate the thresholds of the given (item_id, locker_id) pairs.
+
+    Called by every stock and threshold write with the pairs it touched, so
+    the stock_alerts set stays up to date without scanning the stock table.
+    A pair without a stock entry counts as quantity 0. Runs inside the
+    caller's transaction and does not commit.
+    """
+    pairs = list(set(pairs))
+    if not pairs:
+        return
+
+    db.flush()
+    for chunk in chunked(pairs):
+        rows = (
+            db.query(
+                StockThreshold.item_id,
+                StockThreshold.locker_id,
+                StockThreshold.min_quantity,
+                Stock.id.label("stock_id"),
+                func.coalesce(Stock.quantity, 0).label("quantity"),
+            )
+            .outerjoin(
+                Stock,
+                and_(
+                    Stock.item_id == StockThreshold.item_id,
+                    Stock.locker_id == StockThreshold.locker_id,
+                ),
+            )
+            .filter(tuple_(StockThreshold.item_id, StockThreshold.locker_id).in_(chunk))
+            .all()
+        )
+        below = [r for r in rows if r.quantity < r.min_quantity]
+        cleared = set(chunk) - {(r.item_id, r.locker_id) for r in below}
+
+        if cleared:
+            db.query(StockAlert).filter(
+                tuple_(StockAlert.item_id, StockAlert.locker_id).in_(cleared)
+            ).delete(synchronize_session=False)
+        if below:
+            bulk_upsert(
+                db,
+                StockAlert,
+                [
+                    {
+                        "item_id": r.item_id,
+                        "locker_id": r.locker_id,
+                        "stock_id": r.stock_id,
+                        "quantity": r.quantity,
+                        "min_quantity": r.min_quantity,
+                    }
+                    for r in below
+                ],
+                key_columns=["item_id", "locker_id"],
+                update_columns=["stock_id", "quantity", "min_quantity"],
+            )
+
+    logger.debug(f"Stock alerts refreshed for {len(pairs)} item/locker pair(s)")
+
+
+def get_stock_alerts(
+    db: Session, locker_id: int | None = None, skip: int = 0, limit: int = 100
+) -> list[StockAlert]:
+    """Retrieve the entries currently below their threshold, oldest first."""
+    logger.debug(f"Fetching stock alerts (locker_id={locker_id})")
+    try:
+        query = db.query(StockAlert)
+        if locker_id is not None:
+            query = query.filter(StockAlert.locker_id == locker_id)
+        return (
+            query.order_by(StockAlert.triggered_at, StockAlert.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to fetch stock alerts: {e}")
+        raise
+
+
+def get_stock_thresholds(
+    db: Session, locker_id: int | None = None, skip: int = 0, limit: int = 100
+) -> list[StockThreshold]:
+    """Retrieve stock thresholds, optionally filtered by locker."""
+    logger.debug(f"Fetching stock thresholds (locker_id={locker_id})")
+    try:
+        query = db.query(StockThreshold)
+        if locker_id is not None:
+            query = query.filter(StockThreshold.locker_id == locker_id)
+        return query.order_by(StockThreshold.id).offset(skip).limit(limit).all()
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to fetch stock thresholds: {e}")
+        raise
+
+
+def set_stock_threshold(db: Session, threshold: StockThresholdSet) -> StockThreshold:
+    """Create or replace the threshold of an (item, locker) pair."""
+    logger.info(
+        f"Setting threshold {threshold.min_quantity} for item {threshold.item_id}"
+        f" in locker {threshold.locker_id}"
+    )
+    try:
+        db_threshold = (
+            db.query(StockThreshold)
+            .filter(
+                StockThreshold.item_id == threshold.item_id,
+                StockThreshold.locker_id == threshold.locker_id,
+            )
+            .first()
+        )
+        if db_threshold:
+            db_threshold.min_quantity = threshold.min_quantity
+        else:
+            db_threshold = StockThreshold(**threshold.model_dump())
+            db.add(db_threshold)
+
+        refresh_stock_alerts(db, [(threshold.item_id, threshold.locker_id)])
+        db.commit()
+        db.refresh(db_threshold)
+        logger.success(f"Threshold saved with ID: {db_threshold.id}")
+        return db_threshold
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to set stock threshold: {e}")
+        db.rollback()
+        raise
+
+
+def delete_stock_threshold(db: Session, threshold_id: int) -> StockThreshold | None:
+    """Delete a threshold and its alert, if any."""
+    logger.warning(f"Attempting to delete stock threshold with ID: {threshold_id}")
+    try:
+        db_threshold = (
+            db.query(StockThreshold).filter(StockThreshold.id == threshold_id).first()
+        )
+        if not db_threshold:
+            logger.warning(f"Stock threshold with ID {threshold_id} not found.")
+            return None
+
+        pair = (db_threshold.item_id, db_threshold.locker_id)
+        db.delete(db_threshold)
+        refresh_stock_alerts(db, [pair])
+        db.commit()
+        logger.success(f"Stock threshold with ID {threshold_id} deleted successfully")
+        return db_threshold
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to delete stock threshold with ID {threshold_id}: {e}")
+        db.rollback()
+        raise
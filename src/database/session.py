@@ -1,15 +1,27 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+_engine: Engine | None = None
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Bound to the engine by get_engine(), which the application lifespan calls
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def get_engine() -> Engine:
+    """Create the engine on first use (this imports the database driver)."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(settings.DATABASE_URL)
+        SessionLocal.configure(bind=_engine)
+    return _engine
 
 
 def get_db():
     """Get a database session."""
+    get_engine()
     db = SessionLocal()
     try:
         yield db
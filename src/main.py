@@ -1,79 +1,73 @@
+"""
+Application entry point
+=======================
+- create_app(settings) : builds the FastAPI application
+- app                  : default application, built on first access
+
+Importing this module has no side effect: the routers, the database engine
+and the logging setup are only loaded by create_app() and its lifespan, so
+scripts and tests that do not serve HTTP do not pay for them. Both
+`uvicorn src.main:app` and `uvicorn src.main:create_app --factory` work.
+"""
+
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from slowapi.util import get_remote_address
-
-from src.core.config import settings
-from src.routes import (
-    access_log,
-    auth,
-    badge,
-    categories,
-    items,
-    locker_permission,
-    lockers,
-    roles,
-    roles_crud,
-    stock,
-    users,
-)
-from src.utils.logger import logger, setup_logger
-from src.utils.middleware_logger import LoggingMiddleware
 
-# Initialize limiter
-limiter = Limiter(key_func=get_remote_address)
+from src.core.config import Settings
+from src.core.config import settings as default_settings
+from src.core.rate_limit import limiter
+from src.utils.logger import logger, setup_logger
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from src.core.badge_feed import pending_card_hub
+    from src.core.badge_retention import pending_card_retention_loop
+    from src.core.health import health_probe_loop
+    from src.core.warmup import run_warmup, warmup_state
+    from src.database.session import SessionLocal, get_engine
+    from src.utils.pg_notify import pg_listener
+
+    settings = app.state.settings
     logger.info("🚀 Starting application...")
     # Les tables sont créées par Alembic (alembic upgrade head)
     # Ne pas utiliser Base.metadata.create_all() pour éviter les conflits
+    engine = get_engine()
+    warmup = None
+    if settings.WARMUP_ENABLED:
+        # En tâche de fond : /health répond pendant le warm-up, /health/ready
+        # seulement une fois les caches remplis
+        warmup = asyncio.create_task(run_warmup(engine, SessionLocal))
+    else:
+        warmup_state.ready = True
+    if settings.PG_NOTIFY_ENABLED:
+        pg_listener.start(engine)
+    retention = None
+    if settings.PENDING_CARD_RETENTION_DAYS > 0:
+        retention = asyncio.create_task(pending_card_retention_loop())
+    probes = None
+    if settings.HEALTH_PROBE_INTERVAL_SECONDS > 0:
+        probes = asyncio.create_task(
+            health_probe_loop(engine, settings.HEALTH_PROBE_INTERVAL_SECONDS)
+        )
     logger.success("✅ Application startup complete.")
     yield
 
     logger.info("🛑 Shutting down application...")
+    for task in (warmup, retention, probes):
+        if task is not None:
+            task.cancel()
+    pg_listener.stop()
+    pending_card_hub.close()
     logger.success("✅ Application shutdown complete.")
 
 
-app = FastAPI(
-    title="Smartlock API",
-    description="API for managing smart locks, categories, and items.",
-    version="0.1.0",
-    docs_url="/docs",
-    lifespan=lifespan,
-)
-
-# Configure rate limiter
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
-app.add_middleware(SlowAPIMiddleware)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Add logging middleware
-app.add_middleware(
-    LoggingMiddleware,
-    log_request_body=False,
-    log_response_body=False,
-)
-
-
 # Redirect uvicorn logs to Loguru
 class InterceptHandler(logging.Handler):
     """
@@ -98,16 +92,16 @@ class InterceptHandler(logging.Handler):
         )
 
 
-# Setup logging intercept for uvicorn and other libraries
-logging.root.handlers = [InterceptHandler()]
-logging.root.setLevel(logging.INFO)
+def intercept_std_logging() -> None:
+    """Setup logging intercept for uvicorn and other libraries"""
+    logging.root.handlers = [InterceptHandler()]
+    logging.root.setLevel(logging.INFO)
 
-for name in logging.root.manager.loggerDict.keys():
-    logging.getLogger(name).handlers = []
-    logging.getLogger(name).propagate = True
+    for name in logging.root.manager.loggerDict.keys():
+        logging.getLogger(name).handlers = []
+        logging.getLogger(name).propagate = True
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """
     Handle validation errors with logging
@@ -139,7 +133,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-@app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """
     Handle general exceptions with logging
@@ -156,37 +149,96 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-@app.get("/health", tags=["System"])
-@limiter.limit("60/minute")  # Changed to 60/minute for reasonable testing
-def health_check(request: Request):
-    logger.info("Health check endpoint called")
-    return {"status": "healthy", "service": "Smartlock API", "version": "0.1.0"}
-
-
-@app.get("/", tags=["System"])
-@limiter.limit("100/minute")
-def root(request: Request):
-    logger.info("Root endpoint called")
-    return {
-        "message": "Welcome to the Smartlock API",
-        "docs": "/docs",
-        "health": "/health",
-        "version": "0.1.0",
-    }
-
-
-app.include_router(categories.router)
-app.include_router(items.router)
-app.include_router(lockers.router)
-app.include_router(stock.router)
-app.include_router(locker_permission.router)
-app.include_router(badge.router)
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(users.lifecycle_router)
-app.include_router(roles.router)
-app.include_router(roles_crud.router)
-app.include_router(access_log.router)
+def create_app(settings: Settings | None = None) -> FastAPI:
+    """Build the application; `settings` drives the app-level options."""
+    from fastapi.middleware.cors import CORSMiddleware
+    from slowapi import _rate_limit_exceeded_handler
+    from slowapi.errors import RateLimitExceeded
+    from slowapi.middleware import SlowAPIMiddleware
+
+    from src.routes import (
+        access_log,
+        auth,
+        badge,
+        categories,
+        items,
+        locker_permission,
+        lockers,
+        roles,
+        roles_crud,
+        stock,
+        system,
+        users,
+    )
+    from src.utils.liveness import LivenessMiddleware
+    from src.utils.middleware_logger import LoggingMiddleware
+
+    settings = settings or default_settings
+
+    app = FastAPI(
+        title="Smartlock API",
+        description="API for managing smart locks, categories, and items.",
+        version="0.1.0",
+        docs_url="/docs",
+        lifespan=lifespan,
+    )
+    app.state.settings = settings
+
+    # Configure rate limiter
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+    app.add_middleware(SlowAPIMiddleware)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        # Pagination and conditional GET headers read by the dashboard
+        expose_headers=["ETag", "X-Next-Cursor"],
+    )
+
+    # Add logging middleware
+    app.add_middleware(
+        LoggingMiddleware,
+        log_request_body=False,
+        log_response_body=False,
+        exclude_paths=("/health/ready",),
+    )
+
+    # Outermost: liveness polls skip logging, rate limiting and CORS
+    app.add_middleware(LivenessMiddleware)
+
+    intercept_std_logging()
+
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, general_exception_handler)
+
+    app.include_router(system.router)
+    app.include_router(categories.router)
+    app.include_router(items.router)
+    app.include_router(lockers.router)
+    app.include_router(stock.router)
+    app.include_router(locker_permission.router)
+    app.include_router(badge.router)
+    app.include_router(auth.router)
+    app.include_router(users.router)
+    app.include_router(users.lifecycle_router)
+    app.include_router(roles.router)
+    app.include_router(roles_crud.router)
+    app.include_router(access_log.router)
+    return app
+
+
+def __getattr__(name: str):
+    # `src.main:app` (uvicorn, tests) builds the default application on first use
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,13 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from src.database.base import Base
@@ -18,6 +27,15 @@ class Items(Base):
     updated_at = Column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now()
     )
+    # Text matched by /items/search (trigram and full-text indexes on PostgreSQL)
+    search_document = Column(
+        Text,
+        Computed(
+            "coalesce(name, '') || ' ' || coalesce(reference, '')"
+            " || ' ' || coalesce(description, '')",
+            persisted=True,
+        ),
+    )
 
     stock = relationship("Stock", back_populates="item")
     category = relationship("Categories", back_populates="items")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
 
 from src.database.base import Base
 
@@ -10,3 +10,9 @@ class PendingCard(Base):
     card_id = Column(String, unique=True, index=True, nullable=False)
     scanned_at = Column(DateTime(timezone=True), default=func.now())
     status = Column(String, default="pending")
+    assigned_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Keyset pagination of the pending list (newest first)
+    __table_args__ = (
+        Index("ix_pending_cards_status_scanned_at", "status", "scanned_at", "id"),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+
+from src.database.base import Base
+
+
+class StockMovement(Base):
+    """Append-only ledger of stock quantity changes."""
+
+    __tablename__ = "stock_movements"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # Kept (set to NULL) when the stock entry is deleted so history survives
+    stock_id = Column(
+        Integer, ForeignKey("stock.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+    item_id = Column(Integer, nullable=False)
+    locker_id = Column(Integer, nullable=False)
+    delta = Column(Integer, nullable=False)
+    quantity_after = Column(Integer, nullable=False)
+    reason = Column(String(255), nullable=True)
+    actor = Column(String, nullable=True)  # sub Keycloak de l'auteur
+    created_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
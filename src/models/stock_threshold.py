@@ -0,0 +1,63 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+    func,
+)
+
+from src.database.base import Base
+
+
+class StockThreshold(Base):
+    """Minimum quantity expected for an item in a locker."""
+
+    __tablename__ = "stock_thresholds"
+
+    id = Column(Integer, primary_key=True, index=True)
+    item_id = Column(
+        Integer, ForeignKey("items.id", ondelete="CASCADE"), nullable=False
+    )
+    locker_id = Column(
+        Integer, ForeignKey("lockers.id", ondelete="CASCADE"), nullable=False
+    )
+    min_quantity = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("item_id", "locker_id", name="unique_threshold_item_locker"),
+    )
+
+
+class StockAlert(Base):
+    """
+    Materialized set of (item, locker) pairs currently below their threshold.
+
+    Maintained incrementally by refresh_stock_alerts() on every stock or
+    threshold write, so reading alerts never scans the stock table.
+    """
+
+    __tablename__ = "stock_alerts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    item_id = Column(
+        Integer, ForeignKey("items.id", ondelete="CASCADE"), nullable=False
+    )
+    locker_id = Column(
+        Integer, ForeignKey("lockers.id", ondelete="CASCADE"), nullable=False
+    )
+    stock_id = Column(Integer, nullable=True)  # NULL si l'article est absent
+    quantity = Column(Integer, nullable=False)
+    min_quantity = Column(Integer, nullable=False)
+    triggered_at = Column(DateTime(timezone=True), default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("item_id", "locker_id", name="unique_alert_item_locker"),
+    )
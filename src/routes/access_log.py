@@ -1,17 +1,21 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from src.core.keycloak import require_codir_or_admin
 from src.crud.crud_access_log import get_access_logs
 from src.database.session import get_db
 from src.schemas.access_log import AccessLogResponse
+from src.utils.fast_json import fast_json_response
 
 router = APIRouter(
     prefix="/logs", tags=["Audit Logs"], dependencies=[Depends(require_codir_or_admin)]
 )
 
+_ACCESS_LOG_LIST = TypeAdapter(List[AccessLogResponse])
+
 
 @router.get("/", response_model=List[AccessLogResponse])
 def read_logs(
@@ -20,4 +24,5 @@ def read_logs(
     locker_id: Optional[int] = None,
     db: Session = Depends(get_db),
 ):
-    return get_access_logs(db, skip=skip, limit=limit, locker_id=locker_id)
+    logs = get_access_logs(db, skip=skip, limit=limit, locker_id=locker_id)
+    return fast_json_response(logs, _ACCESS_LOG_LIST)
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src.core.keycloak import require_locker_client
 from src.utils.card_hash import hash_card_id
@@ -51,6 +52,20 @@ def _effective_permission(role_permissions: list[Locker_Permission], now: dateti
     return best
 
 
+# DB work runs in the threadpool: waiting for a connection of a saturated pool
+# must not block the event loop, which the other requests need to release theirs
+async def _log_access(db: Session, **fields) -> None:
+    await run_in_threadpool(create_access_log, db, AccessLogCreate(**fields))
+
+
+def _role_permissions(db: Session, locker_id: int,
+                      roles: list[str]) -> list[Locker_Permission]:
+    return (db.query(Locker_Permission)
+            .filter(Locker_Permission.locker_id == locker_id)
+            .filter(Locker_Permission.role_name.in_(roles))
+            .all())
+
+
 @router.post("/locker/{locker_id}/check", response_model=LockerCheckResponse)
 async def check_locker_access(
     locker_id: int,
@@ -68,14 +83,14 @@ async def check_locker_access(
         raise
     except Exception as e:
         logger.error(f"Erreur Keycloak (find_user_by_card_id): {e}")
-        create_access_log(db, AccessLogCreate(locker_id=locker_id, card_id=card_id,
-                                               result="denied", reason="keycloak_error"))
+        await _log_access(db, locker_id=locker_id, card_id=card_id,
+                          result="denied", reason="keycloak_error")
         return LockerCheckResponse(allowed=False, reason="keycloak_error")
 
     if not user:
         logger.warning(f"Carte {card_id} non enregistrée dans Keycloak.")
-        create_access_log(db, AccessLogCreate(locker_id=locker_id, card_id=card_id,
-                                               result="denied", reason="card_not_registered"))
+        await _log_access(db, locker_id=locker_id, card_id=card_id,
+                          result="denied", reason="card_not_registered")
         return LockerCheckResponse(allowed=False, reason="card_not_registered")
 
     # 2. Check account is active (divergence #10)
@@ -83,9 +98,9 @@ async def check_locker_access(
         user_id = user["id"]
         display_name = (f"{user.get('firstName','')} {user.get('lastName','')}".strip()
                         or user.get("username", "Utilisateur inconnu"))
-        create_access_log(db, AccessLogCreate(locker_id=locker_id, card_id=card_id,
-                                               user_id=user_id, username=display_name,
-                                               result="denied", reason="account_revoked"))
+        await _log_access(db, locker_id=locker_id, card_id=card_id,
+                          user_id=user_id, username=display_name,
+                          result="denied", reason="account_revoked")
         return LockerCheckResponse(allowed=False, display_name=display_name, reason="account_revoked")
 
     user_id = user["id"]
@@ -99,17 +114,15 @@ async def check_locker_access(
         raise
     except Exception as e:
         logger.error(f"Erreur Keycloak (get_user_effective_roles): {e}")
-        create_access_log(db, AccessLogCreate(locker_id=locker_id, card_id=card_id,
-                                               user_id=user_id, username=display_name,
-                                               result="denied", reason="keycloak_error"))
+        await _log_access(db, locker_id=locker_id, card_id=card_id,
+                          user_id=user_id, username=display_name,
+                          result="denied", reason="keycloak_error")
         return LockerCheckResponse(allowed=False, display_name=display_name, reason="keycloak_error")
 
     # 4. Get locker permissions and consolidate
     try:
-        locker_permissions = (db.query(Locker_Permission)
-                              .filter(Locker_Permission.locker_id == locker_id)
-                              .filter(Locker_Permission.role_name.in_(roles))
-                              .all())
+        locker_permissions = await run_in_threadpool(_role_permissions, db,
+                                                     locker_id, roles)
     except Exception as e:
         logger.error(f"Erreur DB (locker_permissions): {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Erreur base de données")
@@ -122,13 +135,13 @@ async def check_locker_access(
     reason = None if allowed else "no_permission"
 
     # 6. Audit log
-    create_access_log(db, AccessLogCreate(
-        locker_id=locker_id, card_id=card_id,
+    await _log_access(
+        db, locker_id=locker_id, card_id=card_id,
         user_id=user_id, username=display_name,
         result="allowed" if allowed else "denied", reason=reason,
         can_open=allowed,
         can_view=best_level is not None,
-    ))
+    )
 
     if allowed:
         logger.info(f"Accès AUTORISÉ au casier {locker_id} pour {display_name}")
@@ -1,20 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from datetime import datetime
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from src.core.badge_feed import announce_pending_cards, pending_card_hub
 from src.core.keycloak import require_admin, require_nfc_scanner
+from src.crud.crud_pending_card import (
+    assign_cards,
+    get_card_status,
+    get_pending_cards_after,
+    get_pending_cards_page,
+    register_scans,
+)
 from src.database.session import get_db
 from src.models.pending_card import PendingCard
 from src.schemas.pending_card import (
+    AssignCardsRequest,
+    AssignCardsResponse,
     PendingCardResponse,
+    ScanBatchRequest,
+    ScanBatchResponse,
+    ScanBatchResult,
     ScanCardRequest,
     ScanCardResponse,
 )
 from src.utils.card_hash import hash_card_id
+from src.utils.event_hub import format_sse
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/badge", tags=["Badge"])
 
+# Commentaire SSE envoyé sans activité, pour garder la connexion ouverte
+SSE_KEEPALIVE_SECONDS = 15.0
+
 
 # -------------------------------------------------------------------
 # POST /badge/scan — réservé au service account nfc-scanner
@@ -33,31 +65,27 @@ async def scan_card(
     """
     Reçoit un card_id scanné par le module NFC et le stocke en DB.
     Protégé par le service account nfc-scanner (client_credentials).
+    L'insertion et la détection d'un doublon se font en une seule requête :
+    deux scans simultanés de la même carte donnent un 201 et un 409.
     """
     card_hash = hash_card_id(body.card_id)
     logger.info(f"Scan reçu : card_id={card_hash}")
 
     try:
-        # Vérifier si la carte existe déjà
-        existing = (
-            db.query(PendingCard).filter(PendingCard.card_id == card_hash).first()
-        )
-
-        if existing:
+        rows = await run_in_threadpool(register_scans, db, [card_hash])
+        if not rows:
+            # Chemin rare : relire le statut uniquement pour le message
+            card_status = await run_in_threadpool(get_card_status, db, card_hash)
             logger.warning(
-                f"card_id={card_hash} déjà enregistré (status={existing.status})"
+                f"card_id={card_hash} déjà enregistré (status={card_status})"
             )
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail=f"Cette carte est déjà enregistrée (status: {existing.status})",
+                detail=f"Cette carte est déjà enregistrée (status: {card_status})",
             )
 
-        card = PendingCard(card_id=card_hash)
-        db.add(card)
-        db.commit()
-        db.refresh(card)
-
         logger.success(f"card_id={card_hash} enregistré avec succès")
+        announce_pending_cards(db, rows)
         return ScanCardResponse(
             success=True,
             message="Carte enregistrée, en attente d'assignation par un admin",
@@ -75,6 +103,57 @@ async def scan_card(
         )
 
 
+# -------------------------------------------------------------------
+# POST /badge/scan/batch — scans mis en tampon par la borne
+# -------------------------------------------------------------------
+@router.post(
+    "/scan/batch",
+    response_model=ScanBatchResponse,
+    summary="Enregistrer plusieurs scans de cartes NFC",
+)
+async def scan_cards_batch(
+    body: ScanBatchRequest,
+    db: Session = Depends(get_db),
+    _: dict = Depends(require_nfc_scanner),
+):
+    """
+    Variante groupée de /badge/scan pour vider le tampon de la borne NFC :
+    une seule requête INSERT pour tout le lot. Chaque carte est rapportée
+    "created" ou "conflict" (déjà enregistrée ou répétée dans le lot).
+    """
+    card_hashes = [hash_card_id(card_id) for card_id in body.card_ids]
+    logger.info(f"Lot de {len(card_hashes)} scan(s) reçu")
+
+    try:
+        rows = await run_in_threadpool(register_scans, db, card_hashes)
+    except SQLAlchemyError as e:
+        logger.error(f"Erreur DB lors du scan groupé : {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erreur lors de l'enregistrement des cartes",
+        )
+    announce_pending_cards(db, rows)
+
+    created = {row.card_id for row in rows}
+
+    results = []
+    for card_hash in card_hashes:
+        is_new = card_hash in created
+        created.discard(card_hash)  # une répétition dans le lot est un conflit
+        results.append(
+            ScanBatchResult(
+                card_id=card_hash, status="created" if is_new else "conflict"
+            )
+        )
+    created_count = sum(r.status == "created" for r in results)
+    logger.success(f"{created_count} carte(s) enregistrée(s) sur {len(results)}")
+    return ScanBatchResponse(
+        created=created_count,
+        conflicts=len(results) - created_count,
+        results=results,
+    )
+
+
 # -------------------------------------------------------------------
 # GET /badge/pending — réservé aux admins Keycloak
 # -------------------------------------------------------------------
@@ -84,20 +163,25 @@ async def scan_card(
     summary="Lister les cartes en attente d'assignation",
 )
 async def get_pending_cards(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = Query(
+        None, description="Valeur de X-Next-Cursor de la page précédente"
+    ),
     db: Session = Depends(get_db),
     _: dict = Depends(require_admin),
 ):
     """
-    Retourne toutes les cartes scannées avec status 'pending'.
+    Retourne les cartes scannées avec status 'pending', les plus récentes
+    d'abord, par pages de `limit`. S'il reste des cartes, l'en-tête
+    X-Next-Cursor donne le curseur de la page suivante.
     Protégé — réservé aux administrateurs Keycloak.
     """
+    before = _decode_cursor(cursor) if cursor else None
     try:
-        cards = (
-            db.query(PendingCard)
-            .filter(PendingCard.status == "pending")
-            .order_by(PendingCard.scanned_at.desc())
-            .all()
-        )
+        cards = get_pending_cards_page(db, limit=limit, before=before)
+        if len(cards) == limit:
+            response.headers["X-Next-Cursor"] = _encode_cursor(cards[-1])
 
         logger.info(f"{len(cards)} carte(s) en attente")
         return cards
@@ -110,6 +194,124 @@ async def get_pending_cards(
         )
 
 
+# -------------------------------------------------------------------
+# GET /badge/pending/stream — flux SSE des nouvelles cartes
+# -------------------------------------------------------------------
+@router.get(
+    "/pending/stream",
+    response_class=StreamingResponse,
+    summary="Flux en direct des cartes en attente (Server-Sent Events)",
+)
+async def stream_pending_cards(
+    request: Request,
+    last_event_id: str | None = Header(None),
+    db: Session = Depends(get_db),
+    _: dict = Depends(require_admin),
+):
+    """
+    Pousse chaque nouvelle carte en attente (événement `pending_card`, id =
+    id de la carte) dès que le scan est enregistré. À la reconnexion, le
+    navigateur renvoie Last-Event-ID et les cartes manquées sont rejouées
+    depuis la base.
+    """
+    # Abonnement avant la lecture du rattrapage : aucune carte ne peut
+    # tomber entre les deux (une carte reçue deux fois n'est envoyée qu'une fois)
+    queue = pending_card_hub.subscribe()
+    try:
+        backlog = []
+        if last_event_id is not None and last_event_id.isdigit():
+            backlog = get_pending_cards_after(db, int(last_event_id))
+    except SQLAlchemyError as e:
+        pending_card_hub.unsubscribe(queue)
+        logger.error(f"Erreur DB lors du rattrapage du flux : {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erreur lors de la récupération des cartes",
+        )
+    finally:
+        # Rend la connexion au pool : le flux peut rester ouvert des heures
+        db.close()
+
+    async def events():
+        replayed = {card.id for card in backlog}
+        try:
+            for card in backlog:
+                yield _card_event(PendingCardResponse.model_validate(card))
+            while not await request.is_disconnected():
+                try:
+                    card = await asyncio.wait_for(
+                        queue.get(), timeout=SSE_KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if card is None:
+                    break
+                if card.id not in replayed:
+                    yield _card_event(card)
+        finally:
+            pending_card_hub.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _card_event(card: PendingCardResponse) -> str:
+    return format_sse(card.model_dump_json(), event_id=card.id, event="pending_card")
+
+
+def _encode_cursor(card: PendingCard) -> str:
+    return f"{card.scanned_at.isoformat()}:{card.id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        scanned_at, card_id = cursor.rsplit(":", 1)
+        return datetime.fromisoformat(scanned_at), int(card_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Curseur invalide"
+        )
+
+
+# -------------------------------------------------------------------
+# PATCH /badge/assign — assigner plusieurs cartes d'un coup
+# -------------------------------------------------------------------
+@router.patch(
+    "/assign",
+    response_model=AssignCardsResponse,
+    summary="Marquer plusieurs cartes comme assignées",
+)
+async def mark_cards_assigned(
+    body: AssignCardsRequest,
+    db: Session = Depends(get_db),
+    _: dict = Depends(require_admin),
+):
+    """
+    Variante groupée de PATCH /badge/{card_id}/assign, en une seule requête
+    UPDATE. Les card_id inconnus sont listés dans `not_found`.
+    """
+    try:
+        rows = await run_in_threadpool(assign_cards, db, body.card_ids)
+    except SQLAlchemyError as e:
+        logger.error(f"Erreur DB lors de l'assignation groupée : {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erreur lors de la mise à jour",
+        )
+
+    assigned = {row.card_id for row in rows}
+    not_found = [c for c in dict.fromkeys(body.card_ids) if c not in assigned]
+    logger.success(f"{len(rows)} carte(s) marquée(s) comme assignée(s)")
+    return AssignCardsResponse(
+        assigned=[PendingCardResponse.model_validate(row) for row in rows],
+        not_found=not_found,
+    )
+
+
 # -------------------------------------------------------------------
 # PATCH /badge/{card_id}/assign — marquer une carte comme assignée
 # -------------------------------------------------------------------
@@ -137,6 +339,7 @@ async def mark_card_assigned(
             )
 
         card.status = "assigned"
+        card.assigned_at = card.assigned_at or func.now()
         db.commit()
         db.refresh(card)
 
@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src.core.keycloak import require_admin, validate_jwt
 from src.crud import crud_categories
 from src.database.session import get_db
+from src.schemas.bulk import BulkUpsertResponse
 from src.schemas.categories import CategoryCreate, CategoryResponse, CategoryUpdate
+from src.utils.bulk import bulk_request_body, parse_bulk_rows
+from src.utils.collection_version import not_modified
 from src.utils.logger import logger
+from src.utils.response_cache import cached_json_response
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
+_CATEGORY_LIST = TypeAdapter(list[CategoryResponse])
+
 
 @router.get(
     "/",
@@ -16,15 +26,35 @@ router = APIRouter(prefix="/categories", tags=["Categories"])
     dependencies=[Depends(validate_jwt)],
 )
 def read_categories(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1),
+    since: datetime | None = Query(
+        None, description="Only return categories updated after this timestamp"
+    ),
     db: Session = Depends(get_db),
 ):
     """Retrieve a list of categories."""
     logger.debug(f"GET /categories called with skip={skip} and limit={limit}")
 
+    unchanged = not_modified(request, response, "categories")
+    if unchanged:
+        return unchanged
+
     try:
-        categories = crud_categories.get_categories(db, skip=skip, limit=limit)
+        if since is None:
+            return cached_json_response(
+                response,
+                "categories",
+                (skip, limit),
+                lambda: crud_categories.get_categories(db, skip=skip, limit=limit),
+                _CATEGORY_LIST,
+            )
+
+        categories = crud_categories.get_categories(
+            db, skip=skip, limit=limit, since=since
+        )
         logger.info(f"Successfully retrieved {len(categories)} categories")
         return categories
 
@@ -78,6 +108,33 @@ def create_category(category: CategoryCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to create category")
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkUpsertResponse,
+    dependencies=[Depends(require_admin)],
+    openapi_extra=bulk_request_body("CategoryCreate"),
+)
+async def bulk_import_categories(request: Request, db: Session = Depends(get_db)):
+    """Create many categories at once from a JSON array or NDJSON."""
+    rows, errors = await parse_bulk_rows(request, CategoryCreate)
+    logger.info(f"POST /categories/bulk called with {len(rows) + len(errors)} rows")
+
+    try:
+        results = await run_in_threadpool(
+            crud_categories.bulk_upsert_categories, db, rows
+        )
+    except Exception as e:
+        logger.exception(f"Error importing categories: {e}")
+        raise HTTPException(status_code=500, detail="Failed to import categories")
+
+    response = BulkUpsertResponse.from_results(errors + results)
+    logger.success(
+        f"Bulk import of categories: {response.created} created, "
+        f"{response.updated} updated, {response.failed} failed"
+    )
+    return response
+
+
 @router.put(
     "/{category_id}",
     response_model=CategoryResponse,
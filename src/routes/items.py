@@ -1,15 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src.core.keycloak import require_admin, validate_jwt
 from src.crud import crud_items
 from src.database.session import get_db
 from src.models.categories import Categories
-from src.schemas.items import ItemCreate, ItemResponse, ItemUpdate
+from src.schemas.bulk import BulkUpsertResponse
+from src.schemas.items import (
+    ItemCreate,
+    ItemResponse,
+    ItemSearchPage,
+    ItemSearchResult,
+    ItemUpdate,
+)
+from src.utils.bulk import bulk_request_body, parse_bulk_rows
+from src.utils.collection_version import not_modified
+from src.utils.fast_json import fast_json_response
 from src.utils.logger import logger
+from src.utils.response_cache import cached_json_response
 
 router = APIRouter(prefix="/items", tags=["Items"])
 
+_ITEM_LIST = TypeAdapter(list[ItemResponse])
+
 
 @router.get(
     "/",
@@ -17,23 +34,90 @@ router = APIRouter(prefix="/items", tags=["Items"])
     dependencies=[Depends(validate_jwt)],
 )
 def read_items(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1),
+    since: datetime | None = Query(
+        None, description="Only return items updated after this timestamp"
+    ),
     db: Session = Depends(get_db),
 ):
     """Retrieve a list of items."""
     logger.debug(f"GET /items called with skip={skip} and limit={limit}")
 
+    unchanged = not_modified(request, response, "items")
+    if unchanged:
+        return unchanged
+
     try:
-        items = crud_items.get_items(db, skip=skip, limit=limit)
+        if since is None:
+            return cached_json_response(
+                response,
+                "items",
+                (skip, limit),
+                lambda: crud_items.get_items(db, skip=skip, limit=limit),
+                _ITEM_LIST,
+            )
+
+        items = crud_items.get_items(db, skip=skip, limit=limit, since=since)
         logger.info(f"Successfully retrieved {len(items)} items")
-        return items
+        return fast_json_response(items, _ITEM_LIST, headers=response.headers)
 
     except Exception as e:
         logger.exception(f"Error retrieving items: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve items")
 
 
+def _encode_cursor(rank: float, item_id: int) -> str:
+    return f"{rank!r}:{item_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        rank, item_id = cursor.split(":", 1)
+        return float(rank), int(item_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid search cursor")
+
+
+@router.get(
+    "/search",
+    response_model=ItemSearchPage,
+    dependencies=[Depends(validate_jwt)],
+)
+def search_items(
+    q: str = Query(..., min_length=1, max_length=100),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """Search items by name, reference, description or category, best match first."""
+    logger.debug(f"GET /items/search called with q={q!r}, cursor={cursor}")
+    after = _decode_cursor(cursor) if cursor else None
+
+    try:
+        rows = crud_items.search_items(db, q=q, limit=limit, after=after)
+        results = [
+            ItemSearchResult(
+                **ItemResponse.model_validate(row.Items).model_dump(),
+                category_name=row.category_name,
+                rank=row.rank,
+            )
+            for row in rows
+        ]
+        next_cursor = None
+        if len(results) == limit:
+            next_cursor = _encode_cursor(results[-1].rank, results[-1].id)
+
+        logger.info(f"Item search for {q!r} returned {len(results)} results")
+        return ItemSearchPage(results=results, next_cursor=next_cursor)
+
+    except Exception as e:
+        logger.exception(f"Error searching items: {e}")
+        raise HTTPException(status_code=500, detail="Failed to search items")
+
+
 @router.get(
     "/{item_id}",
     response_model=ItemResponse,
@@ -82,6 +166,31 @@ def create_item(item: ItemCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to create item")
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkUpsertResponse,
+    dependencies=[Depends(require_admin)],
+    openapi_extra=bulk_request_body("ItemCreate"),
+)
+async def bulk_import_items(request: Request, db: Session = Depends(get_db)):
+    """Create or update many items (matched on reference) from JSON or NDJSON."""
+    rows, errors = await parse_bulk_rows(request, ItemCreate)
+    logger.info(f"POST /items/bulk called with {len(rows) + len(errors)} rows")
+
+    try:
+        results = await run_in_threadpool(crud_items.bulk_upsert_items, db, rows)
+    except Exception as e:
+        logger.exception(f"Error importing items: {e}")
+        raise HTTPException(status_code=500, detail="Failed to import items")
+
+    response = BulkUpsertResponse.from_results(errors + results)
+    logger.success(
+        f"Bulk import of items: {response.created} created, "
+        f"{response.updated} updated, {response.failed} failed"
+    )
+    return response
+
+
 @router.put(
     "/{item_id}",
     response_model=ItemResponse,
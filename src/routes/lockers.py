@@ -1,15 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from src.core.keycloak import require_admin, validate_jwt
 from src.crud import crud_lockers
 from src.database.session import get_db
-from src.schemas.lockers import LockerCreate, LockerResponse, LockerUpdate
+from src.schemas.lockers import (
+    LockerCreate,
+    LockerInventoryPage,
+    LockerResponse,
+    LockerUpdate,
+)
 from src.schemas.stock import StockResponse
+from src.utils.collection_version import not_modified
 from src.utils.logger import logger
+from src.utils.response_cache import cached_json_response
 
 router = APIRouter(prefix="/lockers", tags=["Lockers"])
 
+_LOCKER_LIST = TypeAdapter(list[LockerResponse])
+
 
 @router.get(
     "/",
@@ -17,15 +29,33 @@ router = APIRouter(prefix="/lockers", tags=["Lockers"])
     dependencies=[Depends(validate_jwt)],
 )
 def read_lockers(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1),
+    since: datetime | None = Query(
+        None, description="Only return lockers updated after this timestamp"
+    ),
     db: Session = Depends(get_db),
 ):
     """Retrieve a list of lockers."""
     logger.debug(f"GET /lockers called with skip={skip} and limit={limit}")
 
+    unchanged = not_modified(request, response, "lockers")
+    if unchanged:
+        return unchanged
+
     try:
-        lockers = crud_lockers.get_lockers(db, skip=skip, limit=limit)
+        if since is None:
+            return cached_json_response(
+                response,
+                "lockers",
+                (skip, limit),
+                lambda: crud_lockers.get_lockers(db, skip=skip, limit=limit),
+                _LOCKER_LIST,
+            )
+
+        lockers = crud_lockers.get_lockers(db, skip=skip, limit=limit, since=since)
         logger.info(f"Successfully retrieved {len(lockers)} lockers")
         return lockers
 
@@ -87,6 +117,44 @@ def get_locker_stock(locker_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to retrieve locker stock")
 
 
+@router.get(
+    "/{locker_id}/inventory",
+    response_model=LockerInventoryPage,
+    dependencies=[Depends(validate_jwt)],
+)
+def get_locker_inventory(
+    locker_id: int,
+    after: int | None = Query(None, ge=0, description="Last stock_id of the page"),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """Retrieve a locker's stock with item and category details in one query."""
+    logger.debug(f"GET /lockers/{locker_id}/inventory called (after={after})")
+
+    try:
+        rows = crud_lockers.get_locker_inventory(
+            db, locker_id=locker_id, after=after, limit=limit
+        )
+        # Only an empty first page needs to tell "unknown" from "empty" lockers
+        if not rows and after is None:
+            if crud_lockers.get_locker(db, locker_id=locker_id) is None:
+                logger.warning(f"Locker with ID {locker_id} not found")
+                raise HTTPException(status_code=404, detail="Locker not found")
+
+        next_after = rows[-1].stock_id if len(rows) == limit else None
+        return LockerInventoryPage(
+            locker_id=locker_id, entries=rows, next_after=next_after
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error retrieving inventory for locker {locker_id}: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to retrieve locker inventory"
+        )
+
+
 @router.post(
     "/",
     response_model=LockerResponse,
@@ -2,9 +2,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from src.core.keycloak import validate_jwt
-from src.core.keycloak_admin import add_role_to_user, remove_role_from_user
-from src.crud.crud_role import get_role_by_name, get_roles_for_names
+from src.core.keycloak_admin import (
+    add_role_to_user,
+    apply_role_mappings,
+    remove_role_from_user,
+)
+from src.core.role_catalog import get_role_catalog
 from src.database.session import get_db
+from src.schemas.role import RoleBulkRequest, RoleBulkResponse, RoleBulkResult
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/users", tags=["Role Management"])
@@ -20,21 +25,62 @@ def _check_can_manage_role(
     Rule: caller must have is_manager=True AND tier > target.tier.
     Special case: T5 caller can manage another T5 (no tier above T5).
     """
-    target = get_role_by_name(db, target_role_name)
-    if not target:
+    catalog = get_role_catalog(db)
+    if catalog.get(target_role_name) is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
                             detail=f"Rôle '{target_role_name}' inconnu")
 
-    caller_db_roles = get_roles_for_names(db, caller_roles_in_token)
-    can_manage = any(
-        r.is_manager and (r.tier > target.tier or (r.tier == 5 and target.tier == 5))
-        for r in caller_db_roles
-    )
-    if not can_manage:
+    if target_role_name not in catalog.caller(caller_roles_in_token).manageable:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="insufficient_authority")
 
 
+@router.post(
+    "/roles/bulk",
+    response_model=RoleBulkResponse,
+    summary="Attribuer ou révoquer des rôles en masse",
+)
+async def bulk_role_mappings(
+    body: RoleBulkRequest,
+    payload: dict = Depends(validate_jwt),
+    db: Session = Depends(get_db),
+):
+    """
+    Applique une liste de couples (user_id, role_name).
+    L'autorité de l'appelant est vérifiée une fois par rôle distinct, puis les
+    rôles sont regroupés par utilisateur : une requête Keycloak par utilisateur.
+    Le résultat est donné couple par couple, dans l'ordre de la requête.
+    """
+    caller_roles = payload.get("realm_access", {}).get("roles", [])
+    refused: dict[str, str] = {}
+    for role_name in {m.role_name for m in body.mappings}:
+        try:
+            _check_can_manage_role(caller_roles, role_name, db)
+        except HTTPException as e:
+            refused[role_name] = e.detail
+
+    changes: dict[str, list[str]] = {}
+    for m in body.mappings:
+        names = changes.setdefault(m.user_id, [])
+        if m.role_name not in refused and m.role_name not in names:
+            names.append(m.role_name)
+
+    failed = await apply_role_mappings(changes, assign=body.action == "assign")
+
+    results = []
+    for m in body.mappings:
+        detail = refused.get(m.role_name) or failed.get((m.user_id, m.role_name))
+        results.append(RoleBulkResult(
+            user_id=m.user_id, role_name=m.role_name,
+            status="error" if detail else "ok", detail=detail,
+        ))
+    errors = sum(r.status == "error" for r in results)
+    logger.info(f"{body.action} en masse par {payload.get('sub')} : "
+                f"{len(results) - errors} ok, {errors} en échec")
+    return RoleBulkResponse(total=len(results), succeeded=len(results) - errors,
+                            failed=errors, results=results)
+
+
 @router.post(
     "/{user_id}/roles/{role_name}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -1,24 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter, BackgroundTasks, Depends, HTTPException, Query, status,
+)
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from src.core.keycloak import require_role_admin, validate_jwt
 from src.core.keycloak_admin import (
     create_realm_role, delete_realm_role, get_users_with_role, update_realm_role,
 )
+from src.core.role_catalog import get_role_catalog
+from src.core.role_jobs import (
+    create_role_deletion_job, get_role_deletion_job, run_role_deletion_job,
+)
 from src.crud.crud_role import (
-    create_role, delete_role, get_role_by_name, get_roles_for_names, list_roles, update_role,
+    create_role, delete_role, get_role_by_name, list_roles, update_role,
+)
+from src.database.session import SessionLocal, get_db
+from src.schemas.role import (
+    RoleCreate, RoleDeletionJobResponse, RoleResponse, RoleUpdate,
 )
-from src.database.session import get_db
-from src.schemas.role import RoleCreate, RoleResponse, RoleUpdate
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/roles", tags=["Roles Management"])
 
 
 def _check_self_destruction(caller_roles_in_token: list[str], target_role_name: str, db: Session) -> None:
-    caller_admin_roles = get_roles_for_names(db, caller_roles_in_token)
-    role_admin_names = {r.name for r in caller_admin_roles if r.is_role_admin}
-    if role_admin_names == {target_role_name}:
+    caller = get_role_catalog(db).caller(caller_roles_in_token)
+    if caller.role_admin_names == {target_role_name}:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="self_destruction_forbidden")
 
 
@@ -41,8 +49,7 @@ async def create_custom_role(
     db: Session = Depends(get_db),
 ):
     caller_roles = payload.get("realm_access", {}).get("roles", [])
-    caller_db_roles = get_roles_for_names(db, caller_roles)
-    caller_max_tier = max((r.tier for r in caller_db_roles), default=-1)
+    caller_max_tier = get_role_catalog(db).caller(caller_roles).max_tier
 
     if body.tier > caller_max_tier:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
@@ -72,8 +79,7 @@ async def edit_role(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Rôle '{role_name}' introuvable")
 
     caller_roles = payload.get("realm_access", {}).get("roles", [])
-    caller_db_roles = get_roles_for_names(db, caller_roles)
-    caller_max_tier = max((r.tier for r in caller_db_roles), default=-1)
+    caller_max_tier = get_role_catalog(db).caller(caller_roles).max_tier
     if role.tier > caller_max_tier:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="Tier insuffisant pour modifier ce rôle")
@@ -93,13 +99,31 @@ async def edit_role(
     return updated
 
 
-@router.delete("/{role_name}", status_code=status.HTTP_204_NO_CONTENT)
+@router.get("/jobs/{job_id}", response_model=RoleDeletionJobResponse)
+def get_role_job(job_id: str, _: dict = Depends(require_role_admin)):
+    job = get_role_deletion_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail="Job introuvable")
+    return job
+
+
+@router.delete(
+    "/{role_name}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": RoleDeletionJobResponse}},
+)
 async def remove_role(
     role_name: str,
+    background_tasks: BackgroundTasks,
     cascade: bool = Query(default=False),
     payload: dict = Depends(require_role_admin),
     db: Session = Depends(get_db),
 ):
+    """
+    Supprime un rôle custom. Sans détenteur : 204 immédiat.
+    Avec `cascade=true` et des détenteurs : 202 + job (suivi via GET /roles/jobs/{id}).
+    """
     role = get_role_by_name(db, role_name)
     if not role:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Rôle '{role_name}' introuvable")
@@ -110,7 +134,7 @@ async def remove_role(
     caller_roles = payload.get("realm_access", {}).get("roles", [])
     _check_self_destruction(caller_roles, role_name, db)
 
-    users_with_role = await get_users_with_role(role_name)
+    users_with_role = await get_users_with_role(role_name, max_results=1)
     if users_with_role:
         if not cascade:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="role_in_use")
@@ -118,6 +142,15 @@ async def remove_role(
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                                 detail="Cascade delete réservé à la Présidence et à l'Administrateur système")
 
+        job = create_role_deletion_job(role_name, payload.get("sub"))
+        background_tasks.add_task(run_role_deletion_job, job, SessionLocal)
+        logger.info(f"Suppression en cascade de '{role_name}' lancée par "
+                    f"{payload.get('sub')} (job {job.id})")
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=RoleDeletionJobResponse.model_validate(job).model_dump(mode="json"),
+        )
+
     await delete_realm_role(role_name)
     delete_role(db, role)
     logger.info(f"Rôle '{role_name}' supprimé par {payload.get('sub')} (cascade={cascade})")
@@ -1,16 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from src.core.keycloak import require_admin, validate_jwt
-from src.crud import crud_stock
+from src.core.keycloak import (
+    require_admin,
+    require_capacity,
+    validate_jwt,
+)
+from src.crud import crud_stock, crud_stock_threshold
 from src.database.session import get_db
 from src.models.items import Items
 from src.models.lockers import Lockers
+from src.schemas.bulk import BulkUpsertResponse
 from src.schemas.stock import StockCreate, StockResponse, StockUpdate
+from src.schemas.stock_movement import (
+    StockAdjust,
+    StockMovementCreate,
+    StockMovementResponse,
+)
+from src.schemas.stock_threshold import (
+    StockAlertResponse,
+    StockThresholdResponse,
+    StockThresholdSet,
+)
+from src.utils.bulk import bulk_request_body, parse_bulk_rows
+from src.utils.collection_version import not_modified
+from src.utils.fast_json import fast_json_response
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/stock", tags=["Stock"])
 
+_STOCK_LIST = TypeAdapter(list[StockResponse])
+
 
 @router.get(
     "/",
@@ -18,23 +42,126 @@ router = APIRouter(prefix="/stock", tags=["Stock"])
     dependencies=[Depends(validate_jwt)],
 )
 def read_stocks(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1),
+    since: datetime | None = Query(
+        None, description="Only return stock entries updated after this timestamp"
+    ),
     db: Session = Depends(get_db),
 ):
     """Retrieve a list of stock entries."""
     logger.debug(f"GET /stock called with skip={skip} and limit={limit}")
 
+    unchanged = not_modified(request, response, "stock")
+    if unchanged:
+        return unchanged
+
     try:
-        stocks = crud_stock.get_stocks(db, skip=skip, limit=limit)
+        stocks = crud_stock.get_stocks(db, skip=skip, limit=limit, since=since)
         logger.info(f"Successfully retrieved {len(stocks)} stock entries")
-        return stocks
+        return fast_json_response(stocks, _STOCK_LIST, headers=response.headers)
 
     except Exception as e:
         logger.exception(f"Error retrieving stock entries: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve stock entries")
 
 
+@router.get(
+    "/alerts",
+    response_model=list[StockAlertResponse],
+    dependencies=[Depends(validate_jwt)],
+)
+def read_stock_alerts(
+    locker_id: int | None = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    db: Session = Depends(get_db),
+):
+    """Retrieve the item/locker pairs currently below their minimum quantity."""
+    logger.debug(f"GET /stock/alerts called (locker_id={locker_id})")
+
+    try:
+        return crud_stock_threshold.get_stock_alerts(
+            db, locker_id=locker_id, skip=skip, limit=limit
+        )
+    except Exception as e:
+        logger.exception(f"Error retrieving stock alerts: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve stock alerts")
+
+
+@router.get(
+    "/thresholds",
+    response_model=list[StockThresholdResponse],
+    dependencies=[Depends(validate_jwt)],
+)
+def read_stock_thresholds(
+    locker_id: int | None = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    db: Session = Depends(get_db),
+):
+    """Retrieve the minimum quantities configured per item and locker."""
+    logger.debug(f"GET /stock/thresholds called (locker_id={locker_id})")
+
+    try:
+        return crud_stock_threshold.get_stock_thresholds(
+            db, locker_id=locker_id, skip=skip, limit=limit
+        )
+    except Exception as e:
+        logger.exception(f"Error retrieving stock thresholds: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to retrieve stock thresholds"
+        )
+
+
+@router.put(
+    "/thresholds",
+    response_model=StockThresholdResponse,
+    dependencies=[Depends(require_capacity("manage_stock_thresholds"))],
+)
+def set_stock_threshold(threshold: StockThresholdSet, db: Session = Depends(get_db)):
+    """Create or replace the minimum quantity of an item in a locker."""
+    logger.info(
+        f"PUT /stock/thresholds called for item {threshold.item_id}"
+        f" in locker {threshold.locker_id}"
+    )
+
+    if not db.query(Items).filter(Items.id == threshold.item_id).first():
+        raise HTTPException(status_code=404, detail="Item not found")
+    if not db.query(Lockers).filter(Lockers.id == threshold.locker_id).first():
+        raise HTTPException(status_code=404, detail="Locker not found")
+
+    try:
+        return crud_stock_threshold.set_stock_threshold(db, threshold)
+    except Exception as e:
+        logger.exception(f"Error setting stock threshold: {e}")
+        raise HTTPException(status_code=500, detail="Failed to set stock threshold")
+
+
+@router.delete(
+    "/thresholds/{threshold_id}",
+    response_model=StockThresholdResponse,
+    dependencies=[Depends(require_capacity("manage_stock_thresholds"))],
+)
+def delete_stock_threshold(threshold_id: int, db: Session = Depends(get_db)):
+    """Delete a stock threshold (and its alert)."""
+    logger.info(f"DELETE /stock/thresholds/{threshold_id} called")
+
+    try:
+        threshold = crud_stock_threshold.delete_stock_threshold(db, threshold_id)
+        if threshold is None:
+            raise HTTPException(status_code=404, detail="Stock threshold not found")
+        return threshold
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error deleting stock threshold {threshold_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to delete stock threshold")
+
+
 @router.get(
     "/{stock_id}",
     response_model=StockResponse,
@@ -85,6 +212,100 @@ def create_stock(stock: StockCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to create stock entry")
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkUpsertResponse,
+    dependencies=[Depends(require_admin)],
+    openapi_extra=bulk_request_body("StockCreate"),
+)
+async def bulk_import_stock(request: Request, db: Session = Depends(get_db)):
+    """Create or update many stock entries from a JSON array or NDJSON."""
+    rows, errors = await parse_bulk_rows(request, StockCreate)
+    logger.info(f"POST /stock/bulk called with {len(rows) + len(errors)} rows")
+
+    try:
+        results = await run_in_threadpool(crud_stock.bulk_upsert_stock, db, rows)
+    except Exception as e:
+        logger.exception(f"Error importing stock entries: {e}")
+        raise HTTPException(status_code=500, detail="Failed to import stock entries")
+
+    response = BulkUpsertResponse.from_results(errors + results)
+    logger.success(
+        f"Bulk import of stock entries: {response.created} created, "
+        f"{response.updated} updated, {response.failed} failed"
+    )
+    return response
+
+
+def _apply_movements(
+    db: Session, movements: list[StockMovementCreate], actor: str | None
+):
+    try:
+        return crud_stock.apply_stock_movements(db, movements, actor=actor)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.exception(f"Error applying stock movements: {e}")
+        raise HTTPException(status_code=500, detail="Failed to apply stock movements")
+
+
+@router.post(
+    "/movements",
+    response_model=list[StockMovementResponse],
+    status_code=201,
+)
+def create_stock_movements(
+    movements: list[StockMovementCreate] = Body(..., min_length=1),
+    db: Session = Depends(get_db),
+    payload: dict = Depends(require_admin),
+):
+    """Apply several quantity changes atomically (all or nothing)."""
+    logger.info(f"POST /stock/movements called with {len(movements)} movement(s)")
+    return _apply_movements(db, movements, actor=payload.get("sub"))
+
+
+@router.post(
+    "/{stock_id}/adjust",
+    response_model=StockMovementResponse,
+    status_code=201,
+)
+def adjust_stock(
+    stock_id: int,
+    adjust: StockAdjust,
+    db: Session = Depends(get_db),
+    payload: dict = Depends(require_admin),
+):
+    """Add or remove a quantity without overwriting concurrent changes."""
+    logger.info(f"POST /stock/{stock_id}/adjust called with delta={adjust.delta}")
+    movement = StockMovementCreate(stock_id=stock_id, **adjust.model_dump())
+    return _apply_movements(db, [movement], actor=payload.get("sub"))[0]
+
+
+@router.get(
+    "/{stock_id}/movements",
+    response_model=list[StockMovementResponse],
+    dependencies=[Depends(require_admin)],
+)
+def read_stock_movements(
+    stock_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    db: Session = Depends(get_db),
+):
+    """Retrieve the movement history of a stock entry."""
+    logger.debug(f"GET /stock/{stock_id}/movements called")
+
+    try:
+        return crud_stock.get_stock_movements(
+            db, stock_id=stock_id, skip=skip, limit=limit
+        )
+    except Exception as e:
+        logger.exception(f"Error retrieving movements for stock {stock_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve movements")
+
+
 @router.put(
     "/{stock_id}",
     response_model=StockResponse,
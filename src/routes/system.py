@@ -0,0 +1,58 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.core.health import health_report
+from src.core.rate_limit import limiter
+from src.core.warmup import warmup_state
+from src.utils.logger import logger
+
+router = APIRouter(tags=["System"])
+
+
+@router.get("/health")
+@limiter.limit("60/minute")  # Changed to 60/minute for reasonable testing
+def health_check(request: Request):
+    logger.info("Health check endpoint called")
+    return {
+        "status": "healthy",
+        "service": "Smartlock API",
+        "version": "0.1.0",
+        "live": True,
+        "ready": warmup_state.ready,
+    }
+
+
+@router.get("/health/ready")
+def readiness_check():
+    """
+    503 until the startup warm-up has finished or while the database probe
+    fails. Only reads the results of the background probes.
+    """
+    ready = warmup_state.ready and health_report.db_ok
+    body = {
+        "ready": ready,
+        "warmup": warmup_state.steps,
+        "warmup_ms": warmup_state.duration_ms,
+        # checked_at is a datetime: JSONResponse does not encode it by itself
+        "checks": jsonable_encoder(asdict(health_report)),
+    }
+    if not ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body
+        )
+    return body
+
+
+@router.get("/")
+@limiter.limit("100/minute")
+def root(request: Request):
+    logger.info("Root endpoint called")
+    return {
+        "message": "Welcome to the Smartlock API",
+        "docs": "/docs",
+        "health": "/health",
+        "version": "0.1.0",
+    }
@@ -1,6 +1,8 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 
 from src.core.keycloak import (
     require_admin,
@@ -11,10 +13,14 @@ from src.core.keycloak_admin import (
     delete_keycloak_user,
     get_user,
     get_user_roles,
+    get_users_by_ids,
+    iter_user_pages,
     list_groups,
     list_users,
     set_user_enabled,
 )
+from src.schemas.user import UserLookupRequest
+from src.utils.fast_json import fast_json_response
 from src.utils.logger import logger
 
 # Toutes ces routes sont strictement réservées aux administrateurs
@@ -24,6 +30,42 @@ router = APIRouter(
     tags=["User Management (Keycloak)"], dependencies=[Depends(require_admin)]
 )
 
+# Champs acceptés par ?fields= sur /users/stream ; card_id vient des attributs
+STREAM_FIELDS = (
+    "id", "username", "firstName", "lastName", "email", "enabled", "card_id",
+)
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    if fields is None:
+        return None
+    selected = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = set(selected) - set(STREAM_FIELDS)
+    if not selected or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Champs invalides : {', '.join(sorted(unknown)) or fields!r}"
+            f" (autorisés : {', '.join(STREAM_FIELDS)})",
+        )
+    return selected
+
+
+def _project(user: dict, fields: tuple[str, ...]) -> dict:
+    projected = {}
+    for field in fields:
+        if field == "card_id":
+            values = (user.get("attributes") or {}).get("card_id") or [None]
+            projected["card_id"] = values[0]
+        else:
+            projected[field] = user.get(field)
+    return projected
+
+
+def _ndjson(users: list[dict], fields: tuple[str, ...] | None) -> bytes:
+    if fields is not None:
+        users = [_project(u, fields) for u in users]
+    return b"".join(to_json(u) + b"\n" for u in users)
+
 
 # --- Routes Utilisateurs (lecture seule) ---
 
@@ -37,7 +79,48 @@ async def get_all_users(
     max_results: int = 100,
 ):
     """Liste les utilisateurs depuis Keycloak."""
-    return await list_users(search=search, first=first, max_results=max_results)
+    users = await list_users(search=search, first=first, max_results=max_results)
+    return fast_json_response(users)
+
+
+@router.get("/users/stream", response_class=StreamingResponse)
+async def stream_users(
+    search: Optional[str] = Query(
+        None, description="Recherche par nom, email ou username"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Champs à renvoyer, séparés par des virgules : "
+        + ", ".join(STREAM_FIELDS),
+    ),
+):
+    """
+    Exporte tous les utilisateurs Keycloak en NDJSON (un utilisateur par ligne).
+    Les pages sont lues côté serveur, la suivante pendant l'envoi de la courante.
+    """
+    projection = _parse_fields(fields)
+    pages = iter_user_pages(
+        search=search, brief=projection is not None and "card_id" not in projection
+    )
+    # La première page est lue avant de répondre : une erreur Keycloak
+    # donne encore un vrai code HTTP
+    first_page = await anext(pages)
+
+    async def body():
+        yield _ndjson(first_page, projection)
+        async for page in pages:
+            yield _ndjson(page, projection)
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+@router.post("/users/lookup")
+async def lookup_users(body: UserLookupRequest):
+    """
+    Résout plusieurs utilisateurs en une requête (noms dans les logs, badges…).
+    Retourne {user_id: utilisateur}, null pour un id inconnu de Keycloak.
+    """
+    return fast_json_response(await get_users_by_ids(body.ids))
 
 
 @router.get("/users/{user_id}")
@@ -0,0 +1,33 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BulkRowResult(BaseModel):
+    """Outcome of a single row in a bulk import"""
+
+    index: int = Field(..., description="Position of the row in the submitted batch")
+    status: Literal["created", "updated", "error"]
+    id: Optional[int] = Field(None, description="ID of the created/updated row")
+    detail: Optional[str] = Field(None, description="Reason of the failure")
+
+
+class BulkUpsertResponse(BaseModel):
+    """Schema for bulk import response"""
+
+    total: int
+    created: int
+    updated: int
+    failed: int
+    results: list[BulkRowResult]
+
+    @classmethod
+    def from_results(cls, results: list[BulkRowResult]) -> "BulkUpsertResponse":
+        results = sorted(results, key=lambda r: r.index)
+        return cls(
+            total=len(results),
+            created=sum(r.status == "created" for r in results),
+            updated=sum(r.status == "updated" for r in results),
+            failed=sum(r.status == "error" for r in results),
+            results=results,
+        )
@@ -34,3 +34,15 @@ class ItemResponse(ItemBase):
     updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ItemSearchResult(ItemResponse):
+    category_name: str
+    rank: float = Field(..., description="Relevance score (higher is better)")
+
+
+class ItemSearchPage(BaseModel):
+    results: list[ItemSearchResult]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page (null if last)"
+    )
@@ -34,3 +34,30 @@ class LockerResponse(LockerBase):
     updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class LockerInventoryEntry(BaseModel):
+    """Stock entry of a locker joined with its item and category"""
+
+    stock_id: int
+    quantity: int
+    unit_measure: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    item_id: int
+    item_name: str
+    item_reference: str
+    item_description: Optional[str] = None
+    category_id: int
+    category_name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LockerInventoryPage(BaseModel):
+    """Keyset-paginated page of a locker inventory"""
+
+    locker_id: int
+    entries: list[LockerInventoryEntry]
+    next_after: Optional[int] = Field(
+        None, description="Pass as `after` to fetch the next page (null if last)"
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -13,13 +13,53 @@ class PendingCardResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+CardId = Annotated[
+    str, Field(min_length=1, max_length=64, description="ID de la carte NFC")
+]
+
+MAX_SCAN_BATCH = 100
+MAX_ASSIGN_BATCH = 500
+
+
 class ScanCardRequest(BaseModel):
-    card_id: str = Field(
-        ..., min_length=1, max_length=64, description="ID de la carte NFC"
-    )
+    card_id: CardId
 
 
 class ScanCardResponse(BaseModel):
     success: bool
     message: str
     card_id: str
+
+
+class ScanBatchRequest(BaseModel):
+    card_ids: list[CardId] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_SCAN_BATCH,
+        description="Scans mis en tampon par la borne NFC",
+    )
+
+
+class ScanBatchResult(BaseModel):
+    card_id: str
+    status: Literal["created", "conflict"]
+
+
+class ScanBatchResponse(BaseModel):
+    created: int
+    conflicts: int
+    results: list[ScanBatchResult]
+
+
+class AssignCardsRequest(BaseModel):
+    card_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_ASSIGN_BATCH,
+        description="card_id (hachés) tels que renvoyés par /badge/pending",
+    )
+
+
+class AssignCardsResponse(BaseModel):
+    assigned: list[PendingCardResponse]
+    not_found: list[str]
@@ -1,7 +1,13 @@
-from typing import Optional
-from pydantic import BaseModel, ConfigDict, field_validator
+from datetime import datetime
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
+MAX_BULK_ROLE_MAPPINGS = 1000
+# Les identifiants Keycloak sont interpolés dans les URL de l'API admin :
+# ni "/" ni "." pour qu'un id ne puisse pas désigner une autre ressource
+KEYCLOAK_ID_PATTERN = r"^[A-Za-z0-9-]+$"
+
 VALID_CAPACITIES = {
     "create_lockers", "configure_system", "audit_log_full",
     "purchase_orders", "manage_suppliers", "cascade_delete_role",
@@ -64,3 +70,44 @@ class RoleResponse(BaseModel):
     is_manager: bool
     is_role_admin: bool
     capacities: list[str]
+
+
+class RoleDeletionJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    role_name: str
+    requested_by: Optional[str] = None
+    status: Literal["pending", "running", "completed", "failed"]
+    total_users: Optional[int] = None
+    processed_users: int
+    failed_users: list[str]
+    detail: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class RoleMapping(BaseModel):
+    user_id: str = Field(..., pattern=KEYCLOAK_ID_PATTERN, max_length=64)
+    role_name: str = Field(..., min_length=1)
+
+
+class RoleBulkRequest(BaseModel):
+    action: Literal["assign", "revoke"]
+    mappings: list[RoleMapping] = Field(
+        ..., min_length=1, max_length=MAX_BULK_ROLE_MAPPINGS
+    )
+
+
+class RoleBulkResult(BaseModel):
+    user_id: str
+    role_name: str
+    status: Literal["ok", "error"]
+    detail: Optional[str] = None
+
+
+class RoleBulkResponse(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    results: list[RoleBulkResult]
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class StockAdjust(BaseModel):
+    """Schema for a relative change of a stock quantity"""
+
+    delta: int = Field(..., description="Quantity to add (positive) or remove")
+    reason: Optional[str] = Field(None, max_length=255, description="Why it moved")
+
+    @field_validator("delta")
+    @classmethod
+    def delta_not_zero(cls, v: int) -> int:
+        if v == 0:
+            raise ValueError("delta must not be 0")
+        return v
+
+
+class StockMovementCreate(StockAdjust):
+    """Schema for one movement of a batch"""
+
+    stock_id: int = Field(..., gt=0, description="Stock entry ID")
+
+
+class StockMovementResponse(BaseModel):
+    id: int
+    stock_id: Optional[int] = None
+    item_id: int
+    locker_id: int
+    delta: int
+    quantity_after: int
+    reason: Optional[str] = None
+    actor: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
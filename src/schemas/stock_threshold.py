@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StockThresholdBase(BaseModel):
+    item_id: int = Field(..., gt=0, description="Item ID")
+    locker_id: int = Field(..., gt=0, description="Locker ID")
+    min_quantity: int = Field(..., ge=0, description="Alert below this quantity")
+
+
+class StockThresholdSet(StockThresholdBase):
+    """Schema for creating or replacing the threshold of an (item, locker) pair"""
+
+    pass
+
+
+class StockThresholdResponse(StockThresholdBase):
+    id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StockAlertResponse(BaseModel):
+    item_id: int
+    locker_id: int
+    stock_id: Optional[int] = Field(None, description="Null if the item is absent")
+    quantity: int
+    min_quantity: int
+    triggered_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
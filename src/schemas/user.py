@@ -0,0 +1,18 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from src.schemas.role import KEYCLOAK_ID_PATTERN
+
+MAX_USER_LOOKUP = 500
+
+KeycloakId = Annotated[str, Field(pattern=KEYCLOAK_ID_PATTERN, max_length=64)]
+
+
+class UserLookupRequest(BaseModel):
+    ids: list[KeycloakId] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_USER_LOOKUP,
+        description="UUIDs Keycloak des utilisateurs à résoudre",
+    )
@@ -0,0 +1,185 @@
+"""
+Bulk import helpers
+===================
+- parse_bulk_rows()    : reads a JSON array or NDJSON body and validates each row
+- bulk_request_body()  : OpenAPI description of a bulk request body
+- dedupe_rows()        : keeps the last occurrence of each key in a batch
+- dialect_insert()     : the dialect's insert() construct, with ON CONFLICT support
+- bulk_upsert()        : chunked INSERT … ON CONFLICT DO UPDATE … RETURNING
+
+Rows are validated one by one so that a single bad line is reported in the
+response instead of rejecting the whole import.
+"""
+
+import json
+from typing import Any, Callable, Hashable, Iterator, Sequence, TypeVar
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session
+
+from src.schemas.bulk import BulkRowResult
+
+T = TypeVar("T", bound=BaseModel)
+
+BULK_MAX_ROWS = 10_000
+# Keeps every statement well under the bind parameter limits
+# of PostgreSQL (65535) and SQLite (32766).
+BULK_CHUNK_SIZE = 1_000
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson")
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}"
+        for err in e.errors()
+    )
+
+
+async def parse_bulk_rows(
+    request: Request, schema: type[T]
+) -> tuple[list[tuple[int, T]], list[BulkRowResult]]:
+    """
+    Parse a bulk request body into validated rows.
+
+    Returns the valid rows as (index, model) pairs and a BulkRowResult
+    error for every row that failed validation.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+
+    if content_type.startswith(NDJSON_CONTENT_TYPES):
+        raw_rows: list[Any] = [line for line in body.splitlines() if line.strip()]
+        validate: Callable[[Any], T] = schema.model_validate_json
+    else:
+        try:
+            raw_rows = json.loads(body)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON body"
+            )
+        if not isinstance(raw_rows, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Expected a JSON array of rows",
+            )
+        validate = schema.model_validate
+
+    if len(raw_rows) > BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many rows (max {BULK_MAX_ROWS} per request)",
+        )
+
+    rows: list[tuple[int, T]] = []
+    errors: list[BulkRowResult] = []
+    for index, raw in enumerate(raw_rows):
+        try:
+            rows.append((index, validate(raw)))
+        except ValidationError as e:
+            errors.append(
+                BulkRowResult(
+                    index=index, status="error", detail=_format_validation_error(e)
+                )
+            )
+    return rows, errors
+
+
+def bulk_request_body(schema_name: str) -> dict:
+    """OpenAPI requestBody for routes that read their rows with parse_bulk_rows."""
+    array_schema = {
+        "type": "array",
+        "items": {"$ref": f"#/components/schemas/{schema_name}"},
+    }
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": array_schema},
+                "application/x-ndjson": {
+                    "schema": {"$ref": f"#/components/schemas/{schema_name}"}
+                },
+            },
+        }
+    }
+
+
+def dedupe_rows(
+    rows: list[tuple[int, T]], key: Callable[[T], Hashable], label: str
+) -> tuple[list[tuple[int, T]], list[BulkRowResult]]:
+    """
+    Keep only the last occurrence of each key.
+
+    A single INSERT … ON CONFLICT cannot touch the same row twice, so earlier
+    duplicates are reported as errors.
+    """
+    last_index = {key(model): index for index, model in rows}
+    kept = [(i, m) for i, m in rows if last_index[key(m)] == i]
+    duplicates = [
+        BulkRowResult(
+            index=i,
+            status="error",
+            detail=f"Duplicate {label} in batch (see row {last_index[key(m)]})",
+        )
+        for i, m in rows
+        if last_index[key(m)] != i
+    ]
+    return kept, duplicates
+
+
+def chunked(seq: Sequence[Any], size: int = BULK_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(seq), size):
+        yield seq[start : start + size]
+
+
+def dialect_insert(db: Session) -> Callable:
+    """Return the insert() of the session's dialect (PostgreSQL or SQLite)."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+    return insert
+
+
+def bulk_upsert(
+    db: Session,
+    model: type,
+    values: list[dict],
+    key_columns: list[str],
+    update_columns: list[str],
+) -> tuple[dict[tuple, int], set[tuple]]:
+    """
+    Insert or update `values` with one INSERT … ON CONFLICT per chunk.
+
+    `key_columns` must match a unique constraint of the table. Returns a
+    mapping key → row id and the set of keys that already existed before
+    the statement ran. The caller is responsible for committing.
+    """
+    insert = dialect_insert(db)
+    keys = [getattr(model, c) for c in key_columns]
+    key_expr = tuple_(*keys) if len(keys) > 1 else keys[0]
+
+    ids: dict[tuple, int] = {}
+    existing: set[tuple] = set()
+    for chunk in chunked(values):
+        chunk_keys = [tuple(v[c] for c in key_columns) for v in chunk]
+        lookup = chunk_keys if len(keys) > 1 else [k[0] for k in chunk_keys]
+        existing.update(
+            tuple(row) for row in db.query(*keys).filter(key_expr.in_(lookup))
+        )
+
+        stmt = insert(model).values(list(chunk))
+        set_ = {c: stmt.excluded[c] for c in update_columns}
+        set_["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns, set_=set_
+        ).returning(model.id, *keys)
+        for row in db.execute(stmt):
+            ids[tuple(row[1:])] = row[0]
+
+    return ids, existing
@@ -0,0 +1,96 @@
+"""
+Collection versions
+===================
+- bump_collections()   : called by the CRUD write functions after a commit
+- on_bump()            : registers a callback run on every bump (cache invalidation)
+- collection_version() : current counter of a collection
+- collection_etag()    : weak ETag derived from the current versions
+- not_modified()       : answers a conditional GET without touching the DB
+
+Each collection (lockers, items, categories, stock) has an in-memory counter.
+The ETag also carries a random per-process epoch, so a restarted worker or a
+different worker never answers 304 to a tag it did not issue. Bumps are
+relayed to the other workers through publish_invalidation(), where they run
+the same listeners.
+"""
+
+import threading
+import uuid
+from collections import defaultdict
+from typing import Callable
+
+from fastapi import Request, Response, status
+
+from src.utils.invalidation import on_invalidation, publish_invalidation
+
+COLLECTIONS = ("lockers", "items", "categories", "stock")
+_EPOCH = uuid.uuid4().hex[:8]
+_versions: defaultdict[str, int] = defaultdict(int)
+_lock = threading.Lock()
+_listeners: list[Callable[[tuple[str, ...]], None]] = []
+
+
+def on_bump(listener: Callable[[tuple[str, ...]], None]) -> None:
+    """Call `listener` with the bumped collection names after every bump."""
+    _listeners.append(listener)
+
+
+def _bump(collections: tuple[str, ...]) -> None:
+    with _lock:
+        for collection in collections:
+            _versions[collection] += 1
+    for listener in _listeners:
+        listener(collections)
+
+
+def bump_collections(*collections: str) -> None:
+    """Mark the given collections as changed, here and on the other workers."""
+    _bump(collections)
+    publish_invalidation("collections", collections)
+
+
+def _on_remote_bump(collections: tuple[str, ...]) -> None:
+    _bump(collections or COLLECTIONS)
+
+
+on_invalidation("collections", _on_remote_bump)
+
+
+def collection_version(collection: str) -> int:
+    return _versions[collection]
+
+
+def collection_etag(*collections: str) -> str:
+    versions = "-".join(str(_versions[c]) for c in collections)
+    return f'W/"{_EPOCH}-{versions}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" designate the same version
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(
+    request: Request, response: Response, *collections: str
+) -> Response | None:
+    """
+    Set the ETag of a list response and handle If-None-Match.
+
+    Returns a 304 response when the client already has the current version,
+    otherwise None after adding the ETag header to `response`. Must be called
+    before querying, so that a write racing with the query can only make the
+    tag older than the data, never newer.
+    """
+    etag = collection_etag(*collections)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return None
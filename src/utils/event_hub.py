@@ -0,0 +1,76 @@
+"""
+Event hub
+=========
+- EventHub     : in-process broadcast of events to asyncio subscribers
+- format_sse() : one Server-Sent Events message
+
+Each subscriber gets a bounded queue bound to the event loop it was created
+on; publish() can be called from any thread. A subscriber that falls
+MAX_QUEUED_EVENTS behind is dropped (it receives None and its stream ends);
+clients are expected to reconnect with Last-Event-ID and catch up from the
+database.
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+MAX_QUEUED_EVENTS = 100
+
+
+class EventHub:
+    def __init__(self, max_queued: int = MAX_QUEUED_EVENTS):
+        self.max_queued = max_queued
+        self._subscribers: dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber on the running event loop."""
+        # One extra slot so the None sent on overflow always fits
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queued + 1)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def publish(self, event: Any) -> None:
+        """Send `event` to every subscriber."""
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            loop.call_soon_threadsafe(self._deliver, queue, event)
+
+    def close(self) -> None:
+        """End every subscriber's stream."""
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+            self._subscribers.clear()
+        for queue, loop in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    def _deliver(self, queue: asyncio.Queue, event: Any) -> None:
+        if queue not in self._subscribers:
+            return
+        if queue.qsize() >= self.max_queued:
+            self.unsubscribe(queue)
+            queue.put_nowait(None)
+            return
+        queue.put_nowait(event)
+
+
+def format_sse(
+    data: str, event_id: int | str | None = None, event: str | None = None
+) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,38 @@
+"""
+Fast JSON responses
+===================
+- dump_json()          : validates rows and serializes them to bytes in pydantic-core
+- fast_json_response() : Response built from dump_json() (or to_json() for raw data)
+
+By default FastAPI validates a returned value against `response_model`, walks
+the result again with jsonable_encoder and finally encodes it with the stdlib
+json module. Large list routes opt in to this module to do a single pass in
+pydantic's Rust core instead. They keep `response_model` on the decorator so
+the OpenAPI schema is unchanged. See scripts/bench_serialization.py.
+"""
+
+from typing import Any, Mapping
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+
+def dump_json(adapter: TypeAdapter, data: Any) -> bytes:
+    """Validate `data` (ORM objects or dicts) with `adapter` and dump it to JSON."""
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def fast_json_response(
+    data: Any,
+    adapter: TypeAdapter | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """
+    Serialize `data` straight to a JSON response.
+
+    Without `adapter`, `data` must already be JSON-shaped (e.g. a Keycloak
+    payload) and is encoded as is.
+    """
+    body = dump_json(adapter, data) if adapter is not None else to_json(data)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,72 @@
+"""
+Cross-worker cache invalidation
+===============================
+- on_invalidation()      : registers the local handler of a topic
+- publish_invalidation() : tells the other workers that some keys changed
+
+Each worker keeps in-memory caches (response cache, role catalog, Keycloak
+role and user caches) that are cleared locally on every write. With several
+workers, the others used to keep serving stale entries until a TTL expired.
+publish_invalidation() broadcasts the change over pg_listener on
+INVALIDATION_CHANNEL, and every other worker runs the handlers of the topic.
+
+Handlers receive the changed keys; an empty tuple means "everything". Events
+carry the origin worker, so a worker ignores its own. Events never replace
+each other, so they are all applied, whatever their order. Events published
+while this worker's connection is down are sent once it is back (see
+PgNotifyListener.notify()). Events sent by others in the meantime are lost
+for this worker, so every handler is then called with no keys.
+
+Without PG_NOTIFY_ENABLED nothing is sent and each worker only sees its own
+writes, as before.
+"""
+
+import json
+import uuid
+from typing import Callable, Iterable
+
+from src.utils.logger import logger
+from src.utils.pg_notify import pg_listener
+
+INVALIDATION_CHANNEL = "smartlock_invalidation"
+
+_WORKER_ID = uuid.uuid4().hex[:12]
+_handlers: dict[str, list[Callable[[tuple[str, ...]], None]]] = {}
+
+
+def on_invalidation(topic: str, handler: Callable[[tuple[str, ...]], None]) -> None:
+    """Call `handler(keys)` when another worker invalidates `topic`."""
+    _handlers.setdefault(topic, []).append(handler)
+
+
+def publish_invalidation(topic: str, keys: Iterable[str] = ()) -> None:
+    """Tell the other workers that `keys` of `topic` changed (all if empty)."""
+    if not pg_listener.started:
+        return
+    payload = json.dumps({"topic": topic, "keys": list(keys), "origin": _WORKER_ID})
+    pg_listener.notify(INVALIDATION_CHANNEL, payload)
+
+
+def _apply(topic: str, keys: tuple[str, ...]) -> None:
+    for handler in _handlers.get(topic, []):
+        try:
+            handler(keys)
+        except Exception:
+            logger.exception(f"Invalidation handler failed on '{topic}'")
+
+
+def _on_notify(payload: str) -> None:
+    event = json.loads(payload)
+    if event["origin"] == _WORKER_ID:
+        return
+    _apply(event["topic"], tuple(event["keys"]))
+
+
+def _flush_all() -> None:
+    logger.warning("Invalidation events may have been missed, flushing all caches")
+    for topic in list(_handlers):
+        _apply(topic, ())
+
+
+pg_listener.listen(INVALIDATION_CHANNEL, _on_notify)
+pg_listener.on_reconnect(_flush_all)
@@ -0,0 +1,40 @@
+"""
+Liveness endpoint
+=================
+- LivenessMiddleware : answers GET /health/live before any other middleware
+
+Orchestrators poll liveness every few seconds. Served as a route, each poll
+went through the request logger, the rate limiter and CORS, and was written
+to the logs twice. This outermost ASGI middleware answers with a
+pre-encoded response instead: nothing is logged, throttled or serialized.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+LIVENESS_PATH = "/health/live"
+
+_BODY = b'{"status":"live"}'
+_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": (
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_BODY)).encode()),
+        (b"cache-control", b"no-store"),
+    ),
+}
+_BODY_MESSAGE = {"type": "http.response.body", "body": _BODY}
+
+
+class LivenessMiddleware:
+    def __init__(self, app: ASGIApp, path: str = LIVENESS_PATH):
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == self.path:
+            # Outermost middleware: nothing wraps `send` to mutate these messages
+            await send(_START)
+            await send(_BODY_MESSAGE)
+            return
+        await self.app(scope, receive, send)
@@ -4,9 +4,8 @@ from pathlib import Path
 
 from loguru import logger
 
-# Create logs directory
+# Created by setup_logger() when logging to files
 LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(exist_ok=True)
 
 # Context variable for request ID tracking
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
@@ -59,6 +58,8 @@ def setup_logger(
     )
 
     if log_to_file:
+        LOGS_DIR.mkdir(exist_ok=True)
+
         # Application log file
         logger.add(
             LOGS_DIR / "app.log",
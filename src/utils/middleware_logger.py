@@ -26,12 +26,18 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         log_request_body: bool = False,
         log_response_body: bool = False,
+        exclude_paths: tuple[str, ...] = (),
     ):
         super().__init__(app)
         self.log_request_body = log_request_body
         self.log_response_body = log_response_body
+        self.exclude_paths = frozenset(exclude_paths)
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # Polled endpoints (orchestrator probes) would flood the logs
+        if request.url.path in self.exclude_paths:
+            return await call_next(request)
+
         # Generate unique request ID
         request_id = str(uuid.uuid4())
         request_id_var.set(request_id)
@@ -0,0 +1,187 @@
+"""
+PostgreSQL LISTEN/NOTIFY
+========================
+- pg_notify()      : queues a notification in the session's transaction
+- PgNotifyListener : one dedicated connection LISTENing on registered channels,
+                     also used by notify() to send outside any transaction
+- pg_listener      : process-wide listener, started by the lifespan when
+                     PG_NOTIFY_ENABLED is set
+
+Lets the workers of a multi-worker deployment tell each other about events
+that only one of them saw. The listener connection is watched by the event
+loop (add_reader), so no thread is blocked waiting for notifications. If the
+connection drops, the listener reconnects after RECONNECT_DELAY_SECONDS. It
+then runs the on_reconnect() callbacks, since notifications sent by others
+in between are lost, and sends the ones notify() queued meanwhile.
+"""
+
+import asyncio
+from collections import deque
+from typing import Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.utils.logger import logger
+
+RECONNECT_DELAY_SECONDS = 5.0
+# notify() calls kept while disconnected; the oldest are dropped beyond that
+MAX_PENDING_NOTIFICATIONS = 10_000
+
+
+def pg_notify(db: Session, channel: str, payload: str) -> None:
+    """NOTIFY `channel`; delivered when the caller commits."""
+    db.execute(select(func.pg_notify(channel, payload)))
+
+
+class PgNotifyListener:
+    def __init__(self):
+        self._handlers: dict[str, list[Callable[[str], None]]] = {}
+        self._reconnect_callbacks: list[Callable[[], None]] = []
+        # Set while disconnected after start(): notifications may have been lost
+        self._may_have_missed = False
+        self._engine: Engine | None = None
+        self._conn = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: deque[tuple[str, str]] = deque()
+
+    @property
+    def running(self) -> bool:
+        return self._conn is not None
+
+    @property
+    def started(self) -> bool:
+        """start() was called, whether or not the connection is currently up."""
+        return self._engine is not None
+
+    def listen(self, channel: str, handler: Callable[[str], None]) -> None:
+        """Call `handler(payload)` for every notification on `channel`."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_reconnect(self, callback: Callable[[], None]) -> None:
+        """Call `callback` after the connection was lost and re-established."""
+        self._reconnect_callbacks.append(callback)
+
+    def notify(self, channel: str, payload: str) -> None:
+        """
+        NOTIFY `channel` on the listener connection, from any thread.
+
+        Sent right away (autocommit), so call it after the change is
+        committed. While the connection is down, it is queued and sent after
+        reconnecting. A no-op unless the listener is started.
+        """
+        loop = self._loop
+        if loop is not None and self._engine is not None:
+            loop.call_soon_threadsafe(self._send, channel, payload)
+
+    def start(self, engine: Engine) -> None:
+        """LISTEN on every registered channel, on the running event loop."""
+        self._engine = engine
+        self._loop = asyncio.get_running_loop()
+        self._connect()
+
+    def stop(self) -> None:
+        self._engine = None
+        self._may_have_missed = False
+        self._pending.clear()
+        self._disconnect()
+
+    def _connect(self) -> None:
+        if self._engine is None:
+            return
+        try:
+            raw = self._engine.raw_connection()
+            # Read before detach(), which unlinks the pool record holding it
+            conn = raw.driver_connection
+            # Taken out of the pool for good: it stays in autocommit LISTEN mode
+            raw.detach()
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                for channel in self._handlers:
+                    cur.execute(f'LISTEN "{channel}"')
+        except Exception as e:
+            logger.error(f"LISTEN failed, retrying in {RECONNECT_DELAY_SECONDS}s: {e}")
+            self._may_have_missed = True
+            self._loop.call_later(RECONNECT_DELAY_SECONDS, self._connect)
+            return
+        self._conn = conn
+        self._loop.add_reader(conn.fileno(), self._on_readable)
+        logger.info(f"Listening on {', '.join(self._handlers) or 'no channel'}")
+        if self._may_have_missed:
+            self._may_have_missed = False
+            for callback in self._reconnect_callbacks:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("LISTEN reconnect callback failed")
+        pending, self._pending = self._pending, deque()
+        for channel, payload in pending:
+            self._send(channel, payload)
+
+    def _disconnect(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            self._loop.remove_reader(conn.fileno())
+        except Exception:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _connection_lost(self, e: Exception) -> None:
+        logger.error(f"LISTEN connection lost: {e}")
+        self._disconnect()
+        self._may_have_missed = True
+        self._loop.call_later(RECONNECT_DELAY_SECONDS, self._connect)
+
+    def _on_readable(self) -> None:
+        try:
+            self._conn.poll()
+        except Exception as e:
+            self._connection_lost(e)
+            return
+        self._dispatch()
+
+    def _queue(self, channel: str, payload: str) -> None:
+        if len(self._pending) >= MAX_PENDING_NOTIFICATIONS:
+            dropped, _ = self._pending.popleft()
+            logger.error(f"NOTIFY queue full, dropping a notification on '{dropped}'")
+        self._pending.append((channel, payload))
+
+    def _send(self, channel: str, payload: str) -> None:
+        if self._engine is None:
+            return
+        if self._conn is None:
+            self._queue(channel, payload)
+            return
+        try:
+            with self._conn.cursor() as cur:
+                cur.execute("SELECT pg_notify(%s, %s)", (channel, payload))
+        except Exception as e:
+            if not getattr(self._conn, "closed", False):
+                # Rejected by the server (payload too long…): retrying won't help
+                logger.error(f"NOTIFY on '{channel}' failed: {e}")
+                return
+            self._queue(channel, payload)
+            self._connection_lost(e)
+            return
+        # Notifications received while the query ran are already buffered
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._conn is not None and self._conn.notifies:
+            notification = self._conn.notifies.pop(0)
+            for handler in self._handlers.get(notification.channel, []):
+                try:
+                    handler(notification.payload)
+                except Exception:
+                    logger.exception(
+                        f"NOTIFY handler failed on '{notification.channel}'"
+                    )
+
+
+pg_listener = PgNotifyListener()
@@ -0,0 +1,94 @@
+"""
+Response cache
+==============
+- ResponseCache           : thread-safe LRU of JSON bodies bounded by a byte budget
+- response_cache          : process-wide instance sized by RESPONSE_CACHE_MAX_BYTES
+- cached_json_response()  : read-through helper used by the list routes
+
+Entries are keyed by (collection, collection version, query params), so a
+body computed before a write can never be served after it. Writes also drop
+the entries of the bumped collections right away to free their memory.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from src.core.config import settings
+from src.utils.collection_version import collection_version, on_bump
+from src.utils.fast_json import dump_json
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> bytes | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: tuple, body: bytes) -> None:
+        """Store `body`, evicting the least recently used entries if needed."""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def invalidate(self, collections: tuple[str, ...]) -> None:
+        """Drop every entry of the given collections."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in collections]:
+                self.size -= len(self._entries.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_BYTES)
+on_bump(response_cache.invalidate)
+
+
+def cached_json_response(
+    response: Response,
+    collection: str,
+    params: tuple[Hashable, ...],
+    load: Callable[[], Any],
+    adapter: TypeAdapter,
+) -> Response:
+    """
+    Serve a list response from the cache, or build and store it.
+
+    `load` runs the query on a miss; its result is serialized with
+    dump_json(). Headers already set on `response` (ETag) are kept.
+    """
+    # Read the version before querying: a concurrent write can then only
+    # leave an entry under an outdated key, which is never looked up again.
+    key = (collection, collection_version(collection), params)
+    body = response_cache.get(key)
+    if body is None:
+        body = dump_json(adapter, load())
+        response_cache.put(key, body)
+    return Response(
+        content=body, media_type="application/json", headers=dict(response.headers)
+    )
@@ -10,6 +10,9 @@ os.environ.setdefault("KEYCLOAK_URL", "http://localhost:8080")
 os.environ.setdefault("KEYCLOAK_REALM", "smartlock")
 os.environ.setdefault("KEYCLOAK_CLIENT_ID", "smartlock-api")
 os.environ.setdefault("KEYCLOAK_CLIENT_SECRET", "test-secret")
+# No Keycloak in tests: skip the startup warm-up
+os.environ["WARMUP_ENABLED"] = "false"
+os.environ["HEALTH_PROBE_INTERVAL_SECONDS"] = "0"
 
 import pytest
 from fastapi.testclient import TestClient
@@ -18,6 +21,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from src.core.keycloak import (
+    _jwks_cache,
     require_admin,
     require_codir,
     require_codir_or_admin,
@@ -29,9 +33,12 @@ from src.core.keycloak import (
     require_role_admin,
     validate_jwt,
 )
+from src.core.keycloak_admin import _realm_role_cache, _user_cache
+from src.core.role_catalog import invalidate_role_catalog
 from src.database.base import Base
 from src.database.session import get_db
 from src.main import app, limiter
+from src.utils.response_cache import response_cache
 
 # Disable rate limiting globally for all tests
 limiter.enabled = False
@@ -58,6 +65,12 @@ def db():
     session.close()
     transaction.rollback()
     connection.close()
+    # Cached list bodies and roles would otherwise leak rows rolled back above
+    response_cache.clear()
+    invalidate_role_catalog()
+    _realm_role_cache.clear()
+    _user_cache.clear()
+    _jwks_cache.update(jwks=None, fetched_at=0.0)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.core.badge_feed import (
+    PENDING_CARD_CHANNEL,
+    announce_pending_cards,
+    pending_card_hub,
+)
+from src.models.pending_card import PendingCard
+from src.schemas.pending_card import PendingCardResponse
+from src.utils.event_hub import EventHub, format_sse
+from src.utils.pg_notify import PgNotifyListener
+
+
+def _card(card_id: int) -> PendingCardResponse:
+    return PendingCardResponse(
+        id=card_id,
+        card_id=f"hash{card_id}",
+        scanned_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        status="pending",
+    )
+
+
+class TestEventHub:
+    pytestmark = pytest.mark.anyio
+
+    async def test_publish_from_another_thread(self):
+        hub = EventHub()
+        queue = hub.subscribe()
+        thread = threading.Thread(target=hub.publish, args=("hello",))
+        thread.start()
+        thread.join()
+
+        assert await asyncio.wait_for(queue.get(), timeout=1) == "hello"
+
+    async def test_slow_subscriber_is_dropped(self):
+        hub = EventHub(max_queued=2)
+        queue = hub.subscribe()
+        for i in range(3):
+            hub.publish(i)
+        await asyncio.sleep(0)
+
+        assert [queue.get_nowait() for _ in range(3)] == [0, 1, None]
+        assert len(hub) == 0
+
+    async def test_close_ends_streams(self):
+        hub = EventHub()
+        queue = hub.subscribe()
+        hub.close()
+        assert await asyncio.wait_for(queue.get(), timeout=1) is None
+
+
+def test_format_sse():
+    assert format_sse('{"a":1}', event_id=7, event="pending_card") == (
+        'id: 7\nevent: pending_card\ndata: {"a":1}\n\n'
+    )
+
+
+class TestAnnounce:
+    def test_publishes_locally_without_listener(self, db):
+        row = SimpleNamespace(**_card(1).model_dump())
+        with patch.object(pending_card_hub, "publish") as m_publish:
+            announce_pending_cards(db, [row])
+        m_publish.assert_called_once_with(_card(1))
+
+    def test_notifies_when_listener_runs(self, db):
+        row = SimpleNamespace(**_card(1).model_dump())
+        with (
+            patch.object(
+                PgNotifyListener, "running", new_callable=PropertyMock
+            ) as m_running,
+            patch("src.core.badge_feed.pg_notify") as m_notify,
+            patch.object(pending_card_hub, "publish") as m_publish,
+        ):
+            m_running.return_value = True
+            announce_pending_cards(db, [row])
+
+        m_notify.assert_called_once_with(
+            db, PENDING_CARD_CHANNEL, _card(1).model_dump_json()
+        )
+        m_publish.assert_not_called()
+
+
+def test_listener_dispatches_notifications():
+    listener = PgNotifyListener()
+    seen = []
+    listener.listen("chan", lambda payload: 1 / 0)
+    listener.listen("chan", seen.append)
+    listener._conn = MagicMock(
+        notifies=[
+            SimpleNamespace(channel="chan", payload="a"),
+            SimpleNamespace(channel="other", payload="b"),
+        ]
+    )
+
+    listener._on_readable()
+
+    assert seen == ["a"]
+    assert listener._conn.notifies == []
+
+
+class TestPendingStream:
+    def _stream(self, client, events, headers=None):
+        queue = asyncio.Queue()
+        for event in [*events, None]:
+            queue.put_nowait(event)
+        with patch.object(pending_card_hub, "subscribe", return_value=queue):
+            return client.get("/badge/pending/stream", headers=headers or {})
+
+    def _ids(self, resp):
+        return [
+            int(line.removeprefix("id: "))
+            for line in resp.text.splitlines()
+            if line.startswith("id: ")
+        ]
+
+    def test_pushes_live_cards(self, admin_client):
+        resp = self._stream(admin_client, [_card(5), _card(6)])
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        assert self._ids(resp) == [5, 6]
+        assert "event: pending_card" in resp.text
+
+    def test_last_event_id_replays_missed_cards(self, admin_client, db):
+        cards = [PendingCard(card_id=f"c{i}") for i in range(4)]
+        cards[2].status = "assigned"
+        db.add_all(cards)
+        db.commit()
+        ids = [c.id for c in cards]
+
+        resp = self._stream(
+            admin_client,
+            [_card(ids[3]), _card(ids[3] + 1)],
+            headers={"Last-Event-ID": str(ids[0])},
+        )
+
+        # assigned card skipped, replayed card not sent twice
+        assert self._ids(resp) == [ids[1], ids[3], ids[3] + 1]
+
+    def test_requires_admin(self, membre_client):
+        assert membre_client.get("/badge/pending/stream").status_code == 403
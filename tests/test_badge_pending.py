@@ -0,0 +1,142 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import src.routes.badge as badge_routes
+from src.core.badge_retention import purge_old_assigned_cards
+from src.crud.crud_pending_card import assign_cards
+from src.models.pending_card import PendingCard
+from src.utils.card_hash import hash_card_id
+
+T0 = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _seed(db, count=5):
+    # Two cards share a timestamp to exercise the id tie-breaker
+    cards = [
+        PendingCard(card_id=f"c{i}", scanned_at=T0 + timedelta(minutes=min(i, 3)))
+        for i in range(count)
+    ]
+    cards.append(PendingCard(card_id="done", scanned_at=T0, status="assigned"))
+    db.add_all(cards)
+    db.commit()
+    return cards
+
+
+class TestPendingPagination:
+    def test_pages_follow_the_cursor(self, admin_client, db):
+        _seed(db)
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            resp = admin_client.get("/badge/pending", params=params)
+            assert resp.status_code == 200
+            seen += [c["card_id"] for c in resp.json()]
+            cursor = resp.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert seen == ["c4", "c3", "c2", "c1", "c0"]
+
+    def test_last_page_has_no_cursor(self, admin_client, db):
+        _seed(db, count=2)
+        resp = admin_client.get("/badge/pending?limit=5")
+        assert len(resp.json()) == 2
+        assert "X-Next-Cursor" not in resp.headers
+
+    def test_invalid_cursor_400(self, admin_client):
+        resp = admin_client.get("/badge/pending?cursor=nope")
+        assert resp.status_code == 400
+
+
+class TestBulkAssign:
+    def test_assigns_known_cards(self, admin_client, db):
+        _seed(db, count=3)
+        resp = admin_client.patch(
+            "/badge/assign", json={"card_ids": ["c0", "c2", "ghost", "c0"]}
+        )
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert sorted(c["card_id"] for c in body["assigned"]) == ["c0", "c2"]
+        assert body["not_found"] == ["ghost"]
+        db.expire_all()
+        pending = db.query(PendingCard).filter(PendingCard.status == "pending")
+        assert [c.card_id for c in pending] == ["c1"]
+        card = db.query(PendingCard).filter(PendingCard.card_id == "c0").one()
+        assert card.assigned_at is not None
+
+    def test_single_assign_sets_assigned_at(self, admin_client, db):
+        _seed(db, count=1)
+        resp = admin_client.patch("/badge/c0/assign")
+        assert resp.status_code == 200
+        db.expire_all()
+        card = db.query(PendingCard).filter(PendingCard.card_id == "c0").one()
+        assert card.assigned_at is not None
+
+    def test_db_work_runs_off_the_event_loop(self, admin_client, db, monkeypatch):
+        _seed(db, count=1)
+        on_loop = []
+
+        def spy(db, card_ids):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return assign_cards(db, card_ids)
+
+        monkeypatch.setattr(badge_routes, "assign_cards", spy)
+        resp = admin_client.patch("/badge/assign", json={"card_ids": ["c0"]})
+
+        assert resp.status_code == 200
+        assert on_loop == [False]
+
+
+class TestRetention:
+    def test_purges_only_old_assigned_cards(self, db):
+        now = datetime.now(timezone.utc)
+        db.add_all(
+            [
+                PendingCard(
+                    card_id="old",
+                    status="assigned",
+                    assigned_at=now - timedelta(days=40),
+                ),
+                PendingCard(
+                    card_id="recent",
+                    status="assigned",
+                    assigned_at=now - timedelta(days=1),
+                ),
+                PendingCard(card_id="waiting", status="pending"),
+            ]
+        )
+        db.commit()
+
+        with patch("src.core.badge_retention.SessionLocal", lambda: db):
+            assert purge_old_assigned_cards() == 1
+
+        remaining = sorted(c.card_id for c in db.query(PendingCard))
+        assert remaining == ["recent", "waiting"]
+
+    def test_purged_card_is_pending_again_when_rescanned(self, nfc_client, db):
+        card_hash = hash_card_id("AA:BB")
+        db.add(
+            PendingCard(
+                card_id=card_hash,
+                status="assigned",
+                assigned_at=datetime.now(timezone.utc) - timedelta(days=40),
+            )
+        )
+        db.commit()
+        assert (
+            nfc_client.post("/badge/scan", json={"card_id": "AA:BB"}).status_code == 409
+        )
+
+        with patch("src.core.badge_retention.SessionLocal", lambda: db):
+            assert purge_old_assigned_cards() == 1
+        resp = nfc_client.post("/badge/scan", json={"card_id": "AA:BB"})
+
+        assert resp.status_code == 201
+        card = db.query(PendingCard).filter(PendingCard.card_id == card_hash).one()
+        assert card.status == "pending"
@@ -0,0 +1,76 @@
+import asyncio
+
+import src.routes.badge as badge_routes
+from src.crud.crud_pending_card import register_scans
+from src.models.pending_card import PendingCard
+from src.utils.card_hash import hash_card_id
+
+
+class TestRegisterScans:
+    def test_returns_only_new_cards(self, db):
+        db.add(PendingCard(card_id="known", status="assigned"))
+        db.commit()
+
+        rows = register_scans(db, ["known", "new", "new"])
+
+        assert [row.card_id for row in rows] == ["new"]
+        assert rows[0].status == "pending"
+        assert rows[0].scanned_at is not None
+        assert db.query(PendingCard).count() == 2
+
+
+class TestScanCard:
+    def test_first_scan_201_then_409(self, nfc_client, db):
+        first = nfc_client.post("/badge/scan", json={"card_id": "AA:BB"})
+        second = nfc_client.post("/badge/scan", json={"card_id": "AA:BB"})
+
+        assert first.status_code == 201
+        assert first.json()["card_id"] == hash_card_id("AA:BB")
+        assert second.status_code == 409
+        assert "pending" in second.json()["detail"]
+
+
+class TestScanBatch:
+    def test_reports_each_card(self, nfc_client, db):
+        db.add(PendingCard(card_id=hash_card_id("OLD")))
+        db.commit()
+
+        resp = nfc_client.post(
+            "/badge/scan/batch", json={"card_ids": ["A1", "OLD", "B2", "A1"]}
+        )
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert (body["created"], body["conflicts"]) == (2, 2)
+        assert [r["status"] for r in body["results"]] == [
+            "created",
+            "conflict",
+            "created",
+            "conflict",
+        ]
+        assert db.query(PendingCard).count() == 3
+
+    def test_empty_batch_rejected(self, nfc_client):
+        resp = nfc_client.post("/badge/scan/batch", json={"card_ids": []})
+        assert resp.status_code == 422
+
+    def test_requires_nfc_scanner(self, admin_client):
+        resp = admin_client.post("/badge/scan/batch", json={"card_ids": ["A1"]})
+        assert resp.status_code == 403
+
+    def test_db_work_runs_off_the_event_loop(self, nfc_client, monkeypatch):
+        on_loop = []
+
+        def spy(db, card_ids):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return register_scans(db, card_ids)
+
+        monkeypatch.setattr(badge_routes, "register_scans", spy)
+        resp = nfc_client.post("/badge/scan/batch", json={"card_ids": ["A1"]})
+
+        assert resp.status_code == 200
+        assert on_loop == [False]
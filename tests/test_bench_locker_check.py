@@ -0,0 +1,44 @@
+"""
+Tests — benchmark du contrôle d'accès casier (faux Keycloak)
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+
+# 32 clients dépassent la capacité du pool (5 + 10) : le run ne doit pas bloquer
+@pytest.mark.parametrize("concurrency", [4, 32])
+def test_bench_locker_check_writes_results(tmp_path, concurrency):
+    output = tmp_path / "results.json"
+    subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "scripts" / "bench_locker_check.py"),
+            "--requests=40",
+            f"--concurrency={concurrency}",
+            "--warmup=4",
+            "--users=20",
+            "--latency-ms=0",
+            f"--output={output}",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        timeout=90,
+    )
+    report = json.loads(output.read_text())
+
+    results = report["results"]
+    assert sum(results["outcomes"].values()) == 40
+    assert not any(k.startswith("http_") for k in results["outcomes"])
+    latency = results["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    # Le token et le JWKS viennent du cache : seules les recherches restent
+    assert set(results["keycloak_calls"]) <= {"user_search", "role_mappings"}
+    assert results["keycloak_calls"]["user_search"] == 40
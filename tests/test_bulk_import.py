@@ -0,0 +1,128 @@
+import json
+
+from src.models.items import Items
+from src.models.stock import Stock
+
+
+def _seed_catalog(admin_client):
+    cat = admin_client.post("/categories/", json={"name": "Bulk"}).json()
+    locker = admin_client.post("/lockers/", json={"locker_type": "bulk"}).json()
+    return cat["id"], locker["id"]
+
+
+class TestBulkItems:
+    def test_creates_and_updates_by_reference(self, admin_client, db):
+        cat_id, _ = _seed_catalog(admin_client)
+        admin_client.post(
+            "/items/",
+            json={"name": "Old", "reference": "B-1", "category_id": cat_id},
+        )
+
+        resp = admin_client.post(
+            "/items/bulk",
+            json=[
+                {"name": "New", "reference": "B-1", "category_id": cat_id},
+                {"name": "Other", "reference": "B-2", "category_id": cat_id},
+            ],
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert (body["created"], body["updated"], body["failed"]) == (1, 1, 0)
+        assert [r["status"] for r in body["results"]] == ["updated", "created"]
+        assert db.query(Items).filter(Items.reference == "B-1").one().name == "New"
+
+    def test_reports_invalid_rows_without_rejecting_batch(self, admin_client):
+        cat_id, _ = _seed_catalog(admin_client)
+        resp = admin_client.post(
+            "/items/bulk",
+            json=[
+                {"name": "Ok", "reference": "B-3", "category_id": cat_id},
+                {"name": "", "reference": "B-4", "category_id": cat_id},
+                {"name": "Orphan", "reference": "B-5", "category_id": 99999},
+            ],
+        )
+        results = resp.json()["results"]
+        assert results[0]["status"] == "created"
+        assert results[1]["status"] == "error"
+        assert results[2] == {
+            "index": 2,
+            "status": "error",
+            "id": None,
+            "detail": "Category not found",
+        }
+
+    def test_duplicate_reference_in_batch_keeps_last(self, admin_client, db):
+        cat_id, _ = _seed_catalog(admin_client)
+        resp = admin_client.post(
+            "/items/bulk",
+            json=[
+                {"name": "First", "reference": "B-6", "category_id": cat_id},
+                {"name": "Last", "reference": "B-6", "category_id": cat_id},
+            ],
+        )
+        results = resp.json()["results"]
+        assert results[0]["status"] == "error"
+        assert results[1]["status"] == "created"
+        assert db.query(Items).filter(Items.reference == "B-6").one().name == "Last"
+
+    def test_accepts_ndjson(self, admin_client):
+        cat_id, _ = _seed_catalog(admin_client)
+        lines = [
+            json.dumps({"name": "A", "reference": "N-1", "category_id": cat_id}),
+            "{not json",
+            json.dumps({"name": "B", "reference": "N-2", "category_id": cat_id}),
+        ]
+        resp = admin_client.post(
+            "/items/bulk",
+            content="\n".join(lines),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        body = resp.json()
+        assert (body["created"], body["failed"]) == (2, 1)
+        assert body["results"][1]["status"] == "error"
+
+    def test_rejects_non_array_body(self, admin_client):
+        resp = admin_client.post("/items/bulk", json={"name": "x"})
+        assert resp.status_code == 400
+
+    def test_requires_admin(self, membre_client):
+        resp = membre_client.post("/items/bulk", json=[])
+        assert resp.status_code == 403
+
+
+class TestBulkStock:
+    def test_upsert_on_item_locker_pair(self, admin_client, db):
+        cat_id, locker_id = _seed_catalog(admin_client)
+        item = admin_client.post(
+            "/items/",
+            json={"name": "Vis", "reference": "S-1", "category_id": cat_id},
+        ).json()
+        admin_client.post(
+            "/stock/",
+            json={"item_id": item["id"], "locker_id": locker_id, "quantity": 1},
+        )
+
+        resp = admin_client.post(
+            "/stock/bulk",
+            json=[
+                {"item_id": item["id"], "locker_id": locker_id, "quantity": 7},
+                {"item_id": item["id"], "locker_id": 99999, "quantity": 1},
+                {"item_id": 99999, "locker_id": locker_id, "quantity": 1},
+            ],
+        )
+        results = resp.json()["results"]
+        assert results[0]["status"] == "updated"
+        assert results[1]["detail"] == "Locker not found"
+        assert results[2]["detail"] == "Item not found"
+        stock = db.query(Stock).filter(Stock.id == results[0]["id"]).one()
+        assert stock.quantity == 7
+
+
+class TestBulkCategories:
+    def test_existing_names_are_reported_as_updated(self, admin_client):
+        admin_client.post("/categories/", json={"name": "Déjà là"})
+        resp = admin_client.post(
+            "/categories/bulk", json=[{"name": "Déjà là"}, {"name": "Nouvelle"}]
+        )
+        body = resp.json()
+        assert [r["status"] for r in body["results"]] == ["updated", "created"]
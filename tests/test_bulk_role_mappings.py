@@ -0,0 +1,132 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.core import keycloak_admin
+from src.models.role import Role
+
+RealAsyncClient = httpx.AsyncClient
+
+
+def _seed(db):
+    for name, tier, manager in (
+        ("admin", 5, True),
+        ("codir", 3, True),
+        ("membre", 0, False),
+        ("3d", 0, False),
+    ):
+        db.add(
+            Role(
+                name=name,
+                label=name,
+                tier=tier,
+                is_system=True,
+                is_manager=manager,
+                is_role_admin=manager,
+                capacities=[],
+            )
+        )
+    db.commit()
+
+
+def _bulk(client, action, pairs, failed=None):
+    with patch(
+        "src.routes.roles.apply_role_mappings",
+        new_callable=AsyncMock,
+        return_value=failed or {},
+    ) as m_apply:
+        resp = client.post(
+            "/users/roles/bulk",
+            json={
+                "action": action,
+                "mappings": [{"user_id": u, "role_name": r} for u, r in pairs],
+            },
+        )
+    return resp, m_apply
+
+
+class TestBulkRoleRoute:
+    def test_groups_roles_per_user(self, admin_client, db):
+        _seed(db)
+        pairs = [("u1", "membre"), ("u1", "3d"), ("u2", "membre"), ("u1", "membre")]
+        resp, m_apply = _bulk(admin_client, "assign", pairs)
+
+        assert resp.status_code == 200
+        m_apply.assert_awaited_once_with(
+            {"u1": ["membre", "3d"], "u2": ["membre"]}, assign=True
+        )
+        body = resp.json()
+        assert (body["total"], body["succeeded"], body["failed"]) == (4, 4, 0)
+
+    def test_reports_refused_and_failed_pairs(self, codir_client, db):
+        _seed(db)
+        pairs = [("u1", "membre"), ("u1", "admin"), ("u2", "ghost"), ("u3", "membre")]
+        failed = {("u3", "membre"): "Utilisateur introuvable"}
+        resp, m_apply = _bulk(codir_client, "revoke", pairs, failed)
+
+        m_apply.assert_awaited_once_with(
+            {"u1": ["membre"], "u2": [], "u3": ["membre"]}, assign=False
+        )
+        results = resp.json()["results"]
+        assert [r["status"] for r in results] == ["ok", "error", "error", "error"]
+        assert results[1]["detail"] == "insufficient_authority"
+        assert results[2]["detail"] == "Rôle 'ghost' inconnu"
+        assert results[3]["detail"] == "Utilisateur introuvable"
+
+    def test_empty_batch_rejected(self, admin_client):
+        resp = admin_client.post(
+            "/users/roles/bulk", json={"action": "assign", "mappings": []}
+        )
+        assert resp.status_code == 422
+
+    @pytest.mark.parametrize("user_id", ["../groups/g1", "u1/..", "a.b", ""])
+    def test_rejects_user_id_outside_keycloak_ids(self, admin_client, db, user_id):
+        _seed(db)
+        resp, m_apply = _bulk(admin_client, "assign", [(user_id, "membre")])
+        assert resp.status_code == 422
+        m_apply.assert_not_awaited()
+
+
+class TestApplyRoleMappings:
+    pytestmark = pytest.mark.anyio
+
+    async def test_one_request_per_user(self):
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, request.url.path, request.content))
+            return httpx.Response(404 if "/users/gone/" in request.url.path else 204)
+
+        async def role(name):
+            if name == "ghost":
+                raise HTTPException(status_code=404, detail="Rôle introuvable")
+            return {"id": f"id-{name}", "name": name}
+
+        transport = httpx.MockTransport(handler)
+        with (
+            patch.object(keycloak_admin, "get_admin_token", new_callable=AsyncMock),
+            patch.object(keycloak_admin, "get_realm_role", side_effect=role) as m_role,
+            patch.object(
+                keycloak_admin.httpx,
+                "AsyncClient",
+                lambda *a, **kw: RealAsyncClient(transport=transport),
+            ),
+        ):
+            failed = await keycloak_admin.apply_role_mappings(
+                {"u1": ["membre", "3d"], "gone": ["membre"], "u2": ["ghost"]},
+                assign=True,
+            )
+
+        assert m_role.await_count == 3
+        assert sorted((m, p.split("/")[-3]) for m, p, _ in calls) == [
+            ("POST", "gone"),
+            ("POST", "u1"),
+        ]
+        u1_body = next(body for _, p, body in calls if "/users/u1/" in p)
+        assert u1_body.count(b'"name"') == 2
+        assert failed == {
+            ("gone", "membre"): "Utilisateur introuvable",
+            ("u2", "ghost"): "Rôle introuvable",
+        }
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.models.items import Items
+
+
+@pytest.mark.parametrize("path", ["/lockers/", "/items/", "/categories/", "/stock/"])
+def test_list_endpoints_return_weak_etag(admin_client, path):
+    resp = admin_client.get(path)
+    assert resp.status_code == 200
+    assert resp.headers["ETag"].startswith('W/"')
+
+
+def test_matching_etag_returns_304_without_querying(admin_client):
+    etag = admin_client.get("/items/").headers["ETag"]
+
+    with patch("src.routes.items.crud_items.get_items") as get_items:
+        resp = admin_client.get("/items/", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+    get_items.assert_not_called()
+
+
+def test_write_changes_etag(admin_client):
+    etag = admin_client.get("/categories/").headers["ETag"]
+    admin_client.post("/categories/", json={"name": "Nouvelle"})
+
+    resp = admin_client.get("/categories/", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+def test_collections_are_versioned_independently(admin_client):
+    etag = admin_client.get("/lockers/").headers["ETag"]
+    admin_client.post("/categories/", json={"name": "Autre"})
+
+    resp = admin_client.get("/lockers/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+def test_stock_adjustment_changes_stock_etag(admin_client):
+    cat = admin_client.post("/categories/", json={"name": "Cat"}).json()
+    locker = admin_client.post("/lockers/", json={"locker_type": "l"}).json()
+    item = admin_client.post(
+        "/items/", json={"name": "Vis", "reference": "E-1", "category_id": cat["id"]}
+    ).json()
+    stock = admin_client.post(
+        "/stock/",
+        json={"item_id": item["id"], "locker_id": locker["id"], "quantity": 5},
+    ).json()
+    etag = admin_client.get("/stock/").headers["ETag"]
+
+    admin_client.post(f"/stock/{stock['id']}/adjust", json={"delta": -1})
+
+    resp = admin_client.get("/stock/", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+
+
+def test_since_returns_only_recent_rows(admin_client, db):
+    cat = admin_client.post("/categories/", json={"name": "Since"}).json()
+    for ref in ("OLD", "NEW"):
+        admin_client.post(
+            "/items/", json={"name": ref, "reference": ref, "category_id": cat["id"]}
+        )
+    cutoff = datetime(2024, 1, 1)
+    db.query(Items).filter(Items.reference == "OLD").update(
+        {Items.updated_at: cutoff - timedelta(days=1)}, synchronize_session=False
+    )
+
+    resp = admin_client.get("/items/", params={"since": cutoff.isoformat()})
+    assert [i["reference"] for i in resp.json()] == ["NEW"]
+
+
+def test_locker_deletion_changes_stock_etag(admin_client):
+    cat = admin_client.post("/categories/", json={"name": "Cat"}).json()
+    locker = admin_client.post("/lockers/", json={"locker_type": "l"}).json()
+    item = admin_client.post(
+        "/items/", json={"name": "Vis", "reference": "E-2", "category_id": cat["id"]}
+    ).json()
+    admin_client.post(
+        "/stock/",
+        json={"item_id": item["id"], "locker_id": locker["id"], "quantity": 5},
+    )
+    listed = admin_client.get("/stock/")
+    assert len(listed.json()) == 1
+
+    admin_client.delete(f"/lockers/{locker['id']}")
+
+    resp = admin_client.get(
+        "/stock/", headers={"If-None-Match": listed.headers["ETag"]}
+    )
+    assert resp.status_code == 200
+    assert resp.json() == []
@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from src.routes.access_log import _ACCESS_LOG_LIST
+from src.schemas.items import ItemResponse
+from src.utils import fast_json
+from src.utils.fast_json import fast_json_response
+
+ITEMS = TypeAdapter(list[ItemResponse])
+
+
+def test_matches_default_encoding_of_orm_rows():
+    row = SimpleNamespace(
+        id=1,
+        name="Perceuse",
+        reference="P-1",
+        description=None,
+        category_id=2,
+        created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        updated_at=None,
+    )
+    resp = fast_json_response([row], ITEMS)
+
+    expected = ITEMS.dump_python(
+        ITEMS.validate_python([row], from_attributes=True), mode="json"
+    )
+    assert json.loads(resp.body) == expected
+    assert resp.media_type == "application/json"
+
+
+def test_raw_payload_is_encoded_as_is():
+    users = [{"id": "u-1", "username": "é", "attributes": {"card": ["x"]}}]
+    resp = fast_json_response(users, headers={"ETag": 'W/"1"'})
+    assert json.loads(resp.body) == jsonable_encoder(users)
+    assert resp.headers["ETag"] == 'W/"1"'
+
+
+def test_logs_route_uses_fast_path(admin_client):
+    with patch.object(fast_json, "dump_json", wraps=fast_json.dump_json) as spy:
+        resp = admin_client.get("/logs/")
+
+    spy.assert_called_once()
+    assert spy.call_args.args[0] is _ACCESS_LOG_LIST
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == []
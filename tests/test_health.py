@@ -0,0 +1,91 @@
+"""
+Tests — /health/live, sondes de dépendances et /health/ready
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from src.core.health import HealthReport, pool_stats, run_probes
+from tests.conftest import engine
+
+
+@pytest.fixture
+def report(monkeypatch):
+    report = HealthReport()
+    monkeypatch.setattr("src.core.health.health_report", report)
+    monkeypatch.setattr("src.routes.system.health_report", report)
+    return report
+
+
+def test_live_bypasses_logging_and_cors(client):
+    resp = client.get("/health/live", headers={"Origin": "https://evil.example"})
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "live"}
+    assert "x-request-id" not in resp.headers
+    assert "access-control-allow-origin" not in resp.headers
+
+
+def test_ready_is_not_logged(client):
+    resp = client.get("/health/ready")
+    assert resp.status_code == 200
+    assert "x-request-id" not in resp.headers
+    assert "x-request-id" in client.get("/health").headers
+
+
+@pytest.mark.anyio
+async def test_run_probes_records_latencies(report):
+    with patch("src.core.health.get_admin_token", new_callable=AsyncMock) as get_token:
+        await run_probes(engine)
+
+    get_token.assert_awaited_once_with(force=True)
+    assert report.db["ok"] is True and report.db["latency_ms"] >= 0
+    assert report.keycloak_token["ok"] is True
+    assert report.jwks_age_s is None
+    # StaticPool des tests : pas de saturation mesurable
+    assert report.pool is None
+    assert report.checked_at is not None
+
+
+@pytest.mark.anyio
+async def test_keycloak_failure_keeps_worker_ready(report, client):
+    with patch(
+        "src.core.health.get_admin_token",
+        new_callable=AsyncMock,
+        side_effect=HTTPException(503, detail="Keycloak injoignable"),
+    ):
+        await run_probes(engine)
+
+    assert report.keycloak_token == {
+        "ok": False,
+        "error": "Keycloak injoignable",
+        "latency_ms": report.keycloak_token["latency_ms"],
+    }
+    resp = client.get("/health/ready")
+    assert resp.status_code == 200
+    assert resp.json()["checks"]["keycloak_token"]["ok"] is False
+
+
+def test_failed_db_probe_makes_worker_unready(report, client):
+    report.db = {"ok": False, "error": "connection refused", "latency_ms": 2.0}
+    report.checked_at = datetime(2026, 10, 19, 8, 30, tzinfo=timezone.utc)
+    resp = client.get("/health/ready")
+    assert resp.status_code == 503
+    checks = resp.json()["checks"]
+    assert checks["db"]["error"] == "connection refused"
+    assert checks["checked_at"] == "2026-10-19T08:30:00+00:00"
+
+
+def test_pool_stats_reports_saturation():
+    queue_engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=1
+    )
+    with queue_engine.connect():
+        stats = pool_stats(queue_engine)
+    assert stats["checked_out"] == 1
+    assert stats["size"] == 2
+    assert stats["saturation"] == 0.33
@@ -0,0 +1,235 @@
+"""
+Tests — invalidation des caches entre workers (LISTEN/NOTIFY)
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core import keycloak_admin
+from src.core.role_catalog import get_role_catalog
+from src.utils import invalidation
+from src.utils.collection_version import collection_version
+from src.utils.invalidation import (
+    INVALIDATION_CHANNEL,
+    _on_notify,
+    publish_invalidation,
+)
+from src.utils.pg_notify import PgNotifyListener, pg_listener
+from src.utils.response_cache import response_cache
+
+
+@pytest.fixture
+def listening(monkeypatch):
+    """pg_listener « connecté » : les NOTIFY envoyés sont capturés."""
+    sent = []
+    monkeypatch.setattr(pg_listener, "_engine", object())
+    monkeypatch.setattr(pg_listener, "_conn", object())
+    monkeypatch.setattr(
+        pg_listener, "notify", lambda channel, payload: sent.append(payload)
+    )
+    return sent
+
+
+def _remote(topic, keys, origin="other-worker"):
+    return json.dumps({"topic": topic, "keys": keys, "origin": origin})
+
+
+def test_publish_is_a_noop_without_listener(monkeypatch):
+    notify = MagicMock()
+    monkeypatch.setattr(pg_listener, "notify", notify)
+    publish_invalidation("users", ["u1"])
+    notify.assert_not_called()
+
+
+def test_publish_sends_topic_keys_and_origin(listening):
+    publish_invalidation("users", ["u1"])
+    publish_invalidation("roles")
+    first, second = (json.loads(p) for p in listening)
+    assert first == {
+        "topic": "users",
+        "keys": ["u1"],
+        "origin": invalidation._WORKER_ID,
+    }
+    assert (second["topic"], second["keys"]) == ("roles", [])
+
+
+def test_publish_while_disconnected_is_queued(listening, monkeypatch):
+    monkeypatch.setattr(pg_listener, "_conn", None)
+    publish_invalidation("users", ["u1"])
+    assert len(listening) == 1
+
+
+def test_write_publishes_collections(listening, admin_client):
+    admin_client.post("/categories/", json={"name": "Bus"})
+    event = json.loads(listening[-1])
+    assert (event["topic"], event["keys"]) == ("collections", ["categories"])
+
+
+def test_own_events_are_ignored():
+    before = collection_version("lockers")
+    _on_notify(_remote("collections", ["lockers"], origin=invalidation._WORKER_ID))
+    assert collection_version("lockers") == before
+
+
+def test_every_remote_event_is_applied():
+    # Les envois d'un worker partent de plusieurs threads : l'ordre n'est pas garanti
+    lockers, items = collection_version("lockers"), collection_version("items")
+    _on_notify(_remote("collections", ["items"]))
+    _on_notify(_remote("collections", ["lockers"]))
+    _on_notify(_remote("collections", ["lockers"]))
+    assert collection_version("lockers") == lockers + 2
+    assert collection_version("items") == items + 1
+
+
+def test_remote_collections_event_clears_response_cache():
+    response_cache.put(("lockers", "list"), b"[]")
+    before = collection_version("items")
+    _on_notify(_remote("collections", []))
+    assert response_cache.get(("lockers", "list")) is None
+    assert collection_version("items") == before + 1
+
+
+def test_remote_roles_event_reloads_catalog(db):
+    catalog = get_role_catalog(db)
+    assert get_role_catalog(db) is catalog
+    _on_notify(_remote("roles", ["membre"]))
+    assert get_role_catalog(db) is not catalog
+
+
+def test_remote_users_event_evicts_user_cache():
+    keycloak_admin._cache_user({"id": "u1"})
+    keycloak_admin._cache_user({"id": "u2"})
+    _on_notify(_remote("users", ["u1"]))
+    assert keycloak_admin._cached_user("u1") is None
+    assert keycloak_admin._cached_user("u2") is not None
+    _on_notify(_remote("users", []))
+    assert keycloak_admin._cached_user("u2") is None
+
+
+def test_remote_realm_roles_event_evicts_role_cache():
+    keycloak_admin._realm_role_cache["membre"] = {"id": "r1", "name": "membre"}
+    _on_notify(_remote("realm_roles", ["membre"]))
+    assert "membre" not in keycloak_admin._realm_role_cache
+
+
+# ── PgNotifyListener ──────────────────────────────────────────────────────────
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.notifies = []
+        self.executed = []
+
+    def cursor(self):
+        conn = self
+
+        class _Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql, params=None):
+                conn.executed.append((sql, params))
+                # Le worker reçoit aussi ses propres NOTIFY
+                if params:
+                    conn.notifies.append(
+                        SimpleNamespace(channel=params[0], payload=params[1])
+                    )
+
+        return _Cursor()
+
+
+def test_listener_send_dispatches_buffered_notifications():
+    listener = PgNotifyListener()
+    received = []
+    listener.listen(INVALIDATION_CHANNEL, received.append)
+    listener._engine = object()
+    listener._conn = _FakeConnection()
+
+    listener._send(INVALIDATION_CHANNEL, "payload")
+
+    assert listener._conn.executed == [
+        ("SELECT pg_notify(%s, %s)", (INVALIDATION_CHANNEL, "payload"))
+    ]
+    assert received == ["payload"]
+
+
+def test_listener_reconnect_runs_callbacks():
+    listener = PgNotifyListener()
+    flushed = MagicMock()
+    listener.on_reconnect(flushed)
+    conn = _FakeConnection()
+    conn.fileno = lambda: 42
+    conn.autocommit = False
+    raw = SimpleNamespace(detach=lambda: None, driver_connection=conn)
+    listener._engine = SimpleNamespace(raw_connection=lambda: raw)
+    listener._loop = MagicMock()
+
+    listener._connect()
+    flushed.assert_not_called()
+
+    listener._disconnect()
+    listener._may_have_missed = True
+    listener._connect()
+    flushed.assert_called_once()
+
+
+def _connectable_listener():
+    listener = PgNotifyListener()
+    conn = _FakeConnection()
+    conn.fileno = lambda: 42
+    conn.autocommit = False
+    raw = SimpleNamespace(detach=lambda: None, driver_connection=conn)
+    listener._engine = SimpleNamespace(raw_connection=lambda: raw)
+    listener._loop = MagicMock()
+    return listener, conn
+
+
+def test_notifications_sent_while_disconnected_go_out_on_reconnect():
+    listener, conn = _connectable_listener()
+    listener._send(INVALIDATION_CHANNEL, "first")
+    listener._send(INVALIDATION_CHANNEL, "second")
+    assert conn.executed == []
+
+    listener._connect()
+    assert [params for _, params in conn.executed if params] == [
+        (INVALIDATION_CHANNEL, "first"),
+        (INVALIDATION_CHANNEL, "second"),
+    ]
+    assert not listener._pending
+
+
+def test_send_on_a_dead_connection_is_queued_and_reconnects():
+    listener, conn = _connectable_listener()
+    listener._connect()
+
+    def broken(*args):
+        raise OSError("server closed the connection")
+
+    dead = SimpleNamespace(
+        closed=1, cursor=broken, fileno=lambda: 42, close=lambda: None
+    )
+    listener._conn = dead
+    listener._send(INVALIDATION_CHANNEL, "payload")
+
+    assert listener._conn is None
+    assert list(listener._pending) == [(INVALIDATION_CHANNEL, "payload")]
+    listener._loop.call_later.assert_called_once()
+
+
+def test_rejected_notification_is_not_retried():
+    listener, conn = _connectable_listener()
+    listener._connect()
+
+    def rejected(*args):
+        raise ValueError("payload string too long")
+
+    listener._conn = SimpleNamespace(closed=0, cursor=rejected)
+    listener._send(INVALIDATION_CHANNEL, "x" * 9000)
+    assert not listener._pending
+    assert listener._conn is not None
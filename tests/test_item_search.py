@@ -0,0 +1,70 @@
+def _seed(admin_client):
+    tools = admin_client.post("/categories/", json={"name": "Outillage"}).json()
+    elec = admin_client.post("/categories/", json={"name": "Électronique"}).json()
+    items = [
+        {"name": "Tournevis plat", "reference": "TV-01", "category_id": tools["id"]},
+        {"name": "Mini tournevis", "reference": "TV-02", "category_id": tools["id"]},
+        {
+            "name": "Kit de réparation",
+            "reference": "KR-01",
+            "description": "Contient un tournevis",
+            "category_id": tools["id"],
+        },
+        {"name": "Arduino Uno", "reference": "AR-UNO", "category_id": elec["id"]},
+        {"name": "Résistance 10%", "reference": "R-10", "category_id": elec["id"]},
+    ]
+    for item in items:
+        admin_client.post("/items/", json=item)
+
+
+class TestItemSearch:
+    def test_ranks_name_prefix_before_contains_before_description(self, admin_client):
+        _seed(admin_client)
+        resp = admin_client.get("/items/search", params={"q": "tournevis"})
+        assert resp.status_code == 200
+        names = [r["name"] for r in resp.json()["results"]]
+        assert names == ["Tournevis plat", "Mini tournevis", "Kit de réparation"]
+
+    def test_exact_reference_comes_first(self, admin_client):
+        _seed(admin_client)
+        resp = admin_client.get("/items/search", params={"q": "ar-uno"})
+        results = resp.json()["results"]
+        assert results[0]["reference"] == "AR-UNO"
+        assert results[0]["category_name"] == "Électronique"
+
+    def test_matches_category_name(self, admin_client):
+        _seed(admin_client)
+        resp = admin_client.get("/items/search", params={"q": "outillage"})
+        assert {r["reference"] for r in resp.json()["results"]} == {
+            "TV-01",
+            "TV-02",
+            "KR-01",
+        }
+
+    def test_like_wildcards_are_escaped(self, admin_client):
+        _seed(admin_client)
+        resp = admin_client.get("/items/search", params={"q": "10%"})
+        assert [r["reference"] for r in resp.json()["results"]] == ["R-10"]
+
+    def test_keyset_pagination_walks_all_results(self, admin_client):
+        _seed(admin_client)
+        seen, cursor = [], None
+        while True:
+            params = {"q": "tournevis", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            page = admin_client.get("/items/search", params=params).json()
+            seen += [r["reference"] for r in page["results"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == ["TV-01", "TV-02", "KR-01"]
+
+    def test_invalid_cursor_is_rejected(self, admin_client):
+        resp = admin_client.get(
+            "/items/search", params={"q": "x", "cursor": "not-a-cursor"}
+        )
+        assert resp.status_code == 400
+
+    def test_requires_query(self, membre_client):
+        assert membre_client.get("/items/search").status_code == 422
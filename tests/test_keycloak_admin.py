@@ -39,3 +39,80 @@ async def test_create_realm_role_calls_post():
         from src.core.keycloak_admin import create_realm_role
         await create_realm_role("new_role", "New Role Description")
         m_client.return_value.__aenter__.return_value.post.assert_called_once()
+
+
+BASE = "/admin/realms/smartlock"
+STALE = {"id": "old", "name": "promo"}
+
+
+def _keycloak(requests, routes):
+    """Serve `routes` ({(method, path suffix): response}) through MockTransport."""
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        for (method, suffix), resp in routes.items():
+            if request.method == method and request.url.path.endswith(suffix):
+                return resp
+        return httpx.Response(500)
+
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    return patch("src.core.keycloak_admin.httpx.AsyncClient",
+                 lambda *a, **kw: real_client(transport=transport))
+
+
+async def test_role_assignment_uses_warmed_cache():
+    from src.core.keycloak_admin import (
+        _realm_role_cache,
+        add_role_to_user,
+        warm_realm_role_cache,
+    )
+    requests = []
+    routes = {
+        ("GET", "/roles"): httpx.Response(200, json=[{"id": "r1", "name": "membre"}]),
+        ("POST", "/users/u1/role-mappings/realm"): httpx.Response(204),
+    }
+    with patch("src.core.keycloak_admin.get_admin_token", new_callable=AsyncMock), \
+         patch.dict(_realm_role_cache, clear=True), _keycloak(requests, routes):
+        await warm_realm_role_cache()
+        assert _realm_role_cache == {"membre": {"id": "r1", "name": "membre"}}
+        requests.clear()
+        await add_role_to_user("u1", "membre")
+    assert requests == [("POST", f"{BASE}/users/u1/role-mappings/realm")]
+
+
+async def test_realm_role_cache_refreshed_by_role_crud():
+    from src.core.keycloak_admin import (
+        _realm_role_cache,
+        create_realm_role,
+        delete_realm_role,
+        get_cached_realm_role,
+    )
+    requests = []
+    routes = {
+        ("GET", "/roles/promo"): httpx.Response(200, json={**STALE, "id": "r2"}),
+        ("POST", "/roles"): httpx.Response(201),
+        ("DELETE", "/roles/promo"): httpx.Response(204),
+    }
+    with patch("src.core.keycloak_admin.get_admin_token", new_callable=AsyncMock), \
+         patch.dict(_realm_role_cache, {"promo": STALE}, clear=True), \
+         _keycloak(requests, routes):
+        await create_realm_role("promo")
+        assert await get_cached_realm_role("promo") == {"id": "r2", "name": "promo"}
+        await get_cached_realm_role("promo")
+        gets = [r for r in requests if r[0] == "GET"]
+        assert gets == [("GET", f"{BASE}/roles/promo")]
+        await delete_realm_role("promo")
+        assert "promo" not in _realm_role_cache
+
+
+async def test_stale_cached_role_is_forgotten_on_404():
+    from fastapi import HTTPException
+
+    from src.core.keycloak_admin import _realm_role_cache, remove_role_from_user
+    routes = {("DELETE", "/users/u1/role-mappings/realm"): httpx.Response(404)}
+    with patch("src.core.keycloak_admin.get_admin_token", new_callable=AsyncMock), \
+         patch.dict(_realm_role_cache, {"promo": STALE}, clear=True), \
+         _keycloak([], routes):
+        with pytest.raises(HTTPException):
+            await remove_role_from_user("u1", "promo")
+        assert "promo" not in _realm_role_cache
@@ -0,0 +1,53 @@
+"""
+Tests — test de charge multi-routes et contrôle des SLO (faux Keycloak)
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_load_test_reports_routes_and_fails_on_breached_slo(tmp_path):
+    scenario = json.loads((ROOT / "scripts/scenarios/mixed.json").read_text())
+    # Aucune requête ne peut tenir 0 ms : le SLO global est forcément dépassé
+    scenario["slo"] = {"p50_ms": 0}
+    scenario_file = tmp_path / "scenario.json"
+    scenario_file.write_text(json.dumps(scenario))
+    output = tmp_path / "results.json"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "scripts" / "load_test.py"),
+            str(scenario_file),
+            "--requests=120",
+            "--concurrency=4",
+            "--warmup=10",
+            "--latency-ms=0",
+            "--users=20",
+            "--lockers=5",
+            "--items=50",
+            "--access-logs=200",
+            f"--output={output}",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    report = json.loads(output.read_text())
+
+    assert result.returncode == 1
+    assert report["slo"]["passed"] is False
+    assert report["slo"]["breaches"][0].startswith("overall p50_ms")
+    assert report["overall"]["requests"] == 120
+    assert report["overall"]["error_rate"] == 0
+    routes = report["routes"]
+    assert set(routes) == set(scenario["routes"])
+    assert sum(r["requests"] for r in routes.values()) == 120
+    # Les requêtes SQL sont attribuées à la requête qui les a émises
+    assert routes["logs_list"]["db_queries"]["mean"] == 1
+    assert routes["locker_check"]["db_queries"]["max"] >= 2
+    assert set(routes["role_change"]["status"]) <= {"204"}
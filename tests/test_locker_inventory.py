@@ -0,0 +1,68 @@
+from sqlalchemy import event
+
+
+def _seed_locker(admin_client, n_items=3):
+    cat = admin_client.post("/categories/", json={"name": "Inventaire"}).json()
+    locker = admin_client.post("/lockers/", json={"locker_type": "inv"}).json()
+    for i in range(n_items):
+        item = admin_client.post(
+            "/items/",
+            json={
+                "name": f"Item {i}",
+                "reference": f"INV-{i}",
+                "category_id": cat["id"],
+            },
+        ).json()
+        admin_client.post(
+            "/stock/",
+            json={"item_id": item["id"], "locker_id": locker["id"], "quantity": i},
+        )
+    return locker["id"]
+
+
+class TestLockerInventory:
+    def test_entries_include_item_and_category(self, admin_client):
+        locker_id = _seed_locker(admin_client, n_items=1)
+        resp = admin_client.get(f"/lockers/{locker_id}/inventory")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["next_after"] is None
+        entry = body["entries"][0]
+        assert entry["item_reference"] == "INV-0"
+        assert entry["category_name"] == "Inventaire"
+
+    def test_keyset_pagination(self, admin_client):
+        locker_id = _seed_locker(admin_client, n_items=3)
+        first = admin_client.get(f"/lockers/{locker_id}/inventory?limit=2").json()
+        assert len(first["entries"]) == 2
+        assert first["next_after"] == first["entries"][-1]["stock_id"]
+
+        second = admin_client.get(
+            f"/lockers/{locker_id}/inventory?limit=2&after={first['next_after']}"
+        ).json()
+        assert [e["item_reference"] for e in second["entries"]] == ["INV-2"]
+        assert second["next_after"] is None
+
+    def test_single_query_per_page(self, admin_client, db):
+        locker_id = _seed_locker(admin_client, n_items=5)
+        statements = []
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db.get_bind().engine
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            admin_client.get(f"/lockers/{locker_id}/inventory")
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        assert len(statements) == 1
+
+    def test_unknown_locker_404(self, admin_client):
+        resp = admin_client.get("/lockers/99999/inventory")
+        assert resp.status_code == 404
+
+    def test_empty_locker_returns_empty_page(self, admin_client):
+        locker = admin_client.post("/lockers/", json={"locker_type": "vide"}).json()
+        resp = admin_client.get(f"/lockers/{locker['id']}/inventory")
+        assert resp.json()["entries"] == []
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from src.crud import crud_items
+from src.utils.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.put(("a", 0, ()), b"1234")
+        cache.put(("b", 0, ()), b"1234")
+        cache.get(("a", 0, ()))
+        cache.put(("c", 0, ()), b"1234")
+
+        assert cache.get(("b", 0, ())) is None
+        assert cache.get(("a", 0, ())) == b"1234"
+        assert cache.size == 8
+
+    def test_skips_bodies_larger_than_budget(self):
+        cache = ResponseCache(max_bytes=3)
+        cache.put(("a", 0, ()), b"1234")
+        assert len(cache) == 0
+
+    def test_invalidate_drops_only_given_collections(self):
+        cache = ResponseCache(max_bytes=100)
+        cache.put(("items", 0, (0, 100)), b"[]")
+        cache.put(("lockers", 0, (0, 100)), b"[]")
+        cache.invalidate(("items",))
+        assert cache.get(("items", 0, (0, 100))) is None
+        assert cache.get(("lockers", 0, (0, 100))) == b"[]"
+        assert cache.size == 2
+
+
+def _seed_item(admin_client, reference="C-1"):
+    cat = admin_client.post("/categories/", json={"name": f"Cat {reference}"}).json()
+    admin_client.post(
+        "/items/",
+        json={"name": "Cached", "reference": reference, "category_id": cat["id"]},
+    )
+
+
+def test_repeated_list_calls_skip_the_database(admin_client):
+    _seed_item(admin_client)
+    with patch.object(crud_items, "get_items", wraps=crud_items.get_items) as spy:
+        first = admin_client.get("/items/")
+        second = admin_client.get("/items/")
+
+    assert spy.call_count == 1
+    assert first.content == second.content
+    assert second.headers["content-type"] == "application/json"
+    assert "ETag" in second.headers
+
+
+def test_write_invalidates_cached_list(admin_client):
+    _seed_item(admin_client, "C-2")
+    admin_client.get("/items/")
+    _seed_item(admin_client, "C-3")
+
+    references = [i["reference"] for i in admin_client.get("/items/").json()]
+    assert references == ["C-2", "C-3"]
+
+
+def test_query_params_are_part_of_the_key(admin_client):
+    _seed_item(admin_client, "C-4")
+    _seed_item(admin_client, "C-5")
+    assert len(admin_client.get("/items/", params={"limit": 1}).json()) == 1
+    assert len(admin_client.get("/items/", params={"limit": 2}).json()) == 2
+
+
+def test_cached_body_matches_uncached_serialization(admin_client):
+    _seed_item(admin_client, "C-6")
+    cached = admin_client.get("/items/").json()
+    uncached = admin_client.get("/items/", params={"since": "1970-01-01T00:00:00"})
+    assert cached == uncached.json()
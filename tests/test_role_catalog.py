@@ -0,0 +1,174 @@
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import event
+
+from src.core import role_catalog
+from src.core.keycloak import require_capacity
+from src.core.role_catalog import (
+    RoleCatalog,
+    RoleEntry,
+    get_role_catalog,
+    invalidate_role_catalog,
+)
+from src.crud.crud_role import create_role
+from src.models.role import Role
+
+
+def _entry(name, tier, is_manager=False, is_role_admin=False, capacities=()):
+    return RoleEntry(
+        name=name,
+        label=name.title(),
+        tier=tier,
+        is_system=False,
+        is_manager=is_manager,
+        is_role_admin=is_role_admin,
+        capacities=frozenset(capacities),
+    )
+
+
+CATALOG = RoleCatalog(
+    [
+        _entry("admin", 5, is_manager=True, is_role_admin=True, capacities={"a"}),
+        _entry("codir", 3, is_manager=True, is_role_admin=True, capacities={"b"}),
+        _entry("tresorerie", 3),
+        _entry("membre", 0),
+    ],
+    version=0,
+)
+
+
+class TestCallerProfile:
+    def test_manageable_follows_tiers(self):
+        assert CATALOG.caller(["codir"]).manageable == {"membre"}
+
+    def test_t5_manages_other_t5(self):
+        assert "admin" in CATALOG.caller(["admin"]).manageable
+
+    def test_non_manager_manages_nothing(self):
+        assert CATALOG.caller(["tresorerie"]).manageable == frozenset()
+
+    def test_combines_roles_and_ignores_unknown_ones(self):
+        caller = CATALOG.caller(["codir", "membre", "offline_access"])
+        assert caller.max_tier == 3
+        assert caller.role_admin_names == {"codir"}
+        assert CATALOG.allows(["codir", "membre"], "b")
+        assert not CATALOG.allows(["codir", "membre"], "a")
+
+    def test_unknown_caller_has_no_tier(self):
+        caller = CATALOG.caller(["default-roles-smartlock"])
+        assert caller.max_tier == -1
+        assert not caller.is_role_admin
+
+    def test_capacities_compile_to_one_bit_each(self):
+        assert sorted(CATALOG.capacity_bits.values()) == [1, 2]
+        admin_and_codir = CATALOG.caller(["admin", "codir"]).capacity_mask
+        assert (
+            admin_and_codir == CATALOG.capacity_bits["a"] | CATALOG.capacity_bits["b"]
+        )
+
+    def test_unknown_capacity_is_never_allowed(self):
+        assert not CATALOG.allows(["admin"], "does_not_exist")
+
+    def test_profile_is_memoized_per_role_set(self):
+        assert CATALOG.caller(["admin", "codir"]) is CATALOG.caller(["codir", "admin"])
+
+
+def _count_role_queries(db):
+    queries = []
+
+    def on_execute(conn, cursor, statement, *args):
+        if "FROM roles" in statement:
+            queries.append(statement)
+
+    event.listen(db.get_bind().engine, "before_cursor_execute", on_execute)
+    return queries, lambda: event.remove(
+        db.get_bind().engine, "before_cursor_execute", on_execute
+    )
+
+
+def test_role_checks_reuse_snapshot(admin_client, db):
+    db.add(
+        Role(
+            name="admin",
+            label="Admin",
+            tier=5,
+            is_system=True,
+            is_manager=True,
+            is_role_admin=True,
+            capacities=[],
+        )
+    )
+    db.add(
+        Role(
+            name="membre",
+            label="Membre",
+            tier=0,
+            is_system=True,
+            is_manager=False,
+            is_role_admin=False,
+            capacities=[],
+        )
+    )
+    db.commit()
+
+    queries, stop = _count_role_queries(db)
+    try:
+        with patch("src.routes.roles.add_role_to_user", new_callable=AsyncMock):
+            for _ in range(3):
+                resp = admin_client.post("/users/user-x/roles/membre")
+                assert resp.status_code == 204
+    finally:
+        stop()
+    assert len(queries) == 1
+
+
+def test_role_writes_invalidate_snapshot(db):
+    assert get_role_catalog(db).get("nouveau") is None
+    create_role(
+        db,
+        name="nouveau",
+        label="Nouveau",
+        tier=1,
+        is_manager=False,
+        is_role_admin=False,
+        capacities=[],
+    )
+    assert get_role_catalog(db).get("nouveau") is not None
+
+
+def test_snapshot_loaded_during_a_write_is_not_kept(db):
+    invalidate_role_catalog()
+    original_init = RoleCatalog.__init__
+
+    def racing_init(self, roles, version):
+        original_init(self, roles, version)
+        invalidate_role_catalog()  # a write commits while the load runs
+
+    with patch.object(RoleCatalog, "__init__", racing_init):
+        get_role_catalog(db)
+    assert role_catalog._snapshot is None
+
+
+def test_require_capacity_is_one_dependency_per_capacity():
+    assert require_capacity("audit_log_full") is require_capacity("audit_log_full")
+    assert require_capacity("audit_log_full") is not require_capacity("create_lockers")
+
+
+def test_require_capacity_rejects_caller_without_it(codir_client, db):
+    db.add(
+        Role(
+            name="codir",
+            label="Codir",
+            tier=3,
+            is_system=True,
+            is_manager=True,
+            is_role_admin=True,
+            capacities=["audit_log_full"],
+        )
+    )
+    db.commit()
+    resp = codir_client.put(
+        "/stock/thresholds", json={"item_id": 1, "locker_id": 1, "min_quantity": 1}
+    )
+    assert resp.status_code == 403
+    assert resp.json()["detail"] == "Capacité 'manage_stock_thresholds' requise"
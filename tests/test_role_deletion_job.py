@@ -0,0 +1,147 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.core import keycloak_admin
+from src.models.role import Role
+
+RealAsyncClient = httpx.AsyncClient
+
+
+def _keycloak(handler):
+    """Route the module's AsyncClient instances to an in-process handler."""
+    transport = httpx.MockTransport(handler)
+    return patch.object(
+        keycloak_admin.httpx,
+        "AsyncClient",
+        lambda *args, **kwargs: RealAsyncClient(transport=transport),
+    )
+
+
+@pytest.fixture()
+def admin_token():
+    with patch.object(
+        keycloak_admin, "get_admin_token", new_callable=AsyncMock
+    ) as token:
+        token.return_value = "fake-token"
+        yield token
+
+
+class TestKeycloakBulkHelpers:
+    pytestmark = pytest.mark.anyio
+
+    async def test_pages_through_all_holders_in_waves(self, admin_token):
+        holders = [{"id": f"u{i}"} for i in range(250)]
+        offsets = []
+
+        def handler(request):
+            first = int(request.url.params["first"])
+            size = int(request.url.params["max"])
+            offsets.append(first)
+            return httpx.Response(200, json=holders[first : first + size])
+
+        with _keycloak(handler):
+            users = await keycloak_admin.list_all_users_with_role(
+                "promo", page_size=100, concurrency=2
+            )
+
+        assert [u["id"] for u in users] == [h["id"] for h in holders]
+        assert sorted(offsets) == [0, 100, 200, 300]
+
+    async def test_removes_mappings_with_one_role_lookup(self, admin_token):
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, request.url.path))
+            if request.method == "GET":
+                return httpx.Response(200, json={"id": "r-1", "name": "promo"})
+            user_id = request.url.path.split("/")[-3]
+            return httpx.Response({"gone": 404, "broken": 500}.get(user_id, 204))
+
+        with _keycloak(handler):
+            failed = await keycloak_admin.remove_role_from_users(
+                "promo", ["ok", "gone", "broken"]
+            )
+
+        assert failed == ["broken"]
+        assert sum(method == "GET" for method, _ in calls) == 1
+
+
+def _seed(db):
+    db.add(
+        Role(
+            name="admin",
+            label="Admin",
+            tier=5,
+            is_system=True,
+            is_manager=True,
+            is_role_admin=True,
+            capacities=[],
+        )
+    )
+    db.add(
+        Role(
+            name="promo",
+            label="Promo",
+            tier=1,
+            is_system=False,
+            is_manager=False,
+            is_role_admin=False,
+            capacities=[],
+        )
+    )
+    db.commit()
+
+
+def _cascade_delete(admin_client, db, failed_users=()):
+    holders = [{"id": f"u{i}"} for i in range(3)]
+    with (
+        patch(
+            "src.routes.roles_crud.get_users_with_role",
+            new_callable=AsyncMock,
+            return_value=holders[:1],
+        ),
+        patch(
+            "src.core.role_jobs.list_all_users_with_role",
+            new_callable=AsyncMock,
+            return_value=holders,
+        ),
+        patch(
+            "src.core.role_jobs.remove_role_from_users",
+            new_callable=AsyncMock,
+            return_value=list(failed_users),
+        ),
+        patch(
+            "src.core.role_jobs.delete_realm_role", new_callable=AsyncMock
+        ) as m_delete,
+        patch("src.routes.roles_crud.SessionLocal", lambda: db),
+    ):
+        resp = admin_client.delete("/roles/promo?cascade=true")
+    return resp, m_delete
+
+
+class TestCascadeDeletionJob:
+    def test_returns_job_and_completes_in_background(self, admin_client, db):
+        _seed(db)
+        resp, m_delete = _cascade_delete(admin_client, db)
+
+        assert resp.status_code == 202
+        job = admin_client.get(f"/roles/jobs/{resp.json()['id']}").json()
+        assert job["status"] == "completed"
+        assert (job["total_users"], job["processed_users"]) == (3, 3)
+        m_delete.assert_awaited_once_with("promo")
+        assert db.query(Role).filter(Role.name == "promo").first() is None
+
+    def test_failed_removals_keep_the_role(self, admin_client, db):
+        _seed(db)
+        resp, m_delete = _cascade_delete(admin_client, db, failed_users=["u1"])
+
+        job = admin_client.get(f"/roles/jobs/{resp.json()['id']}").json()
+        assert job["status"] == "failed"
+        assert job["failed_users"] == ["u1"]
+        m_delete.assert_not_awaited()
+        assert db.query(Role).filter(Role.name == "promo").first() is not None
+
+    def test_unknown_job_404(self, admin_client):
+        assert admin_client.get("/roles/jobs/nope").status_code == 404
@@ -0,0 +1,84 @@
+"""
+Tests — génération d'un jeu de données synthétique (scripts/seed.py generate)
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from scripts.seed import Volumes, generate, reset_tables
+from src.database.base import Base
+
+VOLUMES = Volumes(
+    lockers=6, categories=3, items=40, stock=150, access_logs=2000, users=30, days=14
+)
+# Adaptateur datetime par défaut de sqlite3, utilisé par executemany
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+NOW = datetime(2026, 3, 2, 12, tzinfo=timezone.utc)
+
+
+def _dump(engine, sql):
+    with engine.connect() as conn:
+        return conn.execute(text(sql)).all()
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    def make(name):
+        engine = create_engine(f"sqlite:///{tmp_path / name}")
+        Base.metadata.create_all(engine)
+        return engine
+
+    return make
+
+
+def test_generate_creates_requested_volumes(make_engine):
+    engine = make_engine("gen.db")
+    generate(engine, VOLUMES, seed_value=7, batch_size=500, now=NOW)
+
+    counts = {
+        table: _dump(engine, f"SELECT COUNT(*) FROM {table}")[0][0]
+        for table in ("lockers", "categories", "items", "stock", "access_logs")
+    }
+    assert counts == {
+        "lockers": 6,
+        "categories": 3,
+        "items": 40,
+        "stock": 150,
+        "access_logs": 2000,
+    }
+    # Une seule ligne de stock par (item, casier)
+    assert _dump(
+        engine, "SELECT COUNT(*) FROM (SELECT DISTINCT item_id, locker_id FROM stock)"
+    ) == [(150,)]
+    # Pas de passage la nuit, refus minoritaires
+    hours = {
+        int(h)
+        for (h,) in _dump(engine, "SELECT strftime('%H', timestamp) FROM access_logs")
+    }
+    assert not hours & {1, 2, 3, 4, 5, 6}
+    denied = _dump(engine, "SELECT COUNT(*) FROM access_logs WHERE result = 'denied'")
+    assert 0 < denied[0][0] < 1000
+
+
+def test_same_seed_gives_same_dataset(make_engine):
+    first, second = make_engine("a.db"), make_engine("b.db")
+    generate(first, VOLUMES, seed_value=7, batch_size=300, now=NOW)
+    generate(second, VOLUMES, seed_value=7, batch_size=1000, now=NOW)
+
+    for sql in (
+        "SELECT * FROM items ORDER BY id",
+        "SELECT * FROM stock ORDER BY id",
+        "SELECT * FROM access_logs ORDER BY id",
+    ):
+        assert _dump(first, sql) == _dump(second, sql)
+
+
+def test_reset_empties_generated_tables(make_engine):
+    engine = make_engine("gen.db")
+    generate(engine, VOLUMES, seed_value=7, now=NOW)
+    reset_tables(engine)
+    assert _dump(engine, "SELECT COUNT(*) FROM access_logs") == [(0,)]
+    assert _dump(engine, "SELECT COUNT(*) FROM lockers") == [(0,)]
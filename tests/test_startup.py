@@ -0,0 +1,48 @@
+"""
+Tests — import de src.main sans effet de bord
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+PROBE = """
+import json, sys
+import src.main
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test_importing_main_is_side_effect_free(tmp_path):
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "DATABASE_URL": "sqlite://"}
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    modules = set(json.loads(out))
+
+    assert not any(m.startswith("src.routes") for m in modules)
+    assert "src.database.session" not in modules
+    assert "sqlalchemy" not in modules
+    # Le dossier de logs n'est créé que par setup_logger()
+    assert not (tmp_path / "logs").exists()
+
+
+def test_create_app_builds_independent_apps():
+    from src.core.config import Settings
+    from src.main import create_app
+
+    settings = Settings(CORS_ORIGINS=["https://dashboard.example.org"])
+    first, second = create_app(settings), create_app()
+    assert first is not second
+    assert first.state.settings is settings
+    paths = first.openapi()["paths"]
+    assert {"/health", "/health/ready", "/badge/scan"} <= paths.keys()
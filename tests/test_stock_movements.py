@@ -0,0 +1,80 @@
+from src.models.stock import Stock
+from src.models.stock_movement import StockMovement
+
+
+def _seed_stock(admin_client, quantity=5):
+    cat = admin_client.post("/categories/", json={"name": "Mvt"}).json()
+    item = admin_client.post(
+        "/items/", json={"name": "Vis", "reference": "MVT-1", "category_id": cat["id"]}
+    ).json()
+    locker = admin_client.post("/lockers/", json={"locker_type": "mvt"}).json()
+    return admin_client.post(
+        "/stock/",
+        json={"item_id": item["id"], "locker_id": locker["id"], "quantity": quantity},
+    ).json()
+
+
+class TestAdjustStock:
+    def test_decrement_records_movement(self, admin_client, db):
+        stock = _seed_stock(admin_client)
+        resp = admin_client.post(
+            f"/stock/{stock['id']}/adjust", json={"delta": -2, "reason": "emprunt"}
+        )
+        assert resp.status_code == 201
+        body = resp.json()
+        assert body["quantity_after"] == 3
+        assert body["actor"] == "admin-123"
+        assert db.query(Stock).filter(Stock.id == stock["id"]).one().quantity == 3
+
+    def test_cannot_go_negative(self, admin_client, db):
+        stock = _seed_stock(admin_client, quantity=1)
+        resp = admin_client.post(f"/stock/{stock['id']}/adjust", json={"delta": -2})
+        assert resp.status_code == 409
+        assert db.query(StockMovement).count() == 0
+
+    def test_unknown_stock_404(self, admin_client):
+        resp = admin_client.post("/stock/99999/adjust", json={"delta": 1})
+        assert resp.status_code == 404
+
+    def test_zero_delta_rejected(self, admin_client):
+        resp = admin_client.post("/stock/1/adjust", json={"delta": 0})
+        assert resp.status_code == 422
+
+    def test_requires_admin(self, membre_client):
+        resp = membre_client.post("/stock/1/adjust", json={"delta": 1})
+        assert resp.status_code == 403
+
+
+class TestStockMovementsBatch:
+    def test_batch_is_applied_and_listed(self, admin_client):
+        stock = _seed_stock(admin_client)
+        resp = admin_client.post(
+            "/stock/movements",
+            json=[
+                {"stock_id": stock["id"], "delta": 3},
+                {"stock_id": stock["id"], "delta": -1},
+            ],
+        )
+        assert resp.status_code == 201
+        assert [m["quantity_after"] for m in resp.json()] == [8, 7]
+
+        history = admin_client.get(f"/stock/{stock['id']}/movements").json()
+        assert [m["delta"] for m in history] == [-1, 3]
+
+    def test_batch_is_all_or_nothing(self, admin_client, db):
+        stock = _seed_stock(admin_client, quantity=2)
+        resp = admin_client.post(
+            "/stock/movements",
+            json=[
+                {"stock_id": stock["id"], "delta": -1},
+                {"stock_id": stock["id"], "delta": -5},
+            ],
+        )
+        assert resp.status_code == 409
+        assert "Insufficient stock" in resp.json()["detail"]
+        assert db.query(StockMovement).count() == 0
+
+    def test_empty_batch_rejected(self, admin_client, db):
+        resp = admin_client.post("/stock/movements", json=[])
+        assert resp.status_code == 422
+        assert db.query(StockMovement).count() == 0
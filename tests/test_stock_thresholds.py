@@ -0,0 +1,72 @@
+from src.models.role import Role
+
+
+def _seed(admin_client, db, quantity=5):
+    db.add(Role(name="admin", label="Admin", tier=5, is_system=True, is_manager=True,
+                is_role_admin=True, capacities=["manage_stock_thresholds"]))
+    db.commit()
+    cat = admin_client.post("/categories/", json={"name": "Seuils"}).json()
+    item = admin_client.post(
+        "/items/", json={"name": "PLA", "reference": "TH-1", "category_id": cat["id"]}
+    ).json()
+    locker = admin_client.post("/lockers/", json={"locker_type": "th"}).json()
+    stock = admin_client.post(
+        "/stock/",
+        json={"item_id": item["id"], "locker_id": locker["id"], "quantity": quantity},
+    ).json()
+    return item["id"], locker["id"], stock["id"]
+
+
+def _set_threshold(client, item_id, locker_id, min_quantity):
+    return client.put(
+        "/stock/thresholds",
+        json={"item_id": item_id, "locker_id": locker_id, "min_quantity": min_quantity},
+    )
+
+
+class TestStockThresholds:
+    def test_threshold_above_quantity_raises_alert(self, admin_client, db):
+        item_id, locker_id, stock_id = _seed(admin_client, db, quantity=2)
+        assert _set_threshold(admin_client, item_id, locker_id, 3).status_code == 200
+
+        alerts = admin_client.get("/stock/alerts").json()
+        assert len(alerts) == 1
+        assert alerts[0]["stock_id"] == stock_id
+        assert (alerts[0]["quantity"], alerts[0]["min_quantity"]) == (2, 3)
+
+    def test_stock_changes_update_alerts(self, admin_client, db):
+        item_id, locker_id, stock_id = _seed(admin_client, db, quantity=5)
+        _set_threshold(admin_client, item_id, locker_id, 3)
+        assert admin_client.get("/stock/alerts").json() == []
+
+        admin_client.post(f"/stock/{stock_id}/adjust", json={"delta": -3})
+        assert admin_client.get("/stock/alerts").json()[0]["quantity"] == 2
+
+        admin_client.put(f"/stock/{stock_id}", json={"quantity": 10})
+        assert admin_client.get("/stock/alerts").json() == []
+
+    def test_deleted_stock_counts_as_empty(self, admin_client, db):
+        item_id, locker_id, stock_id = _seed(admin_client, db, quantity=5)
+        _set_threshold(admin_client, item_id, locker_id, 1)
+        admin_client.delete(f"/stock/{stock_id}")
+
+        alerts = admin_client.get(f"/stock/alerts?locker_id={locker_id}").json()
+        assert alerts[0]["stock_id"] is None
+        assert alerts[0]["quantity"] == 0
+
+    def test_deleting_threshold_clears_alert(self, admin_client, db):
+        item_id, locker_id, _ = _seed(admin_client, db, quantity=0)
+        threshold = _set_threshold(admin_client, item_id, locker_id, 2).json()
+        assert len(admin_client.get("/stock/alerts").json()) == 1
+
+        resp = admin_client.delete(f"/stock/thresholds/{threshold['id']}")
+        assert resp.status_code == 200
+        assert admin_client.get("/stock/alerts").json() == []
+
+    def test_requires_capacity(self, codir_client, db):
+        db.add(Role(name="codir", label="Codir", tier=3, is_system=True,
+                    is_manager=True, is_role_admin=True,
+                    capacities=["audit_log_full"]))
+        db.commit()
+        resp = _set_threshold(codir_client, 1, 1, 1)
+        assert resp.status_code == 403
@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.core import keycloak_admin
+
+RealAsyncClient = httpx.AsyncClient
+
+
+def _keycloak(handler):
+    transport = httpx.MockTransport(handler)
+    return patch.object(
+        keycloak_admin.httpx,
+        "AsyncClient",
+        lambda *a, **kw: RealAsyncClient(transport=transport),
+    )
+
+
+@pytest.fixture()
+def admin_token():
+    with patch.object(keycloak_admin, "get_admin_token", new_callable=AsyncMock):
+        yield
+
+
+@pytest.fixture()
+def user_cache():
+    with patch.dict(keycloak_admin._user_cache, clear=True):
+        yield keycloak_admin._user_cache
+
+
+class TestGetUsersByIds:
+    pytestmark = pytest.mark.anyio
+
+    async def test_serves_cache_and_fetches_misses(self, admin_token, user_cache):
+        keycloak_admin._cache_user({"id": "cached", "username": "alice"})
+        requested = []
+
+        def handler(request):
+            user_id = request.url.path.rsplit("/", 1)[-1]
+            requested.append(user_id)
+            if user_id == "ghost":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"id": user_id, "username": "bob"})
+
+        with _keycloak(handler):
+            users = await keycloak_admin.get_users_by_ids(
+                ["cached", "u1", "ghost", "u1"]
+            )
+
+        assert users == {
+            "cached": {"id": "cached", "username": "alice"},
+            "u1": {"id": "u1", "username": "bob"},
+            "ghost": None,
+        }
+        assert sorted(requested) == ["ghost", "u1"]
+        assert "u1" in user_cache and "ghost" not in user_cache
+
+    async def test_concurrency_is_capped(self, admin_token, user_cache):
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"id": request.url.path[-3:]})
+
+        with _keycloak(handler):
+            users = await keycloak_admin.get_users_by_ids(
+                [f"u{i:02d}" for i in range(20)], concurrency=4
+            )
+
+        assert len(users) == 20
+        assert peak == 4
+
+    async def test_expired_entries_are_refetched(self, admin_token, user_cache):
+        keycloak_admin._cache_user({"id": "u1", "username": "old"})
+        user_cache["u1"] = (0.0, user_cache["u1"][1])
+
+        def handler(request):
+            return httpx.Response(200, json={"id": "u1", "username": "new"})
+
+        with _keycloak(handler):
+            users = await keycloak_admin.get_users_by_ids(["u1"])
+
+        assert users["u1"]["username"] == "new"
+
+
+class TestLookupRoute:
+    def test_returns_map(self, admin_client):
+        found = {"u1": {"id": "u1"}, "ghost": None}
+        with patch(
+            "src.routes.users.get_users_by_ids", new_callable=AsyncMock
+        ) as m_lookup:
+            m_lookup.return_value = found
+            resp = admin_client.post("/users/lookup", json={"ids": ["u1", "ghost"]})
+
+        assert resp.status_code == 200
+        assert resp.json() == found
+        m_lookup.assert_awaited_once_with(["u1", "ghost"])
+
+    def test_empty_ids_rejected(self, admin_client):
+        assert admin_client.post("/users/lookup", json={"ids": []}).status_code == 422
+
+    @pytest.mark.parametrize("user_id", ["../groups", "u1/role-mappings", "a.b"])
+    def test_rejects_ids_outside_keycloak_ids(self, admin_client, user_id):
+        with patch(
+            "src.routes.users.get_users_by_ids", new_callable=AsyncMock
+        ) as m_lookup:
+            resp = admin_client.post("/users/lookup", json={"ids": ["u1", user_id]})
+        assert resp.status_code == 422
+        m_lookup.assert_not_awaited()
+
+    def test_requires_admin(self, membre_client):
+        resp = membre_client.post("/users/lookup", json={"ids": ["u1"]})
+        assert resp.status_code == 403
@@ -0,0 +1,102 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.core import keycloak_admin
+
+RealAsyncClient = httpx.AsyncClient
+
+USERS = [
+    {
+        "id": f"u{i}",
+        "username": f"user{i}",
+        "enabled": i % 2 == 0,
+        "attributes": {"card_id": [f"CARD{i}"]} if i != 2 else {},
+    }
+    for i in range(5)
+]
+
+
+def _pages(*pages, error=None):
+    async def iter_user_pages(search=None, brief=False):
+        if error is not None:
+            raise error
+        for page in pages:
+            yield page
+
+    return patch("src.routes.users.iter_user_pages", side_effect=iter_user_pages)
+
+
+class TestStreamUsersRoute:
+    def test_streams_every_page_as_ndjson(self, admin_client):
+        with _pages(USERS[:3], USERS[3:]) as m_iter:
+            resp = admin_client.get("/users/stream?search=user")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert lines == USERS
+        m_iter.assert_called_once_with(search="user", brief=False)
+
+    def test_projection(self, admin_client):
+        with _pages(USERS[:3]) as m_iter:
+            resp = admin_client.get("/users/stream?fields=id,card_id")
+
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert lines == [
+            {"id": "u0", "card_id": "CARD0"},
+            {"id": "u1", "card_id": "CARD1"},
+            {"id": "u2", "card_id": None},
+        ]
+        m_iter.assert_called_once_with(search=None, brief=False)
+
+    def test_projection_without_attributes_uses_brief_listing(self, admin_client):
+        with _pages(USERS[:1]) as m_iter:
+            resp = admin_client.get("/users/stream?fields=username,enabled")
+
+        assert resp.text == '{"username":"user0","enabled":true}\n'
+        m_iter.assert_called_once_with(search=None, brief=True)
+
+    def test_unknown_field_400(self, admin_client):
+        with _pages(USERS):
+            resp = admin_client.get("/users/stream?fields=id,password")
+        assert resp.status_code == 400
+
+    def test_keycloak_error_before_streaming(self, admin_client):
+        error = HTTPException(status_code=503, detail="Keycloak injoignable")
+        with _pages(error=error):
+            resp = admin_client.get("/users/stream")
+        assert resp.status_code == 503
+
+    def test_requires_admin(self, membre_client):
+        assert membre_client.get("/users/stream").status_code == 403
+
+
+class TestIterUserPages:
+    pytestmark = pytest.mark.anyio
+
+    async def test_prefetches_until_short_page(self):
+        requested = []
+
+        def handler(request):
+            first = int(request.url.params["first"])
+            size = int(request.url.params["max"])
+            requested.append(first)
+            return httpx.Response(200, json=USERS[first : first + size])
+
+        transport = httpx.MockTransport(handler)
+        with (
+            patch.object(keycloak_admin, "get_admin_token", new_callable=AsyncMock),
+            patch.object(
+                keycloak_admin.httpx,
+                "AsyncClient",
+                lambda *a, **kw: RealAsyncClient(transport=transport),
+            ),
+        ):
+            pages = [page async for page in keycloak_admin.iter_user_pages(page_size=2)]
+
+        assert pages == [USERS[0:2], USERS[2:4], USERS[4:]]
+        assert requested == [0, 2, 4]
@@ -0,0 +1,116 @@
+"""
+Tests — warm-up au démarrage, cache JWKS et /health/ready
+"""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from src.core import keycloak
+from src.core.keycloak import _jwks_cache, get_jwks, validate_jwt
+from src.core.warmup import WarmupState, run_warmup
+from tests.conftest import TestingSessionLocal, engine
+
+JWKS = {"keys": [{"kid": "k1", "kty": "RSA"}]}
+
+
+def _jwks_server(calls):
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json=JWKS)
+
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    return patch(
+        "src.core.keycloak.httpx.AsyncClient",
+        lambda *a, **kw: real_client(transport=transport),
+    )
+
+
+@pytest.fixture
+def state(monkeypatch):
+    state = WarmupState()
+    monkeypatch.setattr("src.core.warmup.warmup_state", state)
+    monkeypatch.setattr("src.routes.system.warmup_state", state)
+    return state
+
+
+@pytest.fixture(autouse=True)
+def _reset_jwks():
+    yield
+    _jwks_cache.update(jwks=None, fetched_at=0.0)
+
+
+@pytest.mark.anyio
+async def test_run_warmup_reports_each_step(state, db):
+    with (
+        patch("src.core.warmup.get_jwks", new_callable=AsyncMock),
+        patch("src.core.warmup.get_admin_token", new_callable=AsyncMock),
+        patch(
+            "src.core.warmup.warm_realm_role_cache",
+            new_callable=AsyncMock,
+            side_effect=HTTPException(503, detail="Keycloak injoignable"),
+        ),
+    ):
+        await run_warmup(engine, TestingSessionLocal)
+
+    assert state.ready is True
+    assert state.steps == {
+        "jwks": "ok",
+        "admin_token": "ok",
+        "realm_roles": "Keycloak injoignable",
+        "db_pool": "ok",
+        "mappers": "ok",
+        "role_catalog": "ok",
+    }
+    assert state.duration_ms is not None
+
+
+def test_ready_is_503_until_warmup_done(state, client):
+    # Warm-up désactivé dans les tests : le lifespan a déjà marqué prêt
+    state.ready = False
+    resp = client.get("/health/ready")
+    assert resp.status_code == 503
+    assert resp.json()["ready"] is False
+    assert client.get("/health").json()["ready"] is False
+
+    state.ready = True
+    state.steps["jwks"] = "ok"
+    resp = client.get("/health/ready")
+    assert resp.status_code == 200
+    assert resp.json()["warmup"] == {"jwks": "ok"}
+    body = client.get("/health").json()
+    assert body["live"] is True and body["ready"] is True
+
+
+@pytest.mark.anyio
+async def test_jwks_is_cached():
+    calls = []
+    with _jwks_server(calls):
+        assert await get_jwks() == JWKS
+        assert await get_jwks() == JWKS
+        # Rechargement forcé trop rapproché : le cache est conservé
+        await get_jwks(refresh=True)
+    assert len(calls) == 1
+    assert keycloak.jwks_age() is not None
+
+
+@pytest.mark.anyio
+async def test_unknown_kid_refreshes_jwks():
+    _jwks_cache.update(
+        jwks={"keys": [{"kid": "old"}]}, fetched_at=time.monotonic() - 60
+    )
+    token = jwt.encode({"sub": "x"}, "secret", algorithm="HS256", headers={"kid": "k1"})
+    calls = []
+    with _jwks_server(calls), pytest.raises(HTTPException) as exc:
+        await validate_jwt(
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+    assert exc.value.status_code == 401
+    assert len(calls) == 1
+    assert _jwks_cache["jwks"] == JWKS